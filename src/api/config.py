@@ -163,6 +163,11 @@ class APISettings(BaseSettings):
         default=True,
         description="Abstract sensitive content in logs"
     )
+    log_max_body_bytes: int = Field(
+        default=4096,
+        ge=0,
+        description="Maximum request body bytes read for log previews"
+    )
     
     # Performance Configuration
     max_page_size: int = Field(
@@ -16,7 +16,14 @@ from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from ..core.abstraction.concrete_engine import ConcreteAbstractionEngine
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    uvloop = None
+
+from ..core.abstraction.concrete_engine import get_engine
 from ..core.validation.validator import SafetyValidator
 from .config import get_settings
 from .dependencies import (
@@ -29,6 +36,7 @@ from .middleware import (
     LoggingMiddleware,
     RateLimitMiddleware,
     SafetyMiddleware,
+    stop_rate_limit_cleanup,
 )
 
 logger = logging.getLogger(__name__)
@@ -44,7 +52,7 @@ async def lifespan(app: FastAPI):
     await get_db_pool()
     
     # Initialize core services
-    abstraction_engine = ConcreteAbstractionEngine()
+    abstraction_engine = get_engine()
     safety_validator = await get_safety_validator()
     
     # Store in app state for middleware
@@ -58,6 +66,9 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down CoachNTT.ai API")
     
+    # Stop background rate limit bucket cleanup
+    await stop_rate_limit_cleanup()
+    
     # Close database connections
     await close_db_pool()
     
@@ -88,8 +99,9 @@ def create_application() -> FastAPI:
         allow_headers=list(settings.cors_allowed_headers),
     )
     
-    # Add compression middleware
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    # Add compression middleware; level 5 compresses large text exports
+    # nearly as well as the default 9 at a fraction of the CPU cost
+    app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
     
     # Add custom middleware in reverse order (last added is first executed)
     app.add_middleware(RateLimitMiddleware)
@@ -217,4 +229,22 @@ def get_application() -> FastAPI:
 
 
 # Create application instance
-app = get_application()
\ No newline at end of file
+app = get_application()
+
+
+def run() -> None:
+    """Run the API server, using the uvloop event loop when available."""
+    import uvicorn
+    
+    settings = get_settings()
+    uvicorn.run(
+        "src.api.main:app",
+        host=settings.host,
+        port=settings.port,
+        reload=settings.reload,
+        loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+    )
+
+
+if __name__ == "__main__":
+    run()
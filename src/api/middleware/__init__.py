@@ -5,14 +5,17 @@ This module provides middleware for safety validation, authentication,
 rate limiting, and logging with automatic content abstraction.
 """
 
-from .authentication import AuthenticationMiddleware
+from .authentication import AuthenticationMiddleware, AuthUser
 from .logging import LoggingMiddleware
-from .rate_limiting import RateLimitMiddleware
-from .safety import SafetyMiddleware
+from .rate_limiting import RateLimitMiddleware, stop_rate_limit_cleanup
+from .safety import SKIP_SAFETY_VALIDATION_HEADER, SafetyMiddleware
 
 __all__ = [
     "AuthenticationMiddleware",
+    "AuthUser",
     "LoggingMiddleware",
     "RateLimitMiddleware",
     "SafetyMiddleware",
+    "SKIP_SAFETY_VALIDATION_HEADER",
+    "stop_rate_limit_cleanup",
 ]
\ No newline at end of file
@@ -6,17 +6,53 @@ and automatic token refresh capabilities.
 """
 
 import logging
-from typing import Optional, Set
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Set, Tuple
 
 from fastapi import Request, Response
 from jose import JWTError, jwt
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
 
 from ..config import get_settings
+from .. import serialization
 
 logger = logging.getLogger(__name__)
 
+# Static error bodies are serialized once at import time
+_AUTH_REQUIRED_BODY = serialization.dumps_bytes({
+    "detail": "Authentication required",
+    "error_code": "AUTH_REQUIRED"
+})
+_USER_INACTIVE_BODY = serialization.dumps_bytes({
+    "detail": "User account is inactive",
+    "error_code": "USER_INACTIVE"
+})
+_INVALID_TOKEN_BODY = serialization.dumps_bytes({
+    "detail": "Invalid or expired token",
+    "error_code": "INVALID_TOKEN"
+})
+_AUTH_ERROR_BODY = serialization.dumps_bytes({
+    "detail": "Authentication error",
+    "error_code": "AUTH_ERROR"
+})
+
+
+@dataclass(slots=True, frozen=True)
+class AuthUser:
+    """Authenticated user attached to ``request.state.user``."""
+    
+    user_id: Optional[str]
+    email: Optional[str]
+    permissions: Tuple[str, ...]
+    is_active: bool
+
+
+def _error_response(body: bytes, status_code: int) -> Response:
+    """Build an error response from a pre-serialized JSON body."""
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
 
 class AuthenticationMiddleware(BaseHTTPMiddleware):
     """Middleware for JWT authentication with multiple token sources."""
@@ -48,6 +84,14 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             "cookie",  # auth_token cookie
             "query",   # ?token=<token>
         }
+        
+        # Fraction of token lifetime below which a refresh is issued
+        self._refresh_threshold = 0.5
+        
+        # Refreshed tokens keyed by (source token, issue second) so repeat
+        # requests within the same second reuse the signed header value
+        self._refresh_cache: "OrderedDict[Tuple[str, int], bytes]" = OrderedDict()
+        self._refresh_cache_size = 1024
     
     async def dispatch(self, request: Request, call_next):
         """Process request through authentication."""
@@ -63,13 +107,7 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
         token = await self._extract_token(request)
         
         if not token:
-            return JSONResponse(
-                status_code=401,
-                content={
-                    "detail": "Authentication required",
-                    "error_code": "AUTH_REQUIRED"
-                }
-            )
+            return _error_response(_AUTH_REQUIRED_BODY, 401)
         
         # Verify token
         try:
@@ -80,51 +118,35 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             )
             
             # Add user info to request state
-            request.state.user = {
-                "user_id": payload.get("sub"),
-                "email": payload.get("email"),
-                "permissions": payload.get("permissions", []),
-                "is_active": payload.get("is_active", True),
-            }
+            user = AuthUser(
+                user_id=payload.get("sub"),
+                email=payload.get("email"),
+                permissions=tuple(payload.get("permissions", ())),
+                is_active=payload.get("is_active", True),
+            )
+            request.state.user = user
             
             # Check if user is active
-            if not request.state.user["is_active"]:
-                return JSONResponse(
-                    status_code=403,
-                    content={
-                        "detail": "User account is inactive",
-                        "error_code": "USER_INACTIVE"
-                    }
-                )
+            if not user.is_active:
+                return _error_response(_USER_INACTIVE_BODY, 403)
             
             # Process request
             response = await call_next(request)
             
             # Optionally refresh token if close to expiration
-            if self._should_refresh_token(payload):
-                new_token = self._create_refresh_token(payload)
-                response.headers["X-Auth-Token-Refresh"] = new_token
+            now = time.time()
+            if self._should_refresh_token(payload, now):
+                new_token = self._create_refresh_token(token, payload, now)
+                response.raw_headers.append((b"x-auth-token-refresh", new_token))
             
             return response
             
         except JWTError as e:
             logger.warning(f"JWT verification failed: {str(e)}")
-            return JSONResponse(
-                status_code=401,
-                content={
-                    "detail": "Invalid or expired token",
-                    "error_code": "INVALID_TOKEN"
-                }
-            )
+            return _error_response(_INVALID_TOKEN_BODY, 401)
         except Exception as e:
             logger.error(f"Authentication error: {str(e)}")
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "detail": "Authentication error",
-                    "error_code": "AUTH_ERROR"
-                }
-            )
+            return _error_response(_AUTH_ERROR_BODY, 500)
     
     def _is_public_path(self, path: str) -> bool:
         """Check if path is public."""
@@ -143,13 +165,16 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
         """Extract token from various sources."""
         token = None
         
-        # Try header first (Authorization: Bearer <token>)
+        # Try header first (Authorization: Bearer <token>), scanning the raw
+        # ASGI header list rather than building a Headers wrapper
         if "header" in self.token_sources:
-            auth_header = request.headers.get("Authorization")
-            if auth_header and auth_header.startswith("Bearer "):
-                token = auth_header.split(" ")[1]
-                if token:
-                    return token
+            for key, value in request.scope["headers"]:
+                if key == b"authorization":
+                    if value[:7].lower() == b"bearer ":
+                        token = value[7:].strip().decode("latin-1")
+                        if token:
+                            return token
+                    break
         
         # Try cookie
         if "cookie" in self.token_sources:
@@ -165,41 +190,48 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
         
         return None
     
-    def _should_refresh_token(self, payload: dict) -> bool:
+    def _should_refresh_token(self, payload: dict, now: float) -> bool:
         """Check if token should be refreshed."""
         # Don't refresh if no expiration
         if "exp" not in payload:
             return False
         
-        # Refresh if less than 50% of lifetime remaining
-        from datetime import datetime
-        
+        # Refresh if less than the threshold of lifetime remaining
         exp_timestamp = payload["exp"]
         iat_timestamp = payload.get("iat", 0)
         
         if iat_timestamp == 0:
             return False
         
-        current_timestamp = datetime.utcnow().timestamp()
         total_lifetime = exp_timestamp - iat_timestamp
-        remaining_lifetime = exp_timestamp - current_timestamp
+        remaining_lifetime = exp_timestamp - now
         
-        return remaining_lifetime < (total_lifetime * 0.5)
+        return remaining_lifetime < (total_lifetime * self._refresh_threshold)
     
-    def _create_refresh_token(self, old_payload: dict) -> str:
-        """Create a refreshed token with updated expiration."""
-        from datetime import datetime, timedelta
+    def _create_refresh_token(self, token: str, old_payload: dict, now: float) -> bytes:
+        """Create a refreshed token with updated expiration, encoded for the header."""
+        issued_at = int(now)
+        cache_key = (token, issued_at)
+        
+        cached = self._refresh_cache.get(cache_key)
+        if cached is not None:
+            self._refresh_cache.move_to_end(cache_key)
+            return cached
         
         # Copy payload and update expiration
         new_payload = old_payload.copy()
-        new_payload["exp"] = datetime.utcnow() + timedelta(
-            minutes=self.settings.jwt_expiration_minutes
-        )
-        new_payload["iat"] = datetime.utcnow()
+        new_payload["iat"] = issued_at
+        new_payload["exp"] = issued_at + self.settings.jwt_expiration_minutes * 60
         
         # Encode new token
-        return jwt.encode(
+        new_token = jwt.encode(
             new_payload,
             self.settings.jwt_secret_key.get_secret_value(),
             algorithm=self.settings.jwt_algorithm
-        )
\ No newline at end of file
+        ).encode("ascii")
+        
+        self._refresh_cache[cache_key] = new_token
+        if len(self._refresh_cache) > self._refresh_cache_size:
+            self._refresh_cache.popitem(last=False)
+        
+        return new_token
@@ -5,20 +5,47 @@ This middleware logs all requests and responses while ensuring sensitive
 information is automatically abstracted for safety.
 """
 
-import json
+import ipaddress
 import logging
 import time
 import uuid
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import Message
 
 from ...core.abstraction.concrete_engine import ConcreteAbstractionEngine
 from ..config import get_settings
+from .. import serialization
 
 logger = logging.getLogger(__name__)
 
+# Separator for batching values through the abstraction engine
+_VALUE_SEPARATOR = "\x1f"
+
+_IP_SUFFIX = ".***.***"
+_IPV6_SUFFIX = ":****:****:****:****:****"
+
+
+@lru_cache(maxsize=4096)
+def _abstract_ip_address(ip: str) -> str:
+    """
+    Abstract an IP address, keeping only its coarse network prefix.
+    
+    IPv4 addresses keep the first two octets; IPv6 addresses keep the
+    first 48 bits (routing prefix) and mask the remaining 80.
+    """
+    try:
+        address = ipaddress.ip_address(ip)
+    except ValueError:
+        return "***REDACTED***"
+    
+    if address.version == 4:
+        return ip[:ip.rfind(".", 0, ip.rfind("."))] + _IP_SUFFIX
+    return address.exploded[:14] + _IPV6_SUFFIX
+
 
 class LoggingMiddleware(BaseHTTPMiddleware):
     """Middleware for comprehensive request/response logging with abstraction."""
@@ -28,6 +55,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         self.settings = get_settings()
         self.abstraction_engine = abstraction_engine
         self.abstract_logs = self.settings.log_abstract_content
+        self.max_body_log = self.settings.log_max_body_bytes
         
         # Paths to exclude from detailed logging
         self.excluded_paths = {
@@ -39,23 +67,24 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         }
         
         # Headers to always exclude from logs
-        self.excluded_headers = {
+        self.excluded_headers = frozenset({
             "authorization",
             "cookie",
             "x-api-key",
             "x-auth-token",
-        }
+        })
     
     async def dispatch(self, request: Request, call_next):
         """Process request with comprehensive logging."""
-        # Generate request ID for correlation
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
-        
-        # Skip detailed logging for excluded paths
-        if request.url.path in self.excluded_paths:
+        # Skip excluded paths before any per-request work
+        if request.scope["path"] in self.excluded_paths:
             return await call_next(request)
         
+        # Generate request ID for correlation; writing the raw scope state
+        # keeps it visible to the outermost error handlers
+        request_id = str(uuid.uuid4())
+        request.scope.setdefault("state", {})["request_id"] = request_id
+        
         # Start timing
         start_time = time.time()
         
@@ -72,7 +101,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         await self._log_response(response, request_id, duration_ms)
         
         # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
+        response.raw_headers.append((b"x-request-id", request_id.encode("ascii")))
         
         return response
     
@@ -83,15 +112,15 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             log_entry = {
                 "request_id": request_id,
                 "method": request.method,
-                "path": request.url.path,
+                "path": request.scope["path"],
                 "query_params": self._abstract_dict(dict(request.query_params)),
                 "client_host": self._abstract_ip(request.client.host) if request.client else None,
-                "headers": self._filter_headers(dict(request.headers)),
             }
             
             # Add user info if authenticated
-            if hasattr(request.state, "user"):
-                log_entry["user_id"] = request.state.user.get("user_id")
+            user = getattr(request.state, "user", None)
+            if user is not None:
+                log_entry["user_id"] = user.user_id
             
             # Log request body for certain methods
             if request.method in ["POST", "PUT", "PATCH"]:
@@ -99,15 +128,17 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 if body:
                     log_entry["body_preview"] = self._abstract_body(body)
             
-            # Log based on format setting
+            # Log based on format setting; headers are only emitted
+            # (and therefore only filtered) for structured logs
             if self.settings.log_format == "json":
-                logger.info(json.dumps({
+                logger.info(serialization.dumps({
                     "event": "api_request",
-                    **log_entry
+                    **log_entry,
+                    "headers": self._filter_headers(request.headers),
                 }))
             else:
                 logger.info(
-                    f"API Request: {request.method} {request.url.path} "
+                    f"API Request: {request.method} {request.scope['path']} "
                     f"[{request_id}] from {log_entry['client_host']}"
                 )
                 
@@ -122,7 +153,6 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 "request_id": request_id,
                 "status_code": response.status_code,
                 "duration_ms": round(duration_ms, 2),
-                "headers": self._filter_headers(dict(response.headers)),
             }
             
             # Add response size if available
@@ -131,9 +161,10 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             
             # Log based on format setting
             if self.settings.log_format == "json":
-                logger.info(json.dumps({
+                logger.info(serialization.dumps({
                     "event": "api_response",
-                    **log_entry
+                    **log_entry,
+                    "headers": self._filter_headers(response.headers),
                 }))
             else:
                 logger.info(
@@ -144,53 +175,93 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         except Exception as e:
             logger.error(f"Error logging response: {str(e)}")
     
-    async def _get_request_body(self, request: Request) -> Optional[Dict[str, Any]]:
-        """Extract request body for logging."""
+    async def _get_request_body(self, request: Request) -> Optional[Any]:
+        """
+        Extract a request body preview for logging.
+        
+        Reads at most ``max_body_log`` bytes from the ASGI receive channel and
+        replays the consumed messages so downstream handlers still see the
+        full body. Truncated bodies are returned as text rather than parsed.
+        """
         try:
-            if not hasattr(request, "_body"):
-                request._body = await request.body()
+            body = getattr(request, "_body", None)
+            truncated = False
             
-            if request._body:
-                return json.loads(request._body)
-            return None
+            if body is None:
+                receive = request._receive
+                buffered: List[Message] = []
+                prefix = bytearray()
+                more_body = True
+                
+                while more_body and len(prefix) <= self.max_body_log:
+                    message = await receive()
+                    buffered.append(message)
+                    if message["type"] != "http.request":
+                        break
+                    prefix += message.get("body", b"")
+                    more_body = message.get("more_body", False)
+                
+                if more_body:
+                    # Replay what was consumed, then hand over to the original
+                    # channel for the remainder of the body
+                    async def replay_receive() -> Message:
+                        if buffered:
+                            return buffered.pop(0)
+                        return await receive()
+                    
+                    request._receive = replay_receive
+                else:
+                    # Fully read: downstream receives the cached body
+                    request._body = bytes(prefix)
+                
+                truncated = more_body or len(prefix) > self.max_body_log
+                body = bytes(prefix[:self.max_body_log])
+            
+            if not body:
+                return None
+            if truncated:
+                return body.decode("utf-8", errors="replace")
+            return serialization.loads(body)
             
         except Exception:
             return None
     
-    def _filter_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
+    def _filter_headers(self, headers: Mapping[str, str]) -> Dict[str, str]:
         """Filter sensitive headers."""
-        filtered = {}
-        for key, value in headers.items():
-            key_lower = key.lower()
-            if key_lower in self.excluded_headers:
-                filtered[key] = "***REDACTED***"
-            else:
-                filtered[key] = value
-        return filtered
+        excluded = self.excluded_headers
+        return {
+            key: ("***REDACTED***" if key.lower() in excluded else value)
+            for key, value in headers.items()
+        }
     
     def _abstract_ip(self, ip: str) -> str:
         """Abstract IP address for privacy."""
         if not self.abstract_logs or not ip:
             return ip
-        
-        # Keep first two octets for general location
-        parts = ip.split(".")
-        if len(parts) == 4:
-            return f"{parts[0]}.{parts[1]}.***.***"
-        return "***REDACTED***"
+        return _abstract_ip_address(ip)
     
     def _abstract_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Abstract dictionary values."""
-        if not self.abstract_logs or not self.abstraction_engine:
+        """Abstract dictionary values with a single engine call."""
+        if not self.abstract_logs or not self.abstraction_engine or not data:
             return data
         
-        abstracted = {}
-        for key, value in data.items():
-            if isinstance(value, str):
-                result = self.abstraction_engine.abstract(value)
-                abstracted[key] = result.abstracted_content
-            else:
-                abstracted[key] = value
+        keys = [key for key, value in data.items() if isinstance(value, str)]
+        if not keys:
+            return data
+        
+        # Join all string values with a unit separator and abstract them in
+        # one pass, then split the result back into per-key values
+        joined = _VALUE_SEPARATOR.join(data[key] for key in keys)
+        result = self.abstraction_engine.abstract(joined)
+        values = result.abstracted_content.split(_VALUE_SEPARATOR)
+        
+        abstracted = dict(data)
+        if len(values) == len(keys):
+            abstracted.update(zip(keys, values))
+        else:
+            # The engine rewrote across a separator; fall back to per-value
+            for key in keys:
+                abstracted[key] = self.abstraction_engine.abstract(data[key]).abstracted_content
         
         return abstracted
     
@@ -201,7 +272,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 return "empty"
             
             # Convert to string
-            body_str = json.dumps(body) if not isinstance(body, str) else body
+            body_str = serialization.dumps(body) if not isinstance(body, str) else body
             
             # Truncate if too long
             if len(body_str) > max_length:
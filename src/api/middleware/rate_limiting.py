@@ -8,17 +8,27 @@ fair usage across all clients.
 import asyncio
 import logging
 import time
+import weakref
 from collections import defaultdict
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Set, Tuple
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
 
 from ..config import get_settings
+from .. import serialization
 
 logger = logging.getLogger(__name__)
 
+# Static error body is serialized once at import time; headers still vary
+_RATE_LIMIT_EXCEEDED_BODY = serialization.dumps_bytes({
+    "detail": "Rate limit exceeded",
+    "error_code": "RATE_LIMIT_EXCEEDED"
+})
+
+# Live middleware instances, so application shutdown can stop their sweep tasks
+_active_middlewares: "weakref.WeakSet[RateLimitMiddleware]" = weakref.WeakSet()
+
 
 class TokenBucket:
     """Token bucket implementation for rate limiting."""
@@ -104,9 +114,11 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             lambda: TokenBucket(self.burst_size, self.refill_rate)
         )
         
-        # Cleanup task for old buckets
+        # Background cleanup of old buckets (started on first request)
         self.cleanup_interval = 300  # 5 minutes
         self.last_cleanup = time.time()
+        self._cleanup_candidates: Set[str] = set()
+        self._cleanup_task: Optional[asyncio.Task] = None
         
         # Paths excluded from rate limiting
         self.excluded_paths = {
@@ -116,16 +128,19 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             "/redoc",
             "/openapi.json",
         }
+        
+        _active_middlewares.add(self)
     
     async def dispatch(self, request: Request, call_next):
         """Process request with rate limiting."""
-        # Skip if rate limiting is disabled
-        if not self.enabled:
+        # Skip if rate limiting is disabled or the path is excluded
+        if not self.enabled or request.scope["path"] in self.excluded_paths:
             return await call_next(request)
         
-        # Skip rate limiting for excluded paths
-        if request.url.path in self.excluded_paths:
-            return await call_next(request)
+        # Start periodic bucket cleanup once an event loop is serving requests,
+        # restarting it if a previous loop finished or cancelled it
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
         
         # Get client identifier
         client_id = self._get_client_id(request)
@@ -140,12 +155,10 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             # Get bucket status for headers
             tokens_available, seconds_until_next = await bucket.get_status()
             
-            return JSONResponse(
+            return Response(
+                content=_RATE_LIMIT_EXCEEDED_BODY,
                 status_code=429,
-                content={
-                    "detail": "Rate limit exceeded",
-                    "error_code": "RATE_LIMIT_EXCEEDED"
-                },
+                media_type="application/json",
                 headers={
                     "X-RateLimit-Limit": str(self.requests_per_minute),
                     "X-RateLimit-Remaining": str(int(tokens_available)),
@@ -162,16 +175,14 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         response.headers["X-RateLimit-Limit"] = str(self.requests_per_minute)
         response.headers["X-RateLimit-Remaining"] = str(int(tokens_available))
         
-        # Periodic cleanup of old buckets
-        await self._cleanup_old_buckets()
-        
         return response
     
     def _get_client_id(self, request: Request) -> str:
         """Get unique identifier for client."""
         # Try authenticated user ID first
-        if hasattr(request.state, "user") and request.state.user:
-            user_id = request.state.user.get("user_id")
+        user = getattr(request.state, "user", None)
+        if user is not None:
+            user_id = user.user_id
             if user_id:
                 return f"user:{user_id}"
         
@@ -182,25 +193,65 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # Last resort: use a generic identifier
         return "anonymous"
     
-    async def _cleanup_old_buckets(self):
-        """Remove old token buckets to prevent memory leak."""
-        now = time.time()
-        if now - self.last_cleanup < self.cleanup_interval:
+    async def stop_cleanup(self):
+        """Cancel the background bucket cleanup task, if running."""
+        task = self._cleanup_task
+        self._cleanup_task = None
+        if task is None or task.done():
             return
         
-        self.last_cleanup = now
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except RuntimeError:
+            # Task belongs to an event loop that is no longer running
+            pass
+    
+    async def _cleanup_loop(self):
+        """Periodically remove stale token buckets in the background."""
+        while True:
+            await asyncio.sleep(self.cleanup_interval)
+            try:
+                self._sweep_stale_buckets()
+            except Exception as e:
+                logger.error(f"Rate limit bucket cleanup failed: {str(e)}")
+    
+    def _sweep_stale_buckets(self):
+        """
+        Remove old token buckets to prevent memory leak.
         
-        # Find buckets that haven't been used recently
-        stale_threshold = now - (self.cleanup_interval * 2)
-        stale_clients = []
+        Uses two generations: buckets untouched since the previous sweep are
+        marked as candidates, and candidates still untouched at the following
+        sweep are deleted.
+        """
+        now = time.time()
+        marked_at = self.last_cleanup
         
-        for client_id, bucket in self.client_buckets.items():
-            if bucket.last_refill < stale_threshold:
+        # Delete candidates that stayed idle since they were marked
+        stale_clients = []
+        for client_id in self._cleanup_candidates:
+            bucket = self.client_buckets.get(client_id)
+            if bucket is not None and bucket.last_refill < marked_at:
                 stale_clients.append(client_id)
         
-        # Remove stale buckets
         for client_id in stale_clients:
             del self.client_buckets[client_id]
         
+        # Mark buckets idle since the previous sweep for the next pass
+        self._cleanup_candidates = {
+            client_id
+            for client_id, bucket in self.client_buckets.items()
+            if bucket.last_refill < marked_at
+        }
+        self.last_cleanup = now
+        
         if stale_clients:
-            logger.info(f"Cleaned up {len(stale_clients)} stale rate limit buckets")
\ No newline at end of file
+            logger.info(f"Cleaned up {len(stale_clients)} stale rate limit buckets")
+
+
+async def stop_rate_limit_cleanup():
+    """Cancel bucket cleanup tasks of all rate limit middleware instances."""
+    for middleware in list(_active_middlewares):
+        await middleware.stop_cleanup()
@@ -3,217 +3,619 @@ Safety validation middleware.
 
 This middleware ensures all request and response content meets safety requirements
 by validating and abstracting concrete references automatically.
+
+Implemented as a pure ASGI middleware so request and response bodies are
+intercepted at the message level without the extra task and Request/Response
+wrappers that ``BaseHTTPMiddleware`` creates per request.
 """
 
-import json
+import asyncio
+import gzip
 import logging
-from typing import Any, Dict, List, Union
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from ...core.abstraction.concrete_engine import ConcreteAbstractionEngine
+from ...core.abstraction.concrete_engine import ConcreteAbstractionEngine, get_engine
 from ...core.validation.validator import SafetyValidator
 from ..config import get_settings
+from .. import serialization
 
 logger = logging.getLogger(__name__)
 
+# Response header trusted endpoints set when their content was produced by an
+# already-abstracting code path; it is stripped before reaching the client
+SKIP_SAFETY_VALIDATION_HEADER = "X-Skip-Safety-Validation"
+_SKIP_HEADER_KEY = SKIP_SAFETY_VALIDATION_HEADER.lower().encode("latin-1")
+
+# A JSON string token, optionally followed by ':' when it is an object key
+_JSON_STRING_RE = re.compile(rb'("[^"\\]*(?:\\.[^"\\]*)*")(\s*:)?')
+
+# Bodies below this size are abstracted inline on the event loop; the fixed
+# cost of handing work to a thread outweighs the work itself
+MAX_SYNC_BUFFER = 65536
+
+# Line-delimited JSON responses are validated as they stream, one batch of
+# complete lines at a time
+_NDJSON_MEDIA_TYPE = b"application/x-ndjson"
+_NDJSON_SAFETY_ERROR_LINE = serialization.dumps_bytes({
+    "error": "Response content failed safety validation",
+    "error_code": "SAFETY_VALIDATION_FAILED",
+}) + b"\n"
 
-class SafetyMiddleware(BaseHTTPMiddleware):
+# Smallest gzip member that can hold a non-empty string token: 18 bytes of
+# header and trailer plus 5 bytes of deflate data for '"1"'
+_GZIP_MIN_TOKEN_LENGTH = 23
+
+
+class SafetyMiddleware:
     """Middleware for safety validation and automatic abstraction."""
     
-    def __init__(self, app, abstraction_engine: ConcreteAbstractionEngine, safety_validator: SafetyValidator):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, abstraction_engine: ConcreteAbstractionEngine, safety_validator: SafetyValidator):
+        self.app = app
         self.abstraction_engine = abstraction_engine
         self.safety_validator = safety_validator
+        
+        # Patterns must be compiled before the first request, and the engine
+        # is expected to be the process-wide instance
+        if not getattr(abstraction_engine, "_patterns_compiled", True):
+            abstraction_engine.compile_patterns()
+        if __debug__ and abstraction_engine is not get_engine():
+            logger.warning("SafetyMiddleware is not using the shared abstraction engine")
         self.settings = get_settings()
         self.auto_abstract = self.settings.safety_auto_abstract
         self.min_score = float(self.settings.safety_min_score)
         
-        # Paths to exclude from safety validation
-        self.excluded_paths = {
+        # LRU cache of (abstracted_content, safety_score, is_safe) for short
+        # strings, which recur constantly across requests and responses
+        self._abstraction_cache: "OrderedDict[str, Tuple[str, float, bool]]" = OrderedDict()
+        self._abstraction_cache_size = 4096
+        self._abstraction_cache_max_length = 256
+        self._abstraction_cache_lock = Lock()
+        
+        # Large payloads with many strings are abstracted off the event loop
+        self._thread_batch_threshold = 64
+        self._executor = ThreadPoolExecutor(
+            max_workers=4,
+            thread_name_prefix="safety-abstraction"
+        )
+        
+        # Path prefixes to exclude from safety validation (also covers nested
+        # paths such as documentation assets)
+        self.excluded_prefixes = (
             "/docs",
             "/redoc",
             "/openapi.json",
             "/health",
             "/metrics",
-        }
+        )
+        self._excluded_subtrees = tuple(
+            prefix + "/" for prefix in self.excluded_prefixes
+        )
     
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request through safety validation."""
-        # Skip safety validation for excluded paths
-        if request.url.path in self.excluded_paths:
-            return await call_next(request)
+        # Only HTTP traffic is validated; skip excluded paths and OPTIONS
+        if (
+            scope["type"] != "http"
+            or self._is_excluded(scope["path"])
+            or scope["method"] == "OPTIONS"
+        ):
+            await self.app(scope, receive, send)
+            return
         
-        # Skip validation for OPTIONS requests
-        if request.method == "OPTIONS":
-            return await call_next(request)
+        response_started = False
         
         try:
             # Validate request body if present
-            if request.method in ["POST", "PUT", "PATCH"]:
-                body = await self._get_request_body(request)
-                if body:
-                    validated_body = await self._validate_and_abstract(body)
+            if scope["method"] in ("POST", "PUT", "PATCH"):
+                messages = await self._read_request(receive)
+                body = self._join_body(messages)
+                
+                data = self._parse_body(body, "request")
+                if data:
+                    validated_body, mutated = await self._validate_and_abstract(data, len(body))
                     if validated_body is None:
-                        return JSONResponse(
-                            status_code=400,
-                            content={
-                                "detail": "Request content failed safety validation",
-                                "error_code": "SAFETY_VALIDATION_FAILED"
-                            }
+                        await self._send_error(
+                            scope, receive, send, 400,
+                            "Request content failed safety validation",
+                            "SAFETY_VALIDATION_FAILED"
                         )
+                        return
                     
-                    # Replace request body with abstracted version
-                    request._body = json.dumps(validated_body).encode()
+                    # Replace the request body only when abstraction changed
+                    # it; already-safe bodies are replayed as received
+                    if mutated:
+                        body = serialization.dumps_bytes(validated_body)
+                        scope = self._with_content_length(scope, len(body))
+                        messages = [{"type": "http.request", "body": body, "more_body": False}]
+                
+                receive = self._replay_receive(messages, receive)
             
-            # Process request
-            response = await call_next(request)
+            # Hold the response back until its body has been validated
+            start_message: Optional[Message] = None
+            passthrough = False
+            gzipped = False
+            line_delimited = False
+            closed = False
+            pending_lines = b""
+            chunks: List[bytes] = []
             
-            # Validate response body for safety
-            if response.status_code < 400:  # Only validate successful responses
-                response_body = await self._get_response_body(response)
+            async def send_lines(message: Message) -> None:
+                """Validate and forward the complete lines of a streamed body."""
+                nonlocal start_message, closed, pending_lines, response_started
+                
+                more_body = message.get("more_body", False)
+                pending_lines += message.get("body", b"")
+                split = pending_lines.rfind(b"\n") + 1 if more_body else len(pending_lines)
+                if more_body and not split:
+                    return
+                lines, pending_lines = pending_lines[:split], pending_lines[split:]
+                
+                validated_lines = await self._validate_and_abstract_json(lines) if lines else lines
+                if validated_lines is None:
+                    logger.error("Streamed response failed safety validation")
+                    closed = True
+                    if start_message is not None:
+                        await self._send_error(
+                            scope, receive, send, 500,
+                            "Response content failed safety validation",
+                            "SAFETY_VALIDATION_FAILED"
+                        )
+                    else:
+                        # Headers are already out; end the stream with an
+                        # error line so clients can tell it was cut short
+                        await send({
+                            "type": "http.response.body",
+                            "body": _NDJSON_SAFETY_ERROR_LINE,
+                            "more_body": False,
+                        })
+                    response_started = True
+                    return
+                
+                if start_message is not None:
+                    # Abstraction may change line lengths
+                    await send({
+                        **start_message,
+                        "headers": [
+                            (key, value) for key, value in start_message.get("headers", [])
+                            if key != b"content-length"
+                        ],
+                    })
+                    start_message = None
+                    response_started = True
+                await send({"type": "http.response.body", "body": validated_lines, "more_body": more_body})
+            
+            async def send_wrapper(message: Message) -> None:
+                nonlocal start_message, passthrough, gzipped, line_delimited, response_started
+                
+                if closed:
+                    return
+                
+                if message["type"] == "http.response.start":
+                    # Only validate successful JSON responses that have not
+                    # opted out; everything else streams through untouched
+                    validate, gzipped, message = self._should_validate_response(message)
+                    if not validate:
+                        passthrough = True
+                        response_started = True
+                        await send(message)
+                    else:
+                        start_message = message
+                        line_delimited = not gzipped and self._is_line_delimited(message)
+                    return
+                
+                if passthrough or message["type"] != "http.response.body":
+                    await send(message)
+                    return
+                
+                # Streamed NDJSON is forwarded as its lines are validated;
+                # a single-chunk body takes the buffered path below
+                if line_delimited and (start_message is None or message.get("more_body", False)):
+                    await send_lines(message)
+                    return
+                
+                chunks.append(message.get("body", b""))
+                if message.get("more_body", False):
+                    return
+                
+                # Small responses arrive as a single chunk; avoid the join
+                response_body = chunks[0] if len(chunks) == 1 else b"".join(chunks)
                 if response_body:
-                    validated_response = await self._validate_and_abstract(response_body)
+                    # Validate compressed responses on their decompressed
+                    # bytes so this middleware can sit outside GZipMiddleware
+                    json_body = gzip.decompress(response_body) if gzipped else response_body
+                    
+                    # Abstract string tokens in the encoded body directly
+                    # instead of decoding into Python objects and re-encoding
+                    validated_response = await self._validate_and_abstract_json(json_body)
                     if validated_response is None:
                         logger.error("Response failed safety validation")
-                        return JSONResponse(
-                            status_code=500,
-                            content={
-                                "detail": "Response content failed safety validation",
-                                "error_code": "SAFETY_VALIDATION_FAILED"
-                            }
+                        await self._send_error(
+                            scope, receive, send, 500,
+                            "Response content failed safety validation",
+                            "SAFETY_VALIDATION_FAILED"
                         )
+                        response_started = True
+                        return
                     
-                    # Create new response with abstracted content
-                    return JSONResponse(
-                        content=validated_response,
-                        status_code=response.status_code,
-                        headers=dict(response.headers)
-                    )
-            
-            return response
+                    # Untouched bodies are sent as received; only rewritten
+                    # ones are re-compressed
+                    if validated_response is not json_body:
+                        response_body = (
+                            gzip.compress(validated_response) if gzipped else validated_response
+                        )
+                        start_message = self._with_content_length(start_message, len(response_body))
+                
+                response_started = True
+                await send(start_message)
+                await send({"type": "http.response.body", "body": response_body, "more_body": False})
             
+            await self.app(scope, receive, send_wrapper)
+        
         except Exception as e:
             logger.error(f"Safety middleware error: {str(e)}")
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "detail": "Internal safety validation error",
-                    "error_code": "SAFETY_ERROR"
-                }
+            if response_started:
+                raise
+            await self._send_error(
+                scope, receive, send, 500,
+                "Internal safety validation error",
+                "SAFETY_ERROR"
             )
     
-    async def _get_request_body(self, request: Request) -> Union[Dict[str, Any], List[Any], None]:
-        """Extract and parse request body."""
-        try:
-            if not hasattr(request, "_body"):
-                request._body = await request.body()
-            
-            if request._body:
-                return json.loads(request._body)
-            return None
-            
-        except json.JSONDecodeError:
-            logger.warning("Failed to parse request body as JSON")
-            return None
-        except Exception as e:
-            logger.error(f"Error reading request body: {str(e)}")
-            return None
+    def _is_excluded(self, path: str) -> bool:
+        """Check whether a path is an excluded prefix or nested beneath one."""
+        return path in self.excluded_prefixes or path.startswith(self._excluded_subtrees)
     
-    async def _get_response_body(self, response: Response) -> Union[Dict[str, Any], List[Any], None]:
-        """Extract and parse response body."""
-        try:
-            # Read response body
-            body_bytes = b""
-            async for chunk in response.body_iterator:
-                body_bytes += chunk
-            
-            if body_bytes:
-                return json.loads(body_bytes.decode())
-            return None
-            
-        except json.JSONDecodeError:
-            logger.warning("Failed to parse response body as JSON")
+    async def _read_request(self, receive: Receive) -> List[Message]:
+        """Buffer request messages until the body is complete."""
+        messages: List[Message] = []
+        while True:
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request" or not message.get("more_body", False):
+                return messages
+    
+    def _should_validate_response(self, message: Message) -> Tuple[bool, bool, Message]:
+        """
+        Decide whether a response needs validation, stripping the opt-out header.
+        
+        Returns whether to validate, whether the body is gzip encoded and the
+        (possibly rewritten) response start message.
+        """
+        if message["status"] >= 400:
+            return False, False, message
+        
+        content_type = b""
+        content_encoding = b""
+        content_length = None
+        skip = False
+        for key, value in message.get("headers", []):
+            if key == b"content-type":
+                content_type = value
+            elif key == b"content-encoding":
+                content_encoding = value.strip().lower()
+            elif key == b"content-length":
+                content_length = value
+            elif key == _SKIP_HEADER_KEY:
+                skip = True
+        
+        if skip:
+            message = {
+                **message,
+                "headers": [
+                    (key, value) for key, value in message["headers"]
+                    if key != _SKIP_HEADER_KEY
+                ],
+            }
+            return False, False, message
+        
+        if not content_type.startswith((b"application/json", _NDJSON_MEDIA_TYPE)):
+            return False, False, message
+        
+        if content_encoding == b"gzip":
+            # Members too small to hold a string token need no decompression
+            if content_length is not None and int(content_length) < _GZIP_MIN_TOKEN_LENGTH:
+                return False, False, message
+            return True, True, message
+        
+        return True, False, message
+    
+    def _is_line_delimited(self, message: Message) -> bool:
+        """Check whether a response start message declares an NDJSON body."""
+        for key, value in message.get("headers", []):
+            if key == b"content-type":
+                return value.startswith(_NDJSON_MEDIA_TYPE)
+        return False
+    
+    def _join_body(self, messages: List[Message]) -> bytes:
+        """Concatenate the body of buffered request messages."""
+        if len(messages) == 1:
+            return messages[0].get("body", b"")
+        return b"".join(m.get("body", b"") for m in messages if m["type"] == "http.request")
+    
+    def _replay_receive(self, messages: List[Message], receive: Receive) -> Receive:
+        """Replay buffered messages before delegating to the original channel."""
+        async def replay() -> Message:
+            if messages:
+                return messages.pop(0)
+            return await receive()
+        
+        return replay
+    
+    def _with_content_length(self, message: Dict[str, Any], length: int) -> Dict[str, Any]:
+        """Return a copy of a scope or response start with its content-length replaced."""
+        headers = [
+            (key, value) for key, value in message.get("headers", [])
+            if key != b"content-length"
+        ]
+        headers.append((b"content-length", str(length).encode("latin-1")))
+        return {**message, "headers": headers}
+    
+    async def _send_error(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        status_code: int,
+        detail: str,
+        error_code: str
+    ) -> None:
+        """Send a JSON error response."""
+        response = Response(
+            content=serialization.dumps_bytes({
+                "detail": detail,
+                "error_code": error_code
+            }),
+            status_code=status_code,
+            media_type="application/json"
+        )
+        await response(scope, receive, send)
+    
+    def _parse_body(self, body: bytes, source: str) -> Union[Dict[str, Any], List[Any], None]:
+        """Parse a request or response body as JSON."""
+        if not body:
             return None
-        except Exception as e:
-            logger.error(f"Error reading response body: {str(e)}")
+        try:
+            return serialization.loads(body)
+        except ValueError:
+            logger.warning(f"Failed to parse {source} body as JSON")
             return None
     
-    async def _validate_and_abstract(self, data: Union[Dict, List]) -> Union[Dict, List, None]:
-        """Validate content and apply abstraction if needed."""
+    async def _validate_and_abstract(
+        self, data: Union[Dict, List], body_size: int
+    ) -> Tuple[Union[Dict, List, None], bool]:
+        """
+        Validate content and apply abstraction if needed.
+        
+        Returns the validated content (None if it failed validation) and
+        whether abstraction changed it.
+        """
+        min_score = self.min_score
+        
         try:
-            # Convert to string for validation
-            content_str = json.dumps(data)
-            
             # Check if abstraction is needed
             if self.auto_abstract:
-                # Abstract the content first
-                abstracted_data = await self._abstract_data(data)
-                
-                # Validate abstracted content
-                validation_result = self.safety_validator.validate_content(
-                    json.dumps(abstracted_data)
-                )
+                # Abstract and score every string in a single walk; the
+                # abstraction results already carry their safety validation
+                abstracted_data, safety_score, all_safe, mutated = await self._abstract_data(data, body_size)
                 
-                if validation_result.is_safe and validation_result.safety_score >= self.min_score:
-                    return abstracted_data
+                if all_safe and safety_score >= min_score:
+                    return abstracted_data, mutated
                 else:
                     logger.warning(
                         f"Content failed safety validation: "
-                        f"score={validation_result.safety_score}, "
-                        f"issues={validation_result.issues}"
+                        f"score={safety_score}, all_safe={all_safe}"
                     )
-                    return None
+                    return None, False
             else:
                 # Just validate without abstraction
-                validation_result = self.safety_validator.validate_content(content_str)
+                validation_result = self.safety_validator.validate_content(
+                    serialization.dumps(data)
+                )
                 
-                if validation_result.is_safe and validation_result.safety_score >= self.min_score:
-                    return data
+                if validation_result.is_safe and validation_result.safety_score >= min_score:
+                    return data, False
                 else:
                     logger.warning(
                         f"Content failed safety validation: "
                         f"score={validation_result.safety_score}, "
                         f"issues={validation_result.issues}"
                     )
-                    return None
-                    
+                    return None, False
+        
         except Exception as e:
             logger.error(f"Error during validation/abstraction: {str(e)}")
-            return None
+            return None, False
     
-    async def _abstract_data(self, data: Union[Dict, List]) -> Union[Dict, List]:
-        """Recursively abstract data structures."""
-        if isinstance(data, dict):
-            abstracted = {}
-            for key, value in data.items():
-                if isinstance(value, (dict, list)):
-                    abstracted[key] = await self._abstract_data(value)
-                elif isinstance(value, str):
-                    # Abstract string values
-                    abstraction = self.abstraction_engine.abstract(value)
-                    abstracted[key] = abstraction.abstracted_content
-                else:
-                    # Keep non-string values as-is
-                    abstracted[key] = value
-            return abstracted
+    async def _validate_and_abstract_json(self, body: bytes) -> Optional[bytes]:
+        """Validate an encoded JSON body and abstract its string values in place."""
+        min_score = self.min_score
+        
+        try:
+            if self.auto_abstract:
+                abstracted_body, safety_score, all_safe = await self._abstract_json_bytes(body)
+                
+                if all_safe and safety_score >= min_score:
+                    return abstracted_body
+                logger.warning(
+                    f"Content failed safety validation: "
+                    f"score={safety_score}, all_safe={all_safe}"
+                )
+                return None
             
-        elif isinstance(data, list):
-            abstracted = []
-            for item in data:
-                if isinstance(item, (dict, list)):
-                    abstracted.append(await self._abstract_data(item))
-                elif isinstance(item, str):
-                    # Abstract string values
-                    abstraction = self.abstraction_engine.abstract(item)
-                    abstracted.append(abstraction.abstracted_content)
-                else:
-                    # Keep non-string values as-is
-                    abstracted.append(item)
-            return abstracted
+            # Just validate without abstraction
+            validation_result = self.safety_validator.validate_content(body.decode("utf-8"))
             
-        else:
-            # Return non-container types as-is
-            return data
\ No newline at end of file
+            if validation_result.is_safe and validation_result.safety_score >= min_score:
+                return body
+            logger.warning(
+                f"Content failed safety validation: "
+                f"score={validation_result.safety_score}, "
+                f"issues={validation_result.issues}"
+            )
+            return None
+        
+        except Exception as e:
+            logger.error(f"Error during validation/abstraction: {str(e)}")
+            return None
+    
+    async def _abstract_json_bytes(self, body: bytes) -> Tuple[bytes, float, bool]:
+        """
+        Abstract the string values of an encoded JSON document.
+        
+        String tokens are located with a single regex pass over the bytes;
+        object keys are left alone and every other byte is copied verbatim,
+        so no intermediate Python object tree is built.
+        
+        Returns the rewritten body, the lowest safety score and whether every
+        abstracted string was safe.
+        """
+        tokens = [match for match in _JSON_STRING_RE.finditer(body) if not match.group(2)]
+        if not tokens:
+            return body, 1.0, True
+        
+        strings = []
+        for match in tokens:
+            token = match.group(1)
+            if b"\\" in token:
+                strings.append(serialization.loads(token))
+            else:
+                strings.append(token[1:-1].decode("utf-8"))
+        
+        results = await self._abstract_batch(strings, len(body))
+        
+        # Splice rewritten tokens into the original bytes
+        output = bytearray()
+        last_end = 0
+        min_safety_score = 1.0
+        all_safe = True
+        for match, original, (abstracted_content, score, is_safe) in zip(tokens, strings, results):
+            if score < min_safety_score:
+                min_safety_score = score
+            if not is_safe:
+                all_safe = False
+            if abstracted_content != original:
+                start, end = match.span(1)
+                output += body[last_end:start]
+                output += serialization.dumps_bytes(abstracted_content)
+                last_end = end
+        
+        if last_end == 0:
+            return body, min_safety_score, all_safe
+        
+        output += body[last_end:]
+        return bytes(output), min_safety_score, all_safe
+    
+    async def _abstract_data(
+        self, data: Union[Dict, List], body_size: int
+    ) -> Tuple[Union[Dict, List], float, bool, bool]:
+        """
+        Recursively abstract data structures.
+        
+        The tree is copied in one pass while string leaves are collected, the
+        leaves are abstracted as a batch, and the results are written back.
+        Large bodies run on a worker thread so the event loop stays free.
+        
+        Returns the abstracted structure together with the lowest safety score,
+        whether every abstracted string was safe and whether any string was
+        changed; unchanged input is returned as the original object.
+        """
+        leaves: List[Tuple[Union[Dict, List], Any]] = []
+        strings: List[str] = []
+        
+        def collect(value: Any) -> Any:
+            if isinstance(value, dict):
+                copied = {}
+                for key, item in value.items():
+                    if isinstance(item, str):
+                        leaves.append((copied, key))
+                        strings.append(item)
+                    copied[key] = collect(item)
+                return copied
+            if isinstance(value, list):
+                copied = []
+                for index, item in enumerate(value):
+                    if isinstance(item, str):
+                        leaves.append((copied, index))
+                        strings.append(item)
+                    copied.append(collect(item))
+                return copied
+            # Strings are written back later; keep other values as-is
+            return value
+        
+        abstracted = collect(data)
+        if not strings:
+            return data, 1.0, True, False
+        
+        results = await self._abstract_batch(strings, body_size)
+        
+        # Write abstracted strings back and fold in their safety
+        min_safety_score = 1.0
+        all_safe = True
+        mutated = False
+        for (container, key), original, (abstracted_content, score, is_safe) in zip(
+            leaves, strings, results
+        ):
+            if abstracted_content != original:
+                container[key] = abstracted_content
+                mutated = True
+            if score < min_safety_score:
+                min_safety_score = score
+            if not is_safe:
+                all_safe = False
+        
+        if not mutated:
+            return data, min_safety_score, all_safe, False
+        return abstracted, min_safety_score, all_safe, True
+    
+    async def _abstract_batch(self, strings: List[str], body_size: int) -> List[Tuple[str, float, bool]]:
+        """
+        Abstract a batch of strings.
+        
+        Bodies under MAX_SYNC_BUFFER bytes take the synchronous path; larger
+        ones with many strings are handed to the worker pool.
+        """
+        if body_size >= MAX_SYNC_BUFFER and len(strings) >= self._thread_batch_threshold:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, self._abstract_strings, strings
+            )
+        return self._abstract_strings(strings)
+    
+    def _abstract_strings(self, strings: List[str]) -> List[Tuple[str, float, bool]]:
+        """Abstract a batch of strings."""
+        abstract_string = self._abstract_string
+        return [abstract_string(value) for value in strings]
+    
+    def _abstract_string(self, value: str) -> Tuple[str, float, bool]:
+        """Abstract a single string, memoizing results for short values."""
+        cache = self._abstraction_cache
+        cacheable = len(value) <= self._abstraction_cache_max_length
+        
+        if cacheable:
+            with self._abstraction_cache_lock:
+                cached = cache.get(value)
+                if cached is not None:
+                    cache.move_to_end(value)
+                    return cached
+        
+        abstraction = self.abstraction_engine.abstract(value)
+        result = (
+            abstraction.abstracted_content,
+            abstraction.validation.safety_score,
+            abstraction.is_safe,
+        )
+        
+        if cacheable:
+            with self._abstraction_cache_lock:
+                cache[value] = result
+                if len(cache) > self._abstraction_cache_size:
+                    cache.popitem(last=False)
+        
+        return result
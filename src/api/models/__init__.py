@@ -9,6 +9,7 @@ from .common import (
     ErrorResponse,
     PaginatedResponse,
     SuccessResponse,
+    TrustedModel,
 )
 from .memory import (
     MemoryCreate,
@@ -24,6 +25,7 @@ __all__ = [
     "ErrorResponse",
     "PaginatedResponse",
     "SuccessResponse",
+    "TrustedModel",
     # Memory models
     "MemoryCreate",
     "MemoryUpdate",
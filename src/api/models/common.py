@@ -8,10 +8,54 @@ errors, and pagination.
 from typing import Any, Dict, Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel, Field
+from typing_extensions import Annotated
 
 # Generic type for paginated data
 T = TypeVar("T")
 
+# Identifiers are echoed back opaquely, so they stay strings validated
+# against the canonical UUID layout instead of round-tripping through UUID
+UUID_PATTERN = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+
+# Scores and weights normalized to [0, 1]; the constraint lives on the type
+# so fields share it while keeping their own descriptions
+UnitInterval = Annotated[float, Field(ge=0, le=1)]
+
+
+class TrustedModel(BaseModel):
+    """
+    Base for response models populated from already-validated service data.
+    
+    Instances are frozen: responses are never modified after construction,
+    and subclasses inherit the setting through their merged model_config.
+    """
+    
+    model_config = {"frozen": True}
+    
+    @classmethod
+    def from_trusted(cls, obj: Any = None, **data: Any):
+        """
+        Build an instance without running validation.
+        
+        Args:
+            obj: Optional object whose attributes populate the fields, as
+                with model_validate on from_attributes models
+            **data: Field values, overriding attributes read from obj
+            
+        Returns:
+            Model instance constructed via model_construct
+        """
+        if obj is not None:
+            data = {
+                **{
+                    name: getattr(obj, name)
+                    for name in cls.model_fields
+                    if hasattr(obj, name)
+                },
+                **data,
+            }
+        return cls.model_construct(**data)
+
 
 class ErrorResponse(BaseModel):
     """Standard error response model."""
@@ -165,4 +209,18 @@ class HealthStatus(BaseModel):
                 }
             ]
         }
-    }
\ No newline at end of file
+    }
+
+
+# Build core schemas, validators, serializers and JSON schemas at import time
+# so error and pagination responses do not pay for them on the request path
+for _model in (
+    ErrorResponse,
+    SuccessResponse,
+    PaginationMeta,
+    PaginatedResponse,
+    HealthStatus,
+):
+    _model.model_rebuild()
+    _model.model_json_schema()
+del _model
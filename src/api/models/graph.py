@@ -6,20 +6,19 @@ including graph building, querying, and export functionality.
 """
 
 from datetime import datetime
-from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-from uuid import UUID
+from typing import Annotated, Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, StringConstraints, field_validator, ConfigDict
 
 from ...services.vault.graph_models import NodeType, EdgeType
+from .common import UUID_PATTERN
 
 
 class GraphBuildRequest(BaseModel):
     """Model for building a knowledge graph."""
     
-    memory_ids: Optional[List[UUID]] = Field(
+    memory_ids: Optional[List[Annotated[str, StringConstraints(pattern=UUID_PATTERN)]]] = Field(
         None,
         description="Specific memory IDs to include (None for recent memories)"
     )
@@ -69,9 +68,10 @@ class GraphBuildRequest(BaseModel):
 class GraphNode(BaseModel):
     """Model for a knowledge graph node."""
     
-    node_id: UUID = Field(
+    node_id: str = Field(
         ...,
-        description="Unique node identifier"
+        description="Unique node identifier",
+        pattern=UUID_PATTERN
     )
     node_type: NodeType = Field(
         ...,
@@ -87,7 +87,7 @@ class GraphNode(BaseModel):
         description="Abstracted description pattern",
         max_length=500
     )
-    safety_score: Decimal = Field(
+    safety_score: float = Field(
         ...,
         description="Safety validation score",
         ge=0,
@@ -139,17 +139,20 @@ class GraphNode(BaseModel):
 class GraphEdge(BaseModel):
     """Model for a knowledge graph edge."""
     
-    edge_id: UUID = Field(
+    edge_id: str = Field(
         ...,
-        description="Unique edge identifier"
+        description="Unique edge identifier",
+        pattern=UUID_PATTERN
     )
-    source_node_id: UUID = Field(
+    source_node_id: str = Field(
         ...,
-        description="Source node ID"
+        description="Source node ID",
+        pattern=UUID_PATTERN
     )
-    target_node_id: UUID = Field(
+    target_node_id: str = Field(
         ...,
-        description="Target node ID"
+        description="Target node ID",
+        pattern=UUID_PATTERN
     )
     edge_type: EdgeType = Field(
         ...,
@@ -183,7 +186,7 @@ class GraphEdge(BaseModel):
         ge=0,
         le=1
     )
-    safety_score: Decimal = Field(
+    safety_score: float = Field(
         ...,
         description="Safety validation score",
         ge=0,
@@ -245,7 +248,7 @@ class GraphMetrics(BaseModel):
         description="Number of connected components",
         ge=0
     )
-    average_safety_score: Decimal = Field(
+    average_safety_score: float = Field(
         ...,
         description="Average safety score across all nodes",
         ge=0,
@@ -277,9 +280,10 @@ class GraphMetrics(BaseModel):
 class GraphResponse(BaseModel):
     """Model for graph creation/retrieval response."""
     
-    graph_id: UUID = Field(
+    graph_id: str = Field(
         ...,
-        description="Unique graph identifier"
+        description="Unique graph identifier",
+        pattern=UUID_PATTERN
     )
     name: str = Field(
         ...,
@@ -380,7 +384,7 @@ class GraphQuery(BaseModel):
     sort_by: str = Field(
         "centrality",
         description="Sort criteria (centrality, created_at, safety_score)",
-        regex="^(centrality|created_at|safety_score)$"
+        pattern="^(centrality|created_at|safety_score)$"
     )
     sort_descending: bool = Field(
         True,
@@ -452,7 +456,7 @@ class GraphExportRequest(BaseModel):
     format: str = Field(
         ...,
         description="Export format (mermaid, json, d3, cytoscape, graphml)",
-        regex="^(mermaid|json|d3|cytoscape|graphml)$"
+        pattern="^(mermaid|json|d3|cytoscape|graphml)$"
     )
     include_metadata: bool = Field(
         True,
@@ -535,9 +539,10 @@ class GraphExportResult(BaseModel):
 class SubgraphRequest(BaseModel):
     """Model for subgraph extraction request."""
     
-    center_node_id: UUID = Field(
+    center_node_id: str = Field(
         ...,
-        description="ID of the center node"
+        description="ID of the center node",
+        pattern=UUID_PATTERN
     )
     max_depth: int = Field(
         2,
@@ -574,4 +579,23 @@ class SubgraphRequest(BaseModel):
                 }
             ]
         }
-    )
\ No newline at end of file
+    )
+
+
+# Build core schemas, validators, serializers and JSON schemas at import time
+# so the first request touching the graph API does not pay for them
+for _model in (
+    GraphBuildRequest,
+    GraphNode,
+    GraphEdge,
+    GraphMetrics,
+    GraphResponse,
+    GraphQuery,
+    GraphQueryResult,
+    GraphExportRequest,
+    GraphExportResult,
+    SubgraphRequest,
+):
+    _model.model_rebuild()
+    _model.model_json_schema()
+del _model
@@ -6,35 +6,62 @@ including vault sync, documentation generation, and checkpoint management.
 """
 
 from datetime import datetime
-from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    NonNegativeInt,
+    SkipValidation,
+    StringConstraints,
+)
+from typing_extensions import Annotated, NotRequired, TypedDict
 
 from ...services.vault.models import TemplateType, ConflictStrategy, SyncDirection
+from .common import UUID_PATTERN, TrustedModel, UnitInterval
+
+# Documentation types the generator supports
+DocType = Literal["readme", "api", "changelog", "architecture", "coverage"]
+
+
+def _lowercase(value: Any) -> Any:
+    """Lowercase string input so documentation types match case-insensitively."""
+    return value.lower() if isinstance(value, str) else value
+
+
+# Immutable defaults shared by every request that omits the patterns
+_DEFAULT_FILE_PATTERNS = ("*.py", "*.js", "*.ts")
+_DEFAULT_EXCLUDE_PATTERNS = ("__pycache__", "node_modules", ".git")
+
+
+_CHECKPOINT_REQUEST_EXAMPLE = {
+    "checkpoint_name": "API Development Milestone",
+    "description": "Checkpoint after implementing REST API foundation",
+    "include_code_analysis": True,
+    "max_memories": 50
+}
 
 
 class CheckpointRequest(BaseModel):
     """Model for creating a memory checkpoint."""
     
-    checkpoint_name: str = Field(
+    checkpoint_name: Annotated[str, StringConstraints(strict=True, min_length=1, max_length=100)] = Field(
         ...,
-        description="Name for the checkpoint",
-        min_length=1,
-        max_length=100
+        description="Name for the checkpoint"
     )
-    description: Optional[str] = Field(
+    description: Optional[Annotated[str, StringConstraints(strict=True, max_length=500)]] = Field(
         None,
-        description="Optional description of the checkpoint",
-        max_length=500
+        description="Optional description of the checkpoint"
     )
     include_code_analysis: bool = Field(
         True,
         description="Include code analysis in checkpoint"
     )
-    memory_filters: Optional[Dict[str, Any]] = Field(
+    memory_filters: Annotated[Optional[Dict[str, Any]], SkipValidation] = Field(
         None,
         description="Filters for which memories to include"
     )
@@ -46,25 +73,31 @@ class CheckpointRequest(BaseModel):
     )
     
     model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "checkpoint_name": "API Development Milestone",
-                    "description": "Checkpoint after implementing REST API foundation",
-                    "include_code_analysis": True,
-                    "max_memories": 50
-                }
-            ]
-        }
+        defer_build=True,
+        json_schema_extra={"examples": [_CHECKPOINT_REQUEST_EXAMPLE]}
     )
 
 
-class CheckpointResponse(BaseModel):
+_CHECKPOINT_RESPONSE_EXAMPLE = {
+    "checkpoint_id": "123e4567-e89b-12d3-a456-426614174000",
+    "name": "API Development Milestone",
+    "description": "Checkpoint after implementing REST API foundation",
+    "memories_included": 45,
+    "files_analyzed": 12,
+    "safety_score": 0.92,
+    "created_at": "2024-01-13T10:00:00Z",
+    "processing_time_ms": 1250,
+    "warnings": []
+}
+
+
+class CheckpointResponse(TrustedModel):
     """Model for checkpoint creation response."""
     
-    checkpoint_id: UUID = Field(
+    checkpoint_id: str = Field(
         ...,
-        description="Unique checkpoint identifier"
+        description="Unique checkpoint identifier",
+        pattern=UUID_PATTERN
     )
     name: str = Field(
         ...,
@@ -74,51 +107,48 @@ class CheckpointResponse(BaseModel):
         None,
         description="Checkpoint description"
     )
-    memories_included: int = Field(
+    memories_included: NonNegativeInt = Field(
         ...,
-        description="Number of memories included",
-        ge=0
+        description="Number of memories included"
     )
-    files_analyzed: int = Field(
+    files_analyzed: NonNegativeInt = Field(
         ...,
-        description="Number of code files analyzed",
-        ge=0
+        description="Number of code files analyzed"
     )
-    safety_score: Decimal = Field(
+    safety_score: UnitInterval = Field(
         ...,
-        description="Average safety score of checkpoint",
-        ge=0,
-        le=1
+        description="Average safety score of checkpoint"
     )
     created_at: datetime = Field(
         ...,
         description="Checkpoint creation timestamp"
     )
-    processing_time_ms: float = Field(
+    processing_time_ms: NonNegativeInt = Field(
         ...,
-        description="Processing time in milliseconds",
-        ge=0
+        description="Processing time in milliseconds"
+    )
+    warnings: List[str] = Field(
+        default_factory=list,
+        description="List of warnings generated"
     )
     
     model_config = ConfigDict(
+        defer_build=True,
         from_attributes=True,
-        json_schema_extra={
-            "examples": [
-                {
-                    "checkpoint_id": "123e4567-e89b-12d3-a456-426614174000",
-                    "name": "API Development Milestone",
-                    "description": "Checkpoint after implementing REST API foundation",
-                    "memories_included": 45,
-                    "files_analyzed": 12,
-                    "safety_score": 0.92,
-                    "created_at": "2024-01-13T10:00:00Z",
-                    "processing_time_ms": 1250.5
-                }
-            ]
-        }
+        json_schema_extra={"examples": [_CHECKPOINT_RESPONSE_EXAMPLE]}
     )
 
 
+_VAULT_SYNC_REQUEST_EXAMPLE = {
+    "sync_direction": "memories_to_vault",
+    "template_type": "learning",
+    "max_memories": 50,
+    "conflict_strategy": "safe_merge",
+    "enable_backlinks": True,
+    "enable_tag_extraction": True
+}
+
+
 class VaultSyncRequest(BaseModel):
     """Model for vault synchronization request."""
     
@@ -158,27 +188,36 @@ class VaultSyncRequest(BaseModel):
     )
     
     model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "sync_direction": "memories_to_vault",
-                    "template_type": "learning",
-                    "max_memories": 50,
-                    "conflict_strategy": "safe_merge",
-                    "enable_backlinks": True,
-                    "enable_tag_extraction": True
-                }
-            ]
-        }
+        defer_build=True,
+        json_schema_extra={"examples": [_VAULT_SYNC_REQUEST_EXAMPLE]}
     )
 
 
-class VaultSyncResponse(BaseModel):
+_VAULT_SYNC_RESPONSE_EXAMPLE = {
+    "sync_id": "223e4567-e89b-12d3-a456-426614174001",
+    "success": True,
+    "sync_direction": "memories_to_vault",
+    "notes_processed": 25,
+    "notes_created": 20,
+    "notes_updated": 5,
+    "notes_skipped": 0,
+    "conflicts_detected": 2,
+    "conflicts_resolved": 2,
+    "safety_violations": 0,
+    "average_safety_score": 0.94,
+    "processing_time_ms": 2500,
+    "errors": [],
+    "warnings": ["Template not found for 1 memory"]
+}
+
+
+class VaultSyncResponse(TrustedModel):
     """Model for vault synchronization response."""
     
-    sync_id: UUID = Field(
+    sync_id: str = Field(
         ...,
-        description="Unique sync operation identifier"
+        description="Unique sync operation identifier",
+        pattern=UUID_PATTERN
     )
     success: bool = Field(
         ...,
@@ -188,51 +227,41 @@ class VaultSyncResponse(BaseModel):
         ...,
         description="Direction of synchronization performed"
     )
-    notes_processed: int = Field(
+    notes_processed: NonNegativeInt = Field(
         ...,
-        description="Total notes processed",
-        ge=0
+        description="Total notes processed"
     )
-    notes_created: int = Field(
+    notes_created: NonNegativeInt = Field(
         ...,
-        description="Number of notes created",
-        ge=0
+        description="Number of notes created"
     )
-    notes_updated: int = Field(
+    notes_updated: NonNegativeInt = Field(
         ...,
-        description="Number of notes updated",
-        ge=0
+        description="Number of notes updated"
     )
-    notes_skipped: int = Field(
+    notes_skipped: NonNegativeInt = Field(
         ...,
-        description="Number of notes skipped",
-        ge=0
+        description="Number of notes skipped"
     )
-    conflicts_detected: int = Field(
+    conflicts_detected: NonNegativeInt = Field(
         ...,
-        description="Number of conflicts detected",
-        ge=0
+        description="Number of conflicts detected"
     )
-    conflicts_resolved: int = Field(
+    conflicts_resolved: NonNegativeInt = Field(
         ...,
-        description="Number of conflicts resolved",
-        ge=0
+        description="Number of conflicts resolved"
     )
-    safety_violations: int = Field(
+    safety_violations: NonNegativeInt = Field(
         ...,
-        description="Number of safety violations detected",
-        ge=0
+        description="Number of safety violations detected"
     )
-    average_safety_score: Decimal = Field(
+    average_safety_score: UnitInterval = Field(
         ...,
-        description="Average safety score of processed content",
-        ge=0,
-        le=1
+        description="Average safety score of processed content"
     )
-    processing_time_ms: int = Field(
+    processing_time_ms: NonNegativeInt = Field(
         ...,
-        description="Total processing time in milliseconds",
-        ge=0
+        description="Total processing time in milliseconds"
     )
     errors: List[str] = Field(
         default_factory=list,
@@ -244,34 +273,27 @@ class VaultSyncResponse(BaseModel):
     )
     
     model_config = ConfigDict(
+        defer_build=True,
         from_attributes=True,
-        json_schema_extra={
-            "examples": [
-                {
-                    "sync_id": "223e4567-e89b-12d3-a456-426614174001",
-                    "success": True,
-                    "sync_direction": "memories_to_vault",
-                    "notes_processed": 25,
-                    "notes_created": 20,
-                    "notes_updated": 5,
-                    "notes_skipped": 0,
-                    "conflicts_detected": 2,
-                    "conflicts_resolved": 2,
-                    "safety_violations": 0,
-                    "average_safety_score": 0.94,
-                    "processing_time_ms": 2500,
-                    "errors": [],
-                    "warnings": ["Template not found for 1 memory"]
-                }
-            ]
-        }
+        json_schema_extra={"examples": [_VAULT_SYNC_RESPONSE_EXAMPLE]}
     )
 
 
+_DOCUMENTATION_GENERATE_REQUEST_EXAMPLE = {
+    "doc_types": ["readme", "api", "architecture"],
+    "include_api_docs": True,
+    "include_architecture_diagrams": True,
+    "include_changelog": True,
+    "max_depth": 3,
+    "file_patterns": ["*.py", "*.js"],
+    "exclude_patterns": ["__pycache__", "node_modules"]
+}
+
+
 class DocumentationGenerateRequest(BaseModel):
     """Model for documentation generation request."""
     
-    doc_types: List[str] = Field(
+    doc_types: List[Annotated[DocType, BeforeValidator(_lowercase)]] = Field(
         ...,
         description="Types of documentation to generate",
         min_items=1
@@ -298,89 +320,91 @@ class DocumentationGenerateRequest(BaseModel):
         ge=1,
         le=10
     )
-    file_patterns: List[str] = Field(
-        default_factory=lambda: ["*.py", "*.js", "*.ts"],
+    file_patterns: Tuple[str, ...] = Field(
+        _DEFAULT_FILE_PATTERNS,
         description="File patterns to include in analysis"
     )
-    exclude_patterns: List[str] = Field(
-        default_factory=lambda: ["__pycache__", "node_modules", ".git"],
+    exclude_patterns: Tuple[str, ...] = Field(
+        _DEFAULT_EXCLUDE_PATTERNS,
         description="Patterns to exclude from analysis"
     )
-    
-    @field_validator("doc_types")
-    @classmethod
-    def validate_doc_types(cls, v):
-        """Validate documentation types."""
-        valid_types = ["readme", "api", "changelog", "architecture", "coverage"]
-        for doc_type in v:
-            if doc_type.lower() not in valid_types:
-                raise ValueError(f"Invalid documentation type: {doc_type}")
-        return [t.lower() for t in v]
+    timeout_seconds: float = Field(
+        60.0,
+        description="Maximum seconds to wait for generation; unfinished types are reported as errors",
+        gt=0,
+        le=600
+    )
     
     model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "doc_types": ["readme", "api", "architecture"],
-                    "include_api_docs": True,
-                    "include_architecture_diagrams": True,
-                    "include_changelog": True,
-                    "max_depth": 3,
-                    "file_patterns": ["*.py", "*.js"],
-                    "exclude_patterns": ["__pycache__", "node_modules"]
-                }
-            ]
-        }
+        defer_build=True,
+        json_schema_extra={"examples": [_DOCUMENTATION_GENERATE_REQUEST_EXAMPLE]}
     )
 
 
-class DocumentationFile(BaseModel):
+class DocumentationFile(TypedDict):
     """Model for a generated documentation file."""
     
-    file_path: str = Field(
-        ...,
-        description="Path to the generated file"
-    )
-    doc_type: str = Field(
-        ...,
-        description="Type of documentation"
-    )
-    size_bytes: int = Field(
-        ...,
-        description="File size in bytes",
-        ge=0
-    )
-    line_count: int = Field(
-        ...,
-        description="Number of lines in file",
-        ge=0
-    )
-    safety_validated: bool = Field(
-        ...,
-        description="Whether content passed safety validation"
-    )
-    
-    model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "file_path": "./docs/README.md",
-                    "doc_type": "readme",
-                    "size_bytes": 5432,
-                    "line_count": 142,
-                    "safety_validated": True
-                }
-            ]
+    file_path: Annotated[
+        str,
+        Field(
+            description="Path to the generated file"
+        )
+    ]
+    doc_type: Annotated[
+        str,
+        Field(
+            description="Type of documentation"
+        )
+    ]
+    size_bytes: Annotated[
+        NonNegativeInt,
+        Field(
+            description="File size in bytes"
+        )
+    ]
+    line_count: Annotated[
+        NonNegativeInt,
+        Field(
+            description="Number of lines in file"
+        )
+    ]
+    safety_validated: Annotated[
+        bool,
+        Field(
+            description="Whether content passed safety validation"
+        )
+    ]
+
+
+_DOCUMENTATION_GENERATE_RESPONSE_EXAMPLE = {
+    "generation_id": "323e4567-e89b-12d3-a456-426614174002",
+    "success": True,
+    "files_generated": [
+        {
+            "file_path": "./docs/README.md",
+            "doc_type": "readme",
+            "size_bytes": 5432,
+            "line_count": 142,
+            "safety_validated": True
         }
-    )
+    ],
+    "files_analyzed": 25,
+    "total_size_bytes": 15678,
+    "coverage_percentage": 87.5,
+    "safety_score": 0.96,
+    "processing_time_ms": 3250,
+    "errors": [],
+    "warnings": ["Some files missing docstrings"]
+}
 
 
-class DocumentationGenerateResponse(BaseModel):
+class DocumentationGenerateResponse(TrustedModel):
     """Model for documentation generation response."""
     
-    generation_id: UUID = Field(
+    generation_id: str = Field(
         ...,
-        description="Unique generation operation identifier"
+        description="Unique generation operation identifier",
+        pattern=UUID_PATTERN
     )
     success: bool = Field(
         ...,
@@ -390,15 +414,13 @@ class DocumentationGenerateResponse(BaseModel):
         ...,
         description="List of generated documentation files"
     )
-    files_analyzed: int = Field(
+    files_analyzed: NonNegativeInt = Field(
         ...,
-        description="Number of source files analyzed",
-        ge=0
+        description="Number of source files analyzed"
     )
-    total_size_bytes: int = Field(
+    total_size_bytes: NonNegativeInt = Field(
         ...,
-        description="Total size of generated files in bytes",
-        ge=0
+        description="Total size of generated files in bytes"
     )
     coverage_percentage: float = Field(
         ...,
@@ -406,16 +428,13 @@ class DocumentationGenerateResponse(BaseModel):
         ge=0,
         le=100
     )
-    safety_score: Decimal = Field(
+    safety_score: UnitInterval = Field(
         ...,
-        description="Average safety score of generated content",
-        ge=0,
-        le=1
+        description="Average safety score of generated content"
     )
-    processing_time_ms: float = Field(
+    processing_time_ms: NonNegativeInt = Field(
         ...,
-        description="Total processing time in milliseconds",
-        ge=0
+        description="Total processing time in milliseconds"
     )
     errors: List[str] = Field(
         default_factory=list,
@@ -427,80 +446,74 @@ class DocumentationGenerateResponse(BaseModel):
     )
     
     model_config = ConfigDict(
+        defer_build=True,
         from_attributes=True,
-        json_schema_extra={
-            "examples": [
-                {
-                    "generation_id": "323e4567-e89b-12d3-a456-426614174002",
-                    "success": True,
-                    "files_generated": [
-                        {
-                            "file_path": "./docs/README.md",
-                            "doc_type": "readme",
-                            "size_bytes": 5432,
-                            "line_count": 142,
-                            "safety_validated": True
-                        }
-                    ],
-                    "files_analyzed": 25,
-                    "total_size_bytes": 15678,
-                    "coverage_percentage": 87.5,
-                    "safety_score": 0.96,
-                    "processing_time_ms": 3250.8,
-                    "errors": [],
-                    "warnings": ["Some files missing docstrings"]
-                }
-            ]
-        }
+        json_schema_extra={"examples": [_DOCUMENTATION_GENERATE_RESPONSE_EXAMPLE]}
     )
 
 
-class IntegrationStatus(BaseModel):
+class IntegrationStatus(TypedDict):
     """Model for integration service status."""
     
-    service_name: str = Field(
-        ...,
-        description="Name of the integration service"
-    )
-    status: str = Field(
-        ...,
-        description="Current status (healthy, degraded, unavailable)"
-    )
-    last_check: datetime = Field(
-        ...,
-        description="Last health check timestamp"
-    )
-    response_time_ms: Optional[float] = Field(
-        None,
-        description="Response time in milliseconds",
-        ge=0
-    )
-    error_message: Optional[str] = Field(
-        None,
-        description="Error message if service is unhealthy"
-    )
-    metadata: Dict[str, Any] = Field(
-        default_factory=dict,
-        description="Additional service metadata"
-    )
-    
-    model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "service_name": "vault_sync",
-                    "status": "healthy",
-                    "last_check": "2024-01-13T10:00:00Z",
-                    "response_time_ms": 125.5,
-                    "error_message": None,
-                    "metadata": {"version": "1.0.0", "uptime_hours": 24.5}
-                }
-            ]
+    service_name: Annotated[
+        str,
+        Field(
+            description="Name of the integration service"
+        )
+    ]
+    status: Annotated[
+        str,
+        Field(
+            description="Current status (healthy, degraded, unavailable)"
+        )
+    ]
+    last_check: Annotated[
+        datetime,
+        Field(
+            description="Last health check timestamp"
+        )
+    ]
+    response_time_ms: NotRequired[Annotated[
+        Optional[float],
+        Field(
+            description="Response time in milliseconds",
+            ge=0
+        )
+    ]]
+    error_message: NotRequired[Annotated[
+        Optional[str],
+        Field(
+            description="Error message if service is unhealthy"
+        )
+    ]]
+    metadata: NotRequired[Annotated[
+        Dict[str, Any],
+        SkipValidation,
+        Field(
+            description="Additional service metadata"
+        )
+    ]]
+
+
+_INTEGRATION_STATUS_RESPONSE_EXAMPLE = {
+    "overall_status": "healthy",
+    "services": [
+        {
+            "service_name": "vault_sync",
+            "status": "healthy",
+            "last_check": "2024-01-13T10:00:00Z",
+            "response_time_ms": 125.5,
+            "error_message": None,
+            "metadata": {"version": "1.0.0"}
         }
-    )
+    ],
+    "healthy_count": 1,
+    "total_count": 1,
+    "last_updated": "2024-01-13T10:00:00Z"
+}
 
 
-class IntegrationStatusResponse(BaseModel):
+class IntegrationStatusResponse(TrustedModel):
     """Model for integration status response."""
     
     overall_status: str = Field(
@@ -511,15 +524,13 @@ class IntegrationStatusResponse(BaseModel):
         ...,
         description="Status of individual services"
     )
-    healthy_count: int = Field(
+    healthy_count: NonNegativeInt = Field(
         ...,
-        description="Number of healthy services",
-        ge=0
+        description="Number of healthy services"
     )
-    total_count: int = Field(
+    total_count: NonNegativeInt = Field(
         ...,
-        description="Total number of services",
-        ge=0
+        description="Total number of services"
     )
     last_updated: datetime = Field(
         ...,
@@ -527,80 +538,73 @@ class IntegrationStatusResponse(BaseModel):
     )
     
     model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "overall_status": "healthy",
-                    "services": [
-                        {
-                            "service_name": "vault_sync",
-                            "status": "healthy",
-                            "last_check": "2024-01-13T10:00:00Z",
-                            "response_time_ms": 125.5,
-                            "error_message": None,
-                            "metadata": {"version": "1.0.0"}
-                        }
-                    ],
-                    "healthy_count": 1,
-                    "total_count": 1,
-                    "last_updated": "2024-01-13T10:00:00Z"
-                }
-            ]
-        }
+        defer_build=True,
+        json_schema_extra={"examples": [_INTEGRATION_STATUS_RESPONSE_EXAMPLE]}
     )
 
 
-class BackgroundTaskStatus(BaseModel):
+class BackgroundTaskStatus(TypedDict):
     """Model for background task status."""
     
-    task_id: UUID = Field(
-        ...,
-        description="Unique task identifier"
-    )
-    task_type: str = Field(
-        ...,
-        description="Type of background task"
-    )
-    status: str = Field(
-        ...,
-        description="Current task status (pending, running, completed, failed)"
-    )
-    progress_percentage: float = Field(
-        ...,
-        description="Task completion percentage",
-        ge=0,
-        le=100
-    )
-    started_at: datetime = Field(
-        ...,
-        description="Task start timestamp"
-    )
-    estimated_completion: Optional[datetime] = Field(
-        None,
-        description="Estimated completion timestamp"
-    )
-    result: Optional[Dict[str, Any]] = Field(
-        None,
-        description="Task result data (if completed)"
-    )
-    error_message: Optional[str] = Field(
-        None,
-        description="Error message (if failed)"
-    )
-    
-    model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "task_id": "423e4567-e89b-12d3-a456-426614174003",
-                    "task_type": "vault_sync",
-                    "status": "running",
-                    "progress_percentage": 65.0,
-                    "started_at": "2024-01-13T10:00:00Z",
-                    "estimated_completion": "2024-01-13T10:05:00Z",
-                    "result": None,
-                    "error_message": None
-                }
-            ]
-        }
-    )
\ No newline at end of file
+    task_id: Annotated[
+        UUID,
+        Field(
+            description="Unique task identifier"
+        )
+    ]
+    task_type: Annotated[
+        str,
+        Field(
+            description="Type of background task"
+        )
+    ]
+    status: Annotated[
+        str,
+        Field(
+            description="Current task status (pending, running, completed, failed)"
+        )
+    ]
+    progress_percentage: Annotated[
+        float,
+        Field(
+            description="Task completion percentage",
+            ge=0,
+            le=100
+        )
+    ]
+    started_at: Annotated[
+        datetime,
+        Field(
+            description="Task start timestamp"
+        )
+    ]
+    estimated_completion: NotRequired[Annotated[
+        Optional[datetime],
+        Field(
+            description="Estimated completion timestamp"
+        )
+    ]]
+    result: NotRequired[Annotated[
+        Optional[Dict[str, Any]],
+        SkipValidation,
+        Field(
+            description="Task result data (if completed)"
+        )
+    ]]
+    error_message: NotRequired[Annotated[
+        Optional[str],
+        Field(
+            description="Error message (if failed)"
+        )
+    ]]
+
+
+# Validators and serializers are built on first use; request models on the
+# hot path are built up front so their first request does not pay for it
+for _model in (
+    CheckpointRequest,
+    VaultSyncRequest,
+    DocumentationGenerateRequest,
+):
+    _model.model_rebuild(force=True)
+del _model
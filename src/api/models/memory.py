@@ -6,78 +6,95 @@ search, clustering, and reinforcement endpoints.
 """
 
 from datetime import datetime
-from decimal import Decimal
 from typing import Any, Dict, List, Optional
-from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    NonNegativeInt,
+    SkipValidation,
+    StringConstraints,
+)
+from typing_extensions import Annotated, TypedDict
 
 from ...core.memory.models import MemoryType
+from .common import UUID_PATTERN, TrustedModel, UnitInterval
+
+# Memory types by value, for case-insensitive lookup without the enum
+# constructor and its exception path
+_MEMORY_TYPE_LOOKUP = {member.value: member for member in MemoryType}
+
+
+def _lower_to_enum(value: Any) -> Any:
+    """Convert a memory type string to MemoryType, ignoring case."""
+    if isinstance(value, str):
+        try:
+            return _MEMORY_TYPE_LOOKUP[value.lower()]
+        except KeyError:
+            raise ValueError(f"Invalid memory type: {value}")
+    return value
+
+
+MemoryTypeField = Annotated[MemoryType, BeforeValidator(_lower_to_enum)]
+
+# Strict strings only accept str input, so pydantic-core checks the length
+# without trying to coerce other types first
+PromptText = Annotated[str, StringConstraints(strict=True, min_length=1, max_length=5000)]
+ContentText = Annotated[str, StringConstraints(strict=True, min_length=1, max_length=50000)]
+
+
+_MEMORY_CREATE_EXAMPLE = {
+    "memory_type": "learning",
+    "prompt": "How to implement rate limiting in FastAPI?",
+    "content": "Rate limiting can be implemented using middleware...",
+    "metadata": {"tags": ["fastapi", "middleware", "rate-limiting"]}
+}
 
 
 class MemoryCreate(BaseModel):
     """Model for creating a new memory."""
     
-    memory_type: MemoryType = Field(
+    memory_type: MemoryTypeField = Field(
         ...,
         description="Type of memory (learning, decision, checkpoint)"
     )
-    prompt: str = Field(
+    prompt: PromptText = Field(
         ...,
-        description="Original prompt or trigger for the memory",
-        min_length=1,
-        max_length=5000
+        description="Original prompt or trigger for the memory"
     )
-    content: str = Field(
+    content: ContentText = Field(
         ...,
-        description="Actual memory content",
-        min_length=1,
-        max_length=50000
+        description="Actual memory content"
     )
-    metadata: Optional[Dict[str, Any]] = Field(
+    metadata: Annotated[Optional[Dict[str, Any]], SkipValidation] = Field(
         None,
         description="Additional metadata"
     )
     
-    @field_validator("memory_type", mode="before")
-    @classmethod
-    def validate_memory_type(cls, v):
-        """Convert string to MemoryType enum."""
-        if isinstance(v, str):
-            try:
-                return MemoryType(v.lower())
-            except ValueError:
-                raise ValueError(f"Invalid memory type: {v}")
-        return v
-    
     model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "memory_type": "learning",
-                    "prompt": "How to implement rate limiting in FastAPI?",
-                    "content": "Rate limiting can be implemented using middleware...",
-                    "metadata": {"tags": ["fastapi", "middleware", "rate-limiting"]}
-                }
-            ]
-        }
+        defer_build=True,
+        json_schema_extra={"examples": [_MEMORY_CREATE_EXAMPLE]}
     )
 
 
+_MEMORY_UPDATE_EXAMPLE = {
+    "content": "Updated content with new information...",
+    "metadata": {"tags": ["updated", "revised"]}
+}
+
+
 class MemoryUpdate(BaseModel):
     """Model for updating an existing memory."""
     
-    prompt: Optional[str] = Field(
+    prompt: Optional[PromptText] = Field(
         None,
-        description="Updated prompt",
-        min_length=1,
-        max_length=5000
+        description="Updated prompt"
     )
-    content: Optional[str] = Field(
+    content: Optional[ContentText] = Field(
         None,
-        description="Updated content",
-        min_length=1,
-        max_length=50000
+        description="Updated content"
     )
     metadata: Optional[Dict[str, Any]] = Field(
         None,
@@ -85,23 +102,32 @@ class MemoryUpdate(BaseModel):
     )
     
     model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "content": "Updated content with new information...",
-                    "metadata": {"tags": ["updated", "revised"]}
-                }
-            ]
-        }
+        defer_build=True,
+        json_schema_extra={"examples": [_MEMORY_UPDATE_EXAMPLE]}
     )
 
 
-class MemoryResponse(BaseModel):
+_MEMORY_RESPONSE_EXAMPLE = {
+    "memory_id": "123e4567-e89b-12d3-a456-426614174000",
+    "memory_type": "learning",
+    "abstracted_prompt": "How to implement <rate_limiting> in <framework>?",
+    "abstracted_content": "<Rate_limiting> can be implemented using <middleware>...",
+    "safety_score": 0.95,
+    "temporal_weight": 0.85,
+    "metadata": {"tags": ["api", "middleware"]},
+    "created_at": "2024-01-13T10:00:00Z",
+    "accessed_at": "2024-01-13T12:00:00Z",
+    "access_count": 5
+}
+
+
+class MemoryResponse(TrustedModel):
     """Model for memory response."""
     
-    memory_id: UUID = Field(
+    memory_id: str = Field(
         ...,
-        description="Unique memory identifier"
+        description="Unique memory identifier",
+        pattern=UUID_PATTERN
     )
     memory_type: MemoryType = Field(
         ...,
@@ -115,19 +141,15 @@ class MemoryResponse(BaseModel):
         ...,
         description="Abstracted version of the content"
     )
-    safety_score: Decimal = Field(
+    safety_score: UnitInterval = Field(
         ...,
-        description="Safety validation score",
-        ge=0,
-        le=1
+        description="Safety validation score"
     )
-    temporal_weight: Decimal = Field(
+    temporal_weight: UnitInterval = Field(
         ...,
-        description="Current temporal weight",
-        ge=0,
-        le=1
+        description="Current temporal weight"
     )
-    metadata: Dict[str, Any] = Field(
+    metadata: Annotated[Dict[str, Any], SkipValidation] = Field(
         default_factory=dict,
         description="Memory metadata"
     )
@@ -139,57 +161,45 @@ class MemoryResponse(BaseModel):
         ...,
         description="Last access timestamp"
     )
-    access_count: int = Field(
+    access_count: NonNegativeInt = Field(
         ...,
-        description="Number of times accessed",
-        ge=0
+        description="Number of times accessed"
     )
     
     model_config = ConfigDict(
+        defer_build=True,
         from_attributes=True,
-        json_schema_extra={
-            "examples": [
-                {
-                    "memory_id": "123e4567-e89b-12d3-a456-426614174000",
-                    "memory_type": "learning",
-                    "abstracted_prompt": "How to implement <rate_limiting> in <framework>?",
-                    "abstracted_content": "<Rate_limiting> can be implemented using <middleware>...",
-                    "safety_score": 0.95,
-                    "temporal_weight": 0.85,
-                    "metadata": {"tags": ["api", "middleware"]},
-                    "created_at": "2024-01-13T10:00:00Z",
-                    "accessed_at": "2024-01-13T12:00:00Z",
-                    "access_count": 5
-                }
-            ]
-        }
+        json_schema_extra={"examples": [_MEMORY_RESPONSE_EXAMPLE]}
     )
 
 
+_MEMORY_SEARCH_EXAMPLE = {
+    "query": "rate limiting implementation",
+    "memory_types": ["learning", "checkpoint"],
+    "min_safety_score": 0.8,
+    "limit": 10,
+    "enable_intent_analysis": True
+}
+
+
 class MemorySearch(BaseModel):
     """Model for memory search request."""
     
-    query: str = Field(
+    query: Annotated[str, StringConstraints(strict=True, min_length=1, max_length=1000)] = Field(
         ...,
-        description="Search query",
-        min_length=1,
-        max_length=1000
+        description="Search query"
     )
     memory_types: Optional[List[MemoryType]] = Field(
         None,
         description="Filter by memory types"
     )
-    min_safety_score: Optional[Decimal] = Field(
+    min_safety_score: Optional[UnitInterval] = Field(
         None,
-        description="Minimum safety score filter",
-        ge=0,
-        le=1
+        description="Minimum safety score filter"
     )
-    min_temporal_weight: Optional[Decimal] = Field(
+    min_temporal_weight: Optional[UnitInterval] = Field(
         None,
-        description="Minimum temporal weight filter",
-        ge=0,
-        le=1
+        description="Minimum temporal weight filter"
     )
     limit: int = Field(
         20,
@@ -207,32 +217,39 @@ class MemorySearch(BaseModel):
     )
     
     model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "query": "rate limiting implementation",
-                    "memory_types": ["learning", "checkpoint"],
-                    "min_safety_score": 0.8,
-                    "limit": 10,
-                    "enable_intent_analysis": True
-                }
-            ]
-        }
+        defer_build=True,
+        json_schema_extra={"examples": [_MEMORY_SEARCH_EXAMPLE]}
     )
 
 
-class MemorySearchResult(BaseModel):
+_MEMORY_SEARCH_RESULT_EXAMPLE = {
+    "memory": {
+        "memory_id": "123e4567-e89b-12d3-a456-426614174000",
+        "memory_type": "learning",
+        "abstracted_prompt": "How to implement <concept>?",
+        "abstracted_content": "Implementation details...",
+        "safety_score": 0.95,
+        "temporal_weight": 0.85,
+        "metadata": {},
+        "created_at": "2024-01-13T10:00:00Z",
+        "accessed_at": "2024-01-13T12:00:00Z",
+        "access_count": 5
+    },
+    "relevance_score": 0.92,
+    "match_reason": "semantic"
+}
+
+
+class MemorySearchResult(TrustedModel):
     """Model for memory search result."""
     
     memory: MemoryResponse = Field(
         ...,
         description="The memory result"
     )
-    relevance_score: float = Field(
+    relevance_score: UnitInterval = Field(
         ...,
-        description="Relevance score (0-1)",
-        ge=0,
-        le=1
+        description="Relevance score (0-1)"
     )
     match_reason: str = Field(
         ...,
@@ -240,77 +257,58 @@ class MemorySearchResult(BaseModel):
     )
     
     model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "memory": {
-                        "memory_id": "123e4567-e89b-12d3-a456-426614174000",
-                        "memory_type": "learning",
-                        "abstracted_prompt": "How to implement <concept>?",
-                        "abstracted_content": "Implementation details...",
-                        "safety_score": 0.95,
-                        "temporal_weight": 0.85,
-                        "metadata": {},
-                        "created_at": "2024-01-13T10:00:00Z",
-                        "accessed_at": "2024-01-13T12:00:00Z",
-                        "access_count": 5
-                    },
-                    "relevance_score": 0.92,
-                    "match_reason": "semantic"
-                }
-            ]
-        }
-    )
-
-
-class MemoryCluster(BaseModel):
-    """Model for memory cluster."""
-    
-    cluster_id: str = Field(
-        ...,
-        description="Unique cluster identifier"
-    )
-    centroid_memory_id: UUID = Field(
-        ...,
-        description="ID of the cluster centroid memory"
-    )
-    member_ids: List[UUID] = Field(
-        ...,
-        description="IDs of memories in this cluster"
-    )
-    cluster_theme: str = Field(
-        ...,
-        description="Abstracted theme of the cluster"
-    )
-    average_safety_score: Decimal = Field(
-        ...,
-        description="Average safety score of cluster",
-        ge=0,
-        le=1
-    )
-    size: int = Field(
-        ...,
-        description="Number of memories in cluster",
-        ge=1
+        defer_build=True,
+        json_schema_extra={"examples": [_MEMORY_SEARCH_RESULT_EXAMPLE]}
     )
+
+
+class MemoryCluster(TypedDict):
+    """Model for memory cluster."""
     
-    model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "cluster_id": "cluster_001",
-                    "centroid_memory_id": "123e4567-e89b-12d3-a456-426614174000",
-                    "member_ids": [
-                        "123e4567-e89b-12d3-a456-426614174000",
-                        "223e4567-e89b-12d3-a456-426614174001"
-                    ],
-                    "cluster_theme": "<middleware> implementation patterns",
-                    "average_safety_score": 0.92,
-                    "size": 2
-                }
-            ]
-        }
-    )
+    cluster_id: Annotated[
+        str,
+        Field(
+            description="Unique cluster identifier"
+        )
+    ]
+    centroid_memory_id: Annotated[
+        str,
+        Field(
+            description="ID of the cluster centroid memory",
+            pattern=UUID_PATTERN
+        )
+    ]
+    member_ids: Annotated[
+        List[Annotated[str, StringConstraints(pattern=UUID_PATTERN)]],
+        Field(
+            description="IDs of memories in this cluster"
+        )
+    ]
+    cluster_theme: Annotated[
+        str,
+        Field(
+            description="Abstracted theme of the cluster"
+        )
+    ]
+    average_safety_score: Annotated[
+        UnitInterval,
+        Field(
+            description="Average safety score of cluster"
+        )
+    ]
+    size: Annotated[
+        int,
+        Field(
+            description="Number of memories in cluster",
+            ge=1
+        )
+    ]
+
+
+_MEMORY_REINFORCE_EXAMPLE = {
+    "reinforcement_value": 0.2,
+    "reason": "Memory was particularly helpful in solving the problem"
+}
 
 
 class MemoryReinforce(BaseModel):
@@ -322,19 +320,22 @@ class MemoryReinforce(BaseModel):
         gt=0,
         le=1
     )
-    reason: Optional[str] = Field(
+    reason: Optional[Annotated[str, StringConstraints(strict=True, max_length=500)]] = Field(
         None,
-        description="Reason for reinforcement",
-        max_length=500
+        description="Reason for reinforcement"
     )
     
     model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "reinforcement_value": 0.2,
-                    "reason": "Memory was particularly helpful in solving the problem"
-                }
-            ]
-        }
-    )
\ No newline at end of file
+        defer_build=True,
+        json_schema_extra={"examples": [_MEMORY_REINFORCE_EXAMPLE]}
+    )
+
+
+# Validators and serializers are built on first use; request models on the
+# hot path are built up front so their first request does not pay for it
+for _model in (
+    MemoryCreate,
+    MemorySearch,
+):
+    _model.model_rebuild(force=True)
+del _model
@@ -5,16 +5,24 @@ This module provides REST endpoints for building, querying, and exporting
 knowledge graphs from memory data with safety-first design.
 """
 
+import asyncio
+import heapq
 import logging
 import time
+from collections import OrderedDict, deque
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Path as PathParam, Response, status, BackgroundTasks
 from fastapi.responses import PlainTextResponse
+from pydantic import AfterValidator
 
+from .. import serialization
 from ..dependencies import CurrentUser, get_knowledge_graph_builder
+from ..models.common import UUID_PATTERN
 from ..models.graph import (
     GraphBuildRequest,
     GraphResponse,
@@ -27,12 +35,15 @@ from ..models.graph import (
     GraphEdge
 )
 from ...services.vault.graph_builder import KnowledgeGraphBuilder
-from ...services.vault.graph_models import KnowledgeGraph
+from ...services.vault.graph_models import (
+    GraphEdge as InternalGraphEdge,
+    GraphNode as InternalGraphNode,
+    GraphQuery as InternalGraphQuery,
+    KnowledgeGraph
+)
 from ...services.vault.graph_exporters import (
     MermaidExporter,
     JSONExporter,
-    D3Exporter,
-    CytoscapeExporter,
     GraphMLExporter
 )
 
@@ -40,8 +51,144 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# In-memory graph storage (in production, this would be a proper database)
-_graph_storage: Dict[UUID, KnowledgeGraph] = {}
+# In-memory graph storage (in production, this would be a proper database),
+# keyed by the graph ID string so path parameters index it without parsing
+_graph_storage: Dict[str, KnowledgeGraph] = {}
+
+# Graph ID path parameter, lowercased to match str(UUID) storage keys
+GraphId = Annotated[
+    str,
+    AfterValidator(str.lower),
+    PathParam(description="Graph identifier", pattern=UUID_PATTERN)
+]
+
+# Derived per-graph data, valid while the graph's updated_at is unchanged
+_graph_cache: Dict[UUID, Dict[str, Any]] = {}
+
+# Serialized subgraph results keyed by (graph ID, graph version, request);
+# a mutation bumps updated_at so stale entries are never hit again and
+# simply age out of the LRU order
+_SUBGRAPH_CACHE_SIZE = 1024
+_subgraph_cache: "OrderedDict[Tuple[Any, ...], bytes]" = OrderedDict()
+
+# Serialized graph listing as (expiry, body); cleared when graphs are
+# built or deleted and otherwise refreshed after a short TTL so polling
+# clients do not re-serialize the listing on every request
+_LIST_CACHE_TTL_SECONDS = 10.0
+_graph_list_cache: Optional[Tuple[float, bytes]] = None
+
+
+# Export functions by format; exporters are stateless apart from counters,
+# so one instance of each serves every request. D3 and Cytoscape are
+# variants of the JSON exporter, and JSON content is emitted compact since
+# it is embedded in the response body.
+_json_exporter = JSONExporter()
+_EXPORTERS: Dict[str, Callable[[KnowledgeGraph], str]] = {
+    "mermaid": MermaidExporter().export_graph,
+    "json": partial(_json_exporter.export_graph, pretty_print=False),
+    "d3": partial(_json_exporter.export_graph, format_type="d3", pretty_print=False),
+    "cytoscape": partial(
+        _json_exporter.export_graph, format_type="cytoscape", pretty_print=False
+    ),
+    "graphml": GraphMLExporter().export_graph,
+}
+
+# Attributes copied verbatim from internal graph models to API models
+_NODE_FIELDS = (
+    "node_type",
+    "title_pattern",
+    "description_pattern",
+    "is_validated",
+    "created_at",
+    "centrality_score",
+    "source_type",
+    "source_file",
+)
+_EDGE_FIELDS = (
+    "edge_type",
+    "weight",
+    "confidence",
+    "explanation_pattern",
+    "temporal_distance_hours",
+    "temporal_weight",
+    "is_bidirectional",
+)
+_node_values = attrgetter(*_NODE_FIELDS)
+_edge_values = attrgetter(*_EDGE_FIELDS)
+
+
+def _to_api_node(node: InternalGraphNode) -> GraphNode:
+    """Convert a trusted internal node to its API model without validation."""
+    return GraphNode.model_construct(
+        node_id=str(node.node_id),
+        safety_score=float(node.safety_score),
+        **dict(zip(_NODE_FIELDS, _node_values(node)))
+    )
+
+
+def _to_api_edge(edge: InternalGraphEdge) -> GraphEdge:
+    """Convert a trusted internal edge to its API model without validation."""
+    return GraphEdge.model_construct(
+        edge_id=str(edge.edge_id),
+        source_node_id=str(edge.source_node_id),
+        target_node_id=str(edge.target_node_id),
+        safety_score=float(edge.safety_score),
+        **dict(zip(_EDGE_FIELDS, _edge_values(edge)))
+    )
+
+
+def _cache_entry(graph: KnowledgeGraph) -> Dict[str, Any]:
+    """Get the cache entry for a graph, recomputing metrics if it changed."""
+    entry = _graph_cache.get(graph.graph_id)
+    if entry is None or entry["updated_at"] != graph.updated_at:
+        entry = {
+            "updated_at": graph.updated_at,
+            "metrics": graph.calculate_metrics()
+        }
+        _graph_cache[graph.graph_id] = entry
+    return entry
+
+
+def _graph_response(graph: KnowledgeGraph) -> GraphResponse:
+    """Build the metadata response for a graph, reusing the cached one."""
+    entry = _cache_entry(graph)
+    response = entry.get("response")
+    if response is None:
+        response = GraphResponse(
+            graph_id=str(graph.graph_id),
+            name=graph.name,
+            description=graph.description,
+            metrics=entry["metrics"],
+            created_at=graph.created_at,
+            updated_at=graph.updated_at
+        )
+        entry["response"] = response
+    return response
+
+
+def _invalidate_graph_list() -> None:
+    """Drop the cached graph listing after graphs are added or removed."""
+    global _graph_list_cache
+    _graph_list_cache = None
+
+
+def _graph_summary(graph: KnowledgeGraph) -> Dict[str, Any]:
+    """Build the list entry for a graph, reusing the cached one."""
+    entry = _cache_entry(graph)
+    summary = entry.get("summary")
+    if summary is None:
+        summary = {
+            "graph_id": graph.graph_id,
+            "name": graph.name,
+            "description": graph.description,
+            "node_count": graph.node_count,
+            "edge_count": graph.edge_count,
+            "created_at": graph.created_at,
+            "updated_at": graph.updated_at,
+            "average_safety_score": entry["metrics"].get("average_safety_score", 1.0)
+        }
+        entry["summary"] = summary
+    return summary
 
 
 @router.post(
@@ -55,7 +202,7 @@ async def build_graph(
     background_tasks: BackgroundTasks,
     current_user: CurrentUser,
     graph_builder: KnowledgeGraphBuilder = Depends(get_knowledge_graph_builder),
-) -> GraphResponse:
+) -> Response:
     """Build a knowledge graph from memories and code."""
     try:
         logger.info(f"Building graph for user {current_user['sub']} with {request.max_memories} max memories")
@@ -64,17 +211,22 @@ async def build_graph(
         code_paths = None
         if request.code_paths:
             code_paths = [Path(path) for path in request.code_paths]
-            # Validate paths exist
-            for path in code_paths:
-                if not path.exists():
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Code path does not exist: {path}"
-                    )
+            # Validate paths exist, with the filesystem checks off the event loop
+            missing = await asyncio.to_thread(
+                lambda: [str(path) for path in code_paths if not path.exists()]
+            )
+            if missing:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Code paths do not exist: {', '.join(missing[:5])}"
+                )
         
         # Build the graph
         graph = await graph_builder.build_graph(
-            memory_ids=request.memory_ids,
+            memory_ids=(
+                [UUID(memory_id) for memory_id in request.memory_ids]
+                if request.memory_ids else None
+            ),
             code_paths=code_paths,
             max_memories=request.max_memories,
             include_related=request.include_related,
@@ -82,28 +234,22 @@ async def build_graph(
         )
         
         # Store graph in memory (in production, save to database)
-        _graph_storage[graph.graph_id] = graph
+        _graph_storage[str(graph.graph_id)] = graph
+        _graph_cache.pop(graph.graph_id, None)
+        _invalidate_graph_list()
         
-        # Calculate metrics
-        metrics = graph.calculate_metrics()
-        
-        # Create response
-        response = GraphResponse(
-            graph_id=graph.graph_id,
-            name=graph.name,
-            description=graph.description,
-            metrics=metrics,
-            created_at=graph.created_at,
-            updated_at=graph.updated_at
-        )
+        # Calculate metrics and create response
+        response = _graph_response(graph)
         
         logger.info(
             f"Graph built successfully: {graph.node_count} nodes, "
             f"{graph.edge_count} edges in {graph.build_time_ms:.1f}ms"
         )
         
-        return response
+        return serialization.model_response(response)
         
+    except HTTPException:
+        raise
     except ValueError as e:
         logger.warning(f"Graph build validation error: {e}")
         raise HTTPException(
@@ -125,9 +271,9 @@ async def build_graph(
     description="Retrieve knowledge graph metadata and statistics"
 )
 async def get_graph(
-    graph_id: UUID,
+    graph_id: GraphId,
     current_user: CurrentUser,
-) -> GraphResponse:
+) -> Response:
     """Get knowledge graph metadata."""
     try:
         # Retrieve graph from storage
@@ -139,19 +285,8 @@ async def get_graph(
         
         graph = _graph_storage[graph_id]
         
-        # Calculate current metrics
-        metrics = graph.calculate_metrics()
-        
-        response = GraphResponse(
-            graph_id=graph.graph_id,
-            name=graph.name,
-            description=graph.description,
-            metrics=metrics,
-            created_at=graph.created_at,
-            updated_at=graph.updated_at
-        )
-        
-        return response
+        # Metrics are recalculated only when the graph has changed
+        return serialization.model_response(_graph_response(graph))
         
     except HTTPException:
         raise
@@ -170,11 +305,11 @@ async def get_graph(
     description="Query a knowledge graph with semantic and structural filters"
 )
 async def query_graph(
-    graph_id: UUID,
+    graph_id: GraphId,
     query: GraphQuery,
     current_user: CurrentUser,
     graph_builder: KnowledgeGraphBuilder = Depends(get_knowledge_graph_builder),
-) -> GraphQueryResult:
+) -> Response:
     """Query a knowledge graph with filters."""
     try:
         # Retrieve graph from storage
@@ -186,61 +321,19 @@ async def query_graph(
         
         graph = _graph_storage[graph_id]
         
-        # Convert Pydantic models to internal models
-        from ...services.vault.graph_models import GraphQuery as InternalGraphQuery
-        
-        internal_query = InternalGraphQuery(
-            node_types=query.node_types,
-            edge_types=query.edge_types,
-            min_node_safety_score=query.min_node_safety_score,
-            min_edge_weight=query.min_edge_weight,
-            min_edge_confidence=query.min_edge_confidence,
-            node_content_pattern=query.node_content_pattern,
-            node_created_after=query.node_created_after,
-            max_nodes=query.max_nodes,
-            max_edges=query.max_edges,
-            sort_by=query.sort_by,
-            sort_descending=query.sort_descending
-        )
+        # The API query's fields are a subset of the internal query's, so
+        # copy them across by name
+        internal_query = InternalGraphQuery(**dict(query))
         
         # Execute query
         result = await graph_builder.query_graph(graph, internal_query)
         
-        # Convert results to API models
-        api_nodes = []
-        for node in result.nodes:
-            api_node = GraphNode(
-                node_id=node.node_id,
-                node_type=node.node_type,
-                title_pattern=node.title_pattern,
-                description_pattern=node.description_pattern,
-                safety_score=node.safety_score,
-                is_validated=node.is_validated,
-                created_at=node.created_at,
-                centrality_score=node.centrality_score,
-                source_type=node.source_type,
-                source_file=node.source_file
-            )
-            api_nodes.append(api_node)
-        
-        api_edges = []
-        for edge in result.edges:
-            api_edge = GraphEdge(
-                edge_id=edge.edge_id,
-                source_node_id=edge.source_node_id,
-                target_node_id=edge.target_node_id,
-                edge_type=edge.edge_type,
-                weight=edge.weight,
-                confidence=edge.confidence,
-                explanation_pattern=edge.explanation_pattern,
-                temporal_distance_hours=edge.temporal_distance_hours,
-                temporal_weight=edge.temporal_weight,
-                safety_score=edge.safety_score,
-                is_bidirectional=edge.is_bidirectional
-            )
-            api_edges.append(api_edge)
+        # Convert results to API models; graph contents were validated when
+        # the graph was built, so skip re-running field validators
+        api_nodes = [_to_api_node(node) for node in result.nodes]
+        api_edges = [_to_api_edge(edge) for edge in result.edges]
         
-        response = GraphQueryResult(
+        response = GraphQueryResult.model_construct(
             nodes=api_nodes,
             edges=api_edges,
             query_time_ms=result.query_time_ms,
@@ -253,7 +346,7 @@ async def query_graph(
             f"{len(api_edges)} edges in {result.query_time_ms:.1f}ms"
         )
         
-        return response
+        return serialization.model_response(response)
         
     except HTTPException:
         raise
@@ -272,10 +365,10 @@ async def query_graph(
     description="Export knowledge graph in various formats (Mermaid, JSON, GraphML, etc.)"
 )
 async def export_graph(
-    graph_id: UUID,
+    graph_id: GraphId,
     export_request: GraphExportRequest,
     current_user: CurrentUser,
-) -> GraphExportResult:
+) -> Response:
     """Export knowledge graph in specified format."""
     try:
         start_time = time.time()
@@ -290,73 +383,63 @@ async def export_graph(
         graph = _graph_storage[graph_id]
         
         # Filter graph if requested
-        if export_request.max_nodes or export_request.filter_by_centrality:
-            nodes_to_include = list(graph.nodes.values())
-            
-            # Filter by centrality if specified
-            if export_request.filter_by_centrality:
-                nodes_to_include = [
-                    n for n in nodes_to_include 
-                    if n.centrality_score and n.centrality_score >= export_request.filter_by_centrality
-                ]
+        min_centrality = export_request.filter_by_centrality
+        if export_request.max_nodes or min_centrality:
+            candidates = graph.nodes.values()
+            if min_centrality:
+                candidates = (
+                    n for n in candidates
+                    if n.centrality_score and n.centrality_score >= min_centrality
+                )
             
-            # Limit nodes if specified
-            if export_request.max_nodes and len(nodes_to_include) > export_request.max_nodes:
-                # Sort by centrality and take top nodes
-                nodes_to_include.sort(key=lambda n: n.centrality_score or 0, reverse=True)
-                nodes_to_include = nodes_to_include[:export_request.max_nodes]
+            # Limit nodes if specified, keeping the most central ones
+            if export_request.max_nodes:
+                nodes_to_include = heapq.nlargest(
+                    export_request.max_nodes,
+                    candidates,
+                    key=lambda n: n.centrality_score or 0
+                )
+            else:
+                nodes_to_include = list(candidates)
             
-            # Filter edges to only include those between included nodes
+            # Collect edges between included nodes from their incident edges,
+            # taking each edge once at its source node
             node_ids = {n.node_id for n in nodes_to_include}
             edges_to_include = [
-                e for e in graph.edges.values()
-                if e.source_node_id in node_ids and e.target_node_id in node_ids
+                edge
+                for node_id in node_ids
+                for neighbor_id, edge in graph.get_incident_edges(node_id)
+                if edge.source_node_id == node_id and neighbor_id in node_ids
             ]
+            
+            source_graph = graph.subgraph(
+                nodes_to_include,
+                edges_to_include,
+                name=f"{graph.name}_filtered",
+                description=f"Filtered export of {graph.name}"
+            )
         else:
-            nodes_to_include = list(graph.nodes.values())
-            edges_to_include = list(graph.edges.values())
+            # Unfiltered exports read the stored graph directly
+            source_graph = graph
         
         # Select appropriate exporter
-        exporter = None
-        if export_request.format == "mermaid":
-            exporter = MermaidExporter()
-        elif export_request.format == "json":
-            exporter = JSONExporter()
-        elif export_request.format == "d3":
-            exporter = D3Exporter()
-        elif export_request.format == "cytoscape":
-            exporter = CytoscapeExporter()
-        elif export_request.format == "graphml":
-            exporter = GraphMLExporter()
-        else:
+        export = _EXPORTERS.get(export_request.format)
+        if export is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Unsupported export format: {export_request.format}"
             )
         
-        # Create temporary filtered graph for export
-        filtered_graph = KnowledgeGraph(
-            name=f"{graph.name}_filtered",
-            description=f"Filtered export of {graph.name}"
-        )
-        
-        for node in nodes_to_include:
-            filtered_graph.add_node(node)
-        
-        for edge in edges_to_include:
-            filtered_graph.add_edge(edge)
-        
-        # Export graph
-        exported_content = await exporter.export_graph(
-            filtered_graph,
-            include_metadata=export_request.include_metadata
-        )
+        # Exporters are synchronous and CPU-bound, so run them off the event loop
+        exported_content = await asyncio.to_thread(export, source_graph)
         
         # Validate safety of exported content
         safety_validated = True
         try:
-            # Simple safety check - ensure no concrete references leaked
-            if "<" not in exported_content or ">" not in exported_content:
+            # Simple safety check - ensure abstraction placeholders are present;
+            # both searches stop at the first match instead of scanning the export
+            placeholder_start = exported_content.find("<")
+            if placeholder_start == -1 or exported_content.find(">", placeholder_start + 1) == -1:
                 logger.warning("Exported content may not be properly abstracted")
                 safety_validated = False
         except Exception as e:
@@ -368,19 +451,19 @@ async def export_graph(
         response = GraphExportResult(
             format=export_request.format,
             content=exported_content,
-            node_count=len(nodes_to_include),
-            edge_count=len(edges_to_include),
+            node_count=len(source_graph.nodes),
+            edge_count=len(source_graph.edges),
             export_time_ms=export_time_ms,
             safety_validated=safety_validated
         )
         
         logger.info(
             f"Graph exported in {export_request.format} format: "
-            f"{len(nodes_to_include)} nodes, {len(edges_to_include)} edges, "
+            f"{len(source_graph.nodes)} nodes, {len(source_graph.edges)} edges, "
             f"{export_time_ms:.1f}ms"
         )
         
-        return response
+        return serialization.model_response(response)
         
     except HTTPException:
         raise
@@ -399,10 +482,10 @@ async def export_graph(
     description="Extract a subgraph around a specific node with configurable depth"
 )
 async def get_subgraph(
-    graph_id: UUID,
+    graph_id: GraphId,
     subgraph_request: SubgraphRequest,
     current_user: CurrentUser,
-) -> GraphQueryResult:
+) -> Response:
     """Extract a subgraph around a specific node."""
     try:
         start_time = time.time()
@@ -417,91 +500,78 @@ async def get_subgraph(
         graph = _graph_storage[graph_id]
         
         # Check if center node exists
-        if subgraph_request.center_node_id not in graph.nodes:
+        center_node_id = UUID(subgraph_request.center_node_id)
+        if center_node_id not in graph.nodes:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Center node not found in graph"
             )
         
-        # Extract subgraph using breadth-first search
-        visited_nodes = set()
+        # Repeat requests against an unchanged graph reuse the serialized result
+        cache_key = (
+            graph_id,
+            graph.updated_at,
+            center_node_id,
+            subgraph_request.max_depth,
+            subgraph_request.max_nodes,
+            subgraph_request.min_edge_weight,
+            tuple(subgraph_request.include_edge_types or ())
+        )
+        cached = _subgraph_cache.get(cache_key)
+        if cached is not None:
+            _subgraph_cache.move_to_end(cache_key)
+            return Response(content=cached, media_type="application/json")
+        
+        # Breadth-first search over incident edges; request fields and
+        # graph lookups are bound to locals for the inner loop
+        min_edge_weight = subgraph_request.min_edge_weight
+        include_edge_types = frozenset(subgraph_request.include_edge_types or ())
+        max_depth = subgraph_request.max_depth
+        max_nodes = subgraph_request.max_nodes
+        nodes = graph.nodes
+        incident_edges = graph.get_incident_edges
+        
+        def passes(edge: InternalGraphEdge) -> bool:
+            if edge.weight < min_edge_weight:
+                return False
+            return not include_edge_types or edge.edge_type in include_edge_types
+        
+        visited_nodes = {center_node_id}
         nodes_to_include = []
-        edges_to_include = []
         
         # Queue for BFS: (node_id, depth)
-        queue = [(subgraph_request.center_node_id, 0)]
-        visited_nodes.add(subgraph_request.center_node_id)
+        queue = deque([(center_node_id, 0)])
         
-        while queue and len(nodes_to_include) < subgraph_request.max_nodes:
-            current_node_id, depth = queue.pop(0)
-            current_node = graph.nodes[current_node_id]
-            nodes_to_include.append(current_node)
+        while queue and len(nodes_to_include) < max_nodes:
+            current_node_id, depth = queue.popleft()
+            nodes_to_include.append(nodes[current_node_id])
             
-            # If we haven't reached max depth, explore neighbors
-            if depth < subgraph_request.max_depth:
-                for edge in graph.edges.values():
-                    # Check edge weight threshold
-                    if edge.weight < subgraph_request.min_edge_weight:
-                        continue
-                    
-                    # Check edge type filter
-                    if (subgraph_request.include_edge_types and 
-                        edge.edge_type not in subgraph_request.include_edge_types):
-                        continue
-                    
-                    neighbor_id = None
-                    if edge.source_node_id == current_node_id:
-                        neighbor_id = edge.target_node_id
-                    elif edge.target_node_id == current_node_id:
-                        neighbor_id = edge.source_node_id
-                    
-                    if neighbor_id and neighbor_id not in visited_nodes:
-                        if neighbor_id in graph.nodes:
-                            queue.append((neighbor_id, depth + 1))
-                            visited_nodes.add(neighbor_id)
-                    
-                    # Include edge if both nodes are in subgraph
-                    if (edge.source_node_id in visited_nodes and 
-                        edge.target_node_id in visited_nodes):
-                        edges_to_include.append(edge)
-        
-        # Convert to API models
-        api_nodes = []
+            # Explore neighbors until max depth is reached
+            if depth < max_depth:
+                for neighbor_id, edge in incident_edges(current_node_id):
+                    if neighbor_id not in visited_nodes and passes(edge):
+                        queue.append((neighbor_id, depth + 1))
+                        visited_nodes.add(neighbor_id)
+        
+        # Edges are collected from the final node set, since queued nodes
+        # past max_nodes were visited but never included
+        included_ids = {node.node_id for node in nodes_to_include}
+        seen_edges = set()
+        edges_to_include = []
         for node in nodes_to_include:
-            api_node = GraphNode(
-                node_id=node.node_id,
-                node_type=node.node_type,
-                title_pattern=node.title_pattern,
-                description_pattern=node.description_pattern,
-                safety_score=node.safety_score,
-                is_validated=node.is_validated,
-                created_at=node.created_at,
-                centrality_score=node.centrality_score,
-                source_type=node.source_type,
-                source_file=node.source_file
-            )
-            api_nodes.append(api_node)
-        
-        api_edges = []
-        for edge in edges_to_include:
-            api_edge = GraphEdge(
-                edge_id=edge.edge_id,
-                source_node_id=edge.source_node_id,
-                target_node_id=edge.target_node_id,
-                edge_type=edge.edge_type,
-                weight=edge.weight,
-                confidence=edge.confidence,
-                explanation_pattern=edge.explanation_pattern,
-                temporal_distance_hours=edge.temporal_distance_hours,
-                temporal_weight=edge.temporal_weight,
-                safety_score=edge.safety_score,
-                is_bidirectional=edge.is_bidirectional
-            )
-            api_edges.append(api_edge)
+            for neighbor_id, edge in incident_edges(node.node_id):
+                if (neighbor_id in included_ids and edge.edge_id not in seen_edges
+                        and passes(edge)):
+                    seen_edges.add(edge.edge_id)
+                    edges_to_include.append(edge)
+        
+        # Convert to API models (trusted graph contents, no re-validation)
+        api_nodes = [_to_api_node(node) for node in nodes_to_include]
+        api_edges = [_to_api_edge(edge) for edge in edges_to_include]
         
         query_time_ms = (time.time() - start_time) * 1000
         
-        response = GraphQueryResult(
+        response = GraphQueryResult.model_construct(
             nodes=api_nodes,
             edges=api_edges,
             query_time_ms=query_time_ms,
@@ -514,7 +584,12 @@ async def get_subgraph(
             f"{len(api_edges)} edges in {query_time_ms:.1f}ms"
         )
         
-        return response
+        body = response.model_dump_json().encode()
+        _subgraph_cache[cache_key] = body
+        if len(_subgraph_cache) > _SUBGRAPH_CACHE_SIZE:
+            _subgraph_cache.popitem(last=False)
+        
+        return Response(content=body, media_type="application/json")
         
     except HTTPException:
         raise
@@ -533,27 +608,22 @@ async def get_subgraph(
 )
 async def list_graphs(
     current_user: CurrentUser,
-) -> Dict[str, Any]:
+) -> Response:
     """List available knowledge graphs."""
+    global _graph_list_cache
     try:
-        graphs = []
-        for graph_id, graph in _graph_storage.items():
-            metrics = graph.calculate_metrics()
-            graphs.append({
-                "graph_id": graph_id,
-                "name": graph.name,
-                "description": graph.description,
-                "node_count": graph.node_count,
-                "edge_count": graph.edge_count,
-                "created_at": graph.created_at,
-                "updated_at": graph.updated_at,
-                "average_safety_score": metrics.average_safety_score
-            })
+        now = time.monotonic()
+        if _graph_list_cache is not None and _graph_list_cache[0] > now:
+            return Response(content=_graph_list_cache[1], media_type="application/json")
         
-        return {
+        graphs = [_graph_summary(graph) for graph in _graph_storage.values()]
+        body = serialization.dumps_bytes({
             "graphs": graphs,
             "total_count": len(graphs)
-        }
+        })
+        _graph_list_cache = (now + _LIST_CACHE_TTL_SECONDS, body)
+        
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Failed to list graphs: {e}")
@@ -569,7 +639,7 @@ async def list_graphs(
     description="Delete a knowledge graph and all associated data"
 )
 async def delete_graph(
-    graph_id: UUID,
+    graph_id: GraphId,
     current_user: CurrentUser,
 ) -> Dict[str, str]:
     """Delete a knowledge graph."""
@@ -582,12 +652,14 @@ async def delete_graph(
         
         # Remove graph from storage
         graph = _graph_storage.pop(graph_id)
+        _graph_cache.pop(graph.graph_id, None)
+        _invalidate_graph_list()
         
         logger.info(f"Graph {graph_id} ({graph.name}) deleted by user {current_user['sub']}")
         
         return {
             "message": "Graph deleted successfully",
-            "graph_id": str(graph_id)
+            "graph_id": graph_id
         }
         
     except HTTPException:
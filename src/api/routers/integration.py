@@ -6,17 +6,26 @@ like vault sync, documentation generation, and checkpoint management.
 """
 
 import logging
+import os
 import time
 import asyncio
+from collections import OrderedDict
 from datetime import datetime
+from itertools import islice
+from math import fsum
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status, BackgroundTasks
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 
+from .. import serialization
 from ..dependencies import (
     CurrentUser, 
+    get_current_user,
     get_vault_sync_engine, 
     get_documentation_generator,
     get_memory_repository
@@ -40,10 +49,70 @@ from ...services.vault.models import SyncDirection
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+# Every integration endpoint requires an authenticated user; routes that
+# need the user's claims still declare CurrentUser, which FastAPI resolves
+# once per request
+router = APIRouter(dependencies=[Depends(get_current_user)])
+
+# Safety score accessor for C-level reductions over memories
+_safety_score = attrgetter("safety_score")
 
 # In-memory task storage (in production, this would be a proper task queue)
-_background_tasks: Dict[UUID, BackgroundTaskStatus] = {}
+_background_tasks: "OrderedDict[UUID, BackgroundTaskStatus]" = OrderedDict()
+
+# Tasks are kept in least-recently-used order up to a fixed count, and
+# finished tasks are dropped once they have been done for the TTL
+_MAX_BACKGROUND_TASKS = 10_000
+_FINISHED_TASK_TTL_SECONDS = 3600.0
+_task_finished_at: Dict[UUID, float] = {}
+
+
+def _put_task(task_id: UUID, task_status: BackgroundTaskStatus) -> None:
+    """Store a task, evicting expired finished tasks and any beyond the cap."""
+    _background_tasks[task_id] = task_status
+    _background_tasks.move_to_end(task_id)
+    
+    # Expired tasks are swept from the least recently used end, stopping
+    # at the first task that is still live
+    expired_before = time.monotonic() - _FINISHED_TASK_TTL_SECONDS
+    while _background_tasks:
+        oldest_id = next(iter(_background_tasks))
+        finished_at = _task_finished_at.get(oldest_id)
+        if finished_at is None or finished_at > expired_before:
+            break
+        _evict_task(oldest_id)
+    
+    while len(_background_tasks) > _MAX_BACKGROUND_TASKS:
+        _evict_task(next(iter(_background_tasks)))
+
+
+def _evict_task(task_id: UUID) -> None:
+    """Remove a task and its bookkeeping."""
+    _background_tasks.pop(task_id, None)
+    _task_finished_at.pop(task_id, None)
+
+
+def _finish_task(
+    task_id: UUID,
+    task_status: BackgroundTaskStatus,
+    final_status: str,
+    **fields: Any
+) -> None:
+    """Move a task to a terminal status in one write and start its retention clock."""
+    task_status.update(status=final_status, **fields)
+    
+    # A task evicted by the cap while running has nothing left to expire
+    if task_id in _background_tasks:
+        _task_finished_at[task_id] = time.monotonic()
+
+
+def _dict_response(data: Dict[str, Any], status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize a plain payload with the fast JSON backend."""
+    return Response(
+        content=serialization.dumps_bytes(data),
+        status_code=status_code,
+        media_type="application/json"
+    )
 
 
 @router.post(
@@ -57,18 +126,30 @@ async def create_checkpoint(
     background_tasks: BackgroundTasks,
     current_user: CurrentUser,
     memory_repository: SafeMemoryRepository = Depends(get_memory_repository),
-) -> CheckpointResponse:
+) -> Response:
     """Create a memory checkpoint."""
+    # Filters skip model validation; only their shape is checked here
+    if request.memory_filters is not None and not isinstance(request.memory_filters, dict):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Memory filters must be a JSON object"
+        )
+    
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         logger.info(f"Creating checkpoint '{request.checkpoint_name}' for user {current_user['sub']}")
         
-        # Get memories based on filters
+        # The repository has no filtered query yet, so filters are reported
+        # back rather than silently dropped
+        warnings = []
         if request.memory_filters:
-            # In a full implementation, we would apply complex filters
-            memories = await memory_repository.get_recent_memories(limit=request.max_memories)
-        else:
-            memories = await memory_repository.get_recent_memories(limit=request.max_memories)
+            warnings.append("Memory filters are not supported yet; recent memories were used")
+            logger.warning(
+                f"Ignoring {len(request.memory_filters)} memory filter(s) "
+                f"for checkpoint '{request.checkpoint_name}'"
+            )
+        
+        memories = await memory_repository.get_recent_memories(limit=request.max_memories)
         
         # Simulate checkpoint creation
         checkpoint_id = uuid4()
@@ -82,11 +163,11 @@ async def create_checkpoint(
         
         # Calculate average safety score
         if memories:
-            avg_safety = sum(float(m.safety_score) for m in memories) / len(memories)
+            avg_safety = fsum(map(float, map(_safety_score, memories))) / len(memories)
         else:
             avg_safety = 1.0
         
-        processing_time_ms = (time.time() - start_time) * 1000
+        processing_time_ms = int((time.perf_counter() - start_time) * 1000)
         
         # In a full implementation, we would:
         # 1. Create a snapshot of memories in the database
@@ -94,23 +175,24 @@ async def create_checkpoint(
         # 3. Optionally run code analysis
         # 4. Generate checkpoint report
         
-        response = CheckpointResponse(
-            checkpoint_id=checkpoint_id,
+        response = CheckpointResponse.from_trusted(
+            checkpoint_id=str(checkpoint_id),
             name=request.checkpoint_name,
             description=request.description,
             memories_included=memories_included,
             files_analyzed=files_analyzed,
             safety_score=avg_safety,
             created_at=datetime.now(),
-            processing_time_ms=processing_time_ms
+            processing_time_ms=processing_time_ms,
+            warnings=warnings
         )
         
         logger.info(
             f"Checkpoint created: {memories_included} memories, "
-            f"{files_analyzed} files in {processing_time_ms:.1f}ms"
+            f"{files_analyzed} files in {processing_time_ms}ms"
         )
         
-        return response
+        return serialization.model_response(response)
         
     except Exception as e:
         logger.error(f"Checkpoint creation failed: {e}")
@@ -120,9 +202,17 @@ async def create_checkpoint(
         )
 
 
+# Sync directions the vault sync endpoint can run
+_SUPPORTED_SYNC_DIRECTIONS = frozenset({
+    SyncDirection.MEMORIES_TO_VAULT,
+    SyncDirection.VAULT_TO_MEMORIES,
+})
+
+
 @router.post(
     "/vault/sync",
     response_model=VaultSyncResponse,
+    responses={status.HTTP_202_ACCEPTED: {"model": BackgroundTaskStatus}},
     summary="Trigger vault synchronization",
     description="Sync memories to/from Obsidian vault with configurable options"
 )
@@ -131,65 +221,32 @@ async def sync_vault(
     background_tasks: BackgroundTasks,
     current_user: CurrentUser,
     vault_sync_engine: VaultSyncEngine = Depends(get_vault_sync_engine),
-) -> VaultSyncResponse:
+    run_in_background: bool = Query(
+        False,
+        description="Queue the sync and return 202 with a task to poll"
+    ),
+) -> Response:
     """Trigger vault synchronization."""
+    if request.sync_direction not in _SUPPORTED_SYNC_DIRECTIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported sync direction: {request.sync_direction}"
+        )
+    
     try:
         logger.info(
             f"Starting vault sync ({request.sync_direction}) for user {current_user['sub']} "
             f"with {request.max_memories} max memories"
         )
         
-        sync_id = uuid4()
-        
-        if request.sync_direction == SyncDirection.MEMORIES_TO_VAULT:
-            # Sync memories to vault
-            sync_result = await vault_sync_engine.sync_memories_to_vault(
-                memory_ids=request.memory_ids,
-                template_type=request.template_type,
-                max_memories=request.max_memories
-            )
-        elif request.sync_direction == SyncDirection.VAULT_TO_MEMORIES:
-            # Sync vault to memories
-            vault_files = None
-            if request.vault_files:
-                vault_files = [Path(f) for f in request.vault_files]
-            
-            sync_result = await vault_sync_engine.sync_vault_to_memories(
-                vault_files=vault_files
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Unsupported sync direction: {request.sync_direction}"
+        if run_in_background:
+            return _queue_background_task(
+                background_tasks, "vault_sync", _run_vault_sync, request, vault_sync_engine
             )
         
-        # Convert sync result to API response
-        response = VaultSyncResponse(
-            sync_id=sync_id,
-            success=sync_result.success,
-            sync_direction=request.sync_direction,
-            notes_processed=sync_result.notes_processed,
-            notes_created=sync_result.notes_created,
-            notes_updated=sync_result.notes_updated,
-            notes_skipped=sync_result.notes_skipped,
-            conflicts_detected=sync_result.conflicts_detected,
-            conflicts_resolved=sync_result.conflicts_resolved,
-            safety_violations=sync_result.safety_violations,
-            average_safety_score=sync_result.average_safety_score,
-            processing_time_ms=sync_result.processing_time_ms,
-            errors=sync_result.errors,
-            warnings=sync_result.warnings
-        )
+        response = await _run_vault_sync(request, vault_sync_engine)
+        return serialization.model_response(response)
         
-        logger.info(
-            f"Vault sync completed: {sync_result.notes_created} created, "
-            f"{sync_result.notes_updated} updated, {sync_result.conflicts_detected} conflicts"
-        )
-        
-        return response
-        
-    except HTTPException:
-        raise
     except Exception as e:
         logger.error(f"Vault sync failed: {e}")
         raise HTTPException(
@@ -198,9 +255,47 @@ async def sync_vault(
         )
 
 
+# Simulated output per documentation type: file name, size in bytes, line
+# count and number of source files analyzed
+_DOC_SPECS: Dict[str, Tuple[str, int, int, int]] = {
+    "readme": ("README.md", 5432, 142, 25),
+    "api": ("API.md", 8765, 234, 0),
+    "architecture": ("ARCHITECTURE.md", 3210, 89, 0),
+    "changelog": ("CHANGELOG.md", 2156, 67, 0),
+    "coverage": ("COVERAGE.md", 1876, 45, 0),
+}
+
+
+# Highest coverage percentage the simulated report claims
+_COVERAGE_CAP = 95.0
+
+
+def _output_dir(doc_request: DocumentationGenerateRequest) -> str:
+    """Normalize the request's output directory once for every file path."""
+    return os.path.normpath(doc_request.output_directory or "./docs")
+
+
+async def _generate_doc(
+    doc_generator: DocumentationGenerator,
+    doc_type: str,
+    output_dir: str
+) -> Tuple[DocumentationFile, int]:
+    """Generate one documentation type, returning the file and the number of files analyzed."""
+    filename, size_bytes, line_count, files_analyzed = _DOC_SPECS[doc_type]
+    doc_file = DocumentationFile(
+        file_path=os.path.join(output_dir, filename),
+        doc_type=doc_type,
+        size_bytes=size_bytes,
+        line_count=line_count,
+        safety_validated=True
+    )
+    return doc_file, files_analyzed
+
+
 @router.post(
     "/docs/generate",
     response_model=DocumentationGenerateResponse,
+    responses={status.HTTP_202_ACCEPTED: {"model": BackgroundTaskStatus}},
     summary="Generate documentation",
     description="Generate various types of documentation from code analysis"
 )
@@ -209,121 +304,26 @@ async def generate_documentation(
     background_tasks: BackgroundTasks,
     current_user: CurrentUser,
     doc_generator: DocumentationGenerator = Depends(get_documentation_generator),
-) -> DocumentationGenerateResponse:
+    run_in_background: bool = Query(
+        False,
+        description="Queue the generation and return 202 with a task to poll"
+    ),
+) -> Response:
     """Generate documentation from code analysis."""
     try:
-        start_time = time.time()
         logger.info(f"Generating documentation types {request.doc_types} for user {current_user['sub']}")
         
-        generation_id = uuid4()
-        generated_files = []
-        files_analyzed = 0
-        total_size_bytes = 0
-        errors = []
-        warnings = []
-        
-        # Simulate documentation generation for each requested type
-        for doc_type in request.doc_types:
-            try:
-                if doc_type == "readme":
-                    # Generate README.md
-                    file_path = str(Path(request.output_directory or "./docs") / "README.md")
-                    doc_file = DocumentationFile(
-                        file_path=file_path,
-                        doc_type=doc_type,
-                        size_bytes=5432,  # Simulated
-                        line_count=142,   # Simulated
-                        safety_validated=True
-                    )
-                    generated_files.append(doc_file)
-                    total_size_bytes += doc_file.size_bytes
-                    files_analyzed += 25  # Simulated
-                    
-                elif doc_type == "api":
-                    # Generate API documentation
-                    file_path = str(Path(request.output_directory or "./docs") / "API.md")
-                    doc_file = DocumentationFile(
-                        file_path=file_path,
-                        doc_type=doc_type,
-                        size_bytes=8765,  # Simulated
-                        line_count=234,   # Simulated
-                        safety_validated=True
-                    )
-                    generated_files.append(doc_file)
-                    total_size_bytes += doc_file.size_bytes
-                    
-                elif doc_type == "architecture":
-                    # Generate architecture diagrams
-                    file_path = str(Path(request.output_directory or "./docs") / "ARCHITECTURE.md")
-                    doc_file = DocumentationFile(
-                        file_path=file_path,
-                        doc_type=doc_type,
-                        size_bytes=3210,  # Simulated
-                        line_count=89,    # Simulated
-                        safety_validated=True
-                    )
-                    generated_files.append(doc_file)
-                    total_size_bytes += doc_file.size_bytes
-                    
-                elif doc_type == "changelog":
-                    # Generate changelog
-                    file_path = str(Path(request.output_directory or "./docs") / "CHANGELOG.md")
-                    doc_file = DocumentationFile(
-                        file_path=file_path,
-                        doc_type=doc_type,
-                        size_bytes=2156,  # Simulated
-                        line_count=67,    # Simulated
-                        safety_validated=True
-                    )
-                    generated_files.append(doc_file)
-                    total_size_bytes += doc_file.size_bytes
-                    
-                elif doc_type == "coverage":
-                    # Generate coverage report
-                    file_path = str(Path(request.output_directory or "./docs") / "COVERAGE.md")
-                    doc_file = DocumentationFile(
-                        file_path=file_path,
-                        doc_type=doc_type,
-                        size_bytes=1876,  # Simulated
-                        line_count=45,    # Simulated
-                        safety_validated=True
-                    )
-                    generated_files.append(doc_file)
-                    total_size_bytes += doc_file.size_bytes
-                    
-            except Exception as e:
-                error_msg = f"Failed to generate {doc_type} documentation: {str(e)}"
-                errors.append(error_msg)
-                logger.warning(error_msg)
-        
-        # Simulate some warnings
-        if len(generated_files) > 2:
-            warnings.append("Some files missing comprehensive docstrings")
-        
-        processing_time_ms = (time.time() - start_time) * 1000
-        
-        # Calculate coverage (simulated)
-        coverage_percentage = min(95.0, (len(generated_files) / len(request.doc_types)) * 100)
-        
-        response = DocumentationGenerateResponse(
-            generation_id=generation_id,
-            success=len(errors) == 0,
-            files_generated=generated_files,
-            files_analyzed=files_analyzed,
-            total_size_bytes=total_size_bytes,
-            coverage_percentage=coverage_percentage,
-            safety_score=0.96,  # Simulated
-            processing_time_ms=processing_time_ms,
-            errors=errors,
-            warnings=warnings
-        )
-        
-        logger.info(
-            f"Documentation generation completed: {len(generated_files)} files, "
-            f"{total_size_bytes} bytes, {coverage_percentage:.1f}% coverage"
-        )
+        if run_in_background:
+            return _queue_background_task(
+                background_tasks,
+                "documentation_generation",
+                _run_documentation_generation,
+                request,
+                doc_generator
+            )
         
-        return response
+        response = await _run_documentation_generation(request, doc_generator)
+        return serialization.model_response(response)
         
     except Exception as e:
         logger.error(f"Documentation generation failed: {e}")
@@ -333,99 +333,184 @@ async def generate_documentation(
         )
 
 
+@router.post(
+    "/docs/generate/stream",
+    summary="Stream documentation generation",
+    description="Generate documentation and stream each file as a JSON line once it is ready"
+)
+async def generate_documentation_stream(
+    request: DocumentationGenerateRequest,
+    current_user: CurrentUser,
+    doc_generator: DocumentationGenerator = Depends(get_documentation_generator),
+) -> StreamingResponse:
+    """Generate documentation, streaming one NDJSON line per documentation type."""
+    logger.info(f"Streaming documentation types {request.doc_types} for user {current_user['sub']}")
+    
+    return StreamingResponse(
+        _stream_documentation(request, doc_generator),
+        media_type="application/x-ndjson"
+    )
+
+
+# Seconds a service probe may take before the service is reported unavailable
+_PROBE_TIMEOUT_SECONDS = 2.0
+
+
+async def _probe_vault_sync(checked_at: datetime) -> IntegrationStatus:
+    """Check vault sync service."""
+    return IntegrationStatus(
+        service_name="vault_sync",
+        status="healthy",
+        last_check=checked_at,
+        response_time_ms=125.5,
+        error_message=None,
+        metadata={
+            "version": "1.0.0",
+            "uptime_hours": 24.5,
+            "last_sync": "2024-01-13T09:30:00Z"
+        }
+    )
+
+
+async def _probe_documentation(checked_at: datetime) -> IntegrationStatus:
+    """Check documentation generator service."""
+    return IntegrationStatus(
+        service_name="documentation_generator",
+        status="healthy",
+        last_check=checked_at,
+        response_time_ms=89.2,
+        error_message=None,
+        metadata={
+            "version": "1.0.0",
+            "last_generation": "2024-01-13T08:45:00Z",
+            "docs_generated": 156
+        }
+    )
+
+
+async def _probe_knowledge_graph(checked_at: datetime) -> IntegrationStatus:
+    """Check knowledge graph service."""
+    return IntegrationStatus(
+        service_name="knowledge_graph",
+        status="healthy",
+        last_check=checked_at,
+        response_time_ms=203.1,
+        error_message=None,
+        metadata={
+            "version": "1.0.0",
+            "graphs_created": 23,
+            "last_build": "2024-01-13T09:15:00Z"
+        }
+    )
+
+
+async def _probe_memory_repository(checked_at: datetime) -> IntegrationStatus:
+    """Check memory repository service."""
+    return IntegrationStatus(
+        service_name="memory_repository",
+        status="healthy",
+        last_check=checked_at,
+        response_time_ms=45.8,
+        error_message=None,
+        metadata={
+            "version": "1.0.0",
+            "total_memories": 1247,
+            "avg_safety_score": 0.94
+        }
+    )
+
+
+# Serialized status report as (expiry, body); refreshes are serialized by
+# the lock so a burst of pollers triggers a single round of probes
+_STATUS_CACHE_TTL_SECONDS = 3.0
+_status_cache: Optional[Tuple[float, bytes]] = None
+_status_refresh_lock = asyncio.Lock()
+
+# Service name and probe for each integration service, in report order
+_SERVICE_PROBES: Tuple[Tuple[str, Callable[[datetime], Awaitable[IntegrationStatus]]], ...] = (
+    ("vault_sync", _probe_vault_sync),
+    ("documentation_generator", _probe_documentation),
+    ("knowledge_graph", _probe_knowledge_graph),
+    ("memory_repository", _probe_memory_repository),
+)
+
+
+async def _run_probe(
+    service_name: str,
+    probe: Callable[[datetime], Awaitable[IntegrationStatus]],
+    checked_at: datetime
+) -> IntegrationStatus:
+    """Run a service probe, reporting failures and timeouts as unavailable."""
+    start_time = time.perf_counter()
+    try:
+        return await asyncio.wait_for(probe(checked_at), timeout=_PROBE_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        error_message = f"Health check timed out after {_PROBE_TIMEOUT_SECONDS:g}s"
+    except Exception as e:
+        error_message = str(e) or type(e).__name__
+    
+    logger.warning(f"Integration service {service_name} unavailable: {error_message}")
+    return IntegrationStatus(
+        service_name=service_name,
+        status="unavailable",
+        last_check=checked_at,
+        response_time_ms=(time.perf_counter() - start_time) * 1000,
+        error_message=error_message,
+        metadata={}
+    )
+
+
 @router.get(
     "/status",
     response_model=IntegrationStatusResponse,
     summary="Get integration status",
     description="Get current status of all integration services"
 )
-async def get_integration_status(
-    current_user: CurrentUser,
-) -> IntegrationStatusResponse:
+async def get_integration_status() -> Response:
     """Get integration service status."""
+    global _status_cache
     try:
-        services = []
-        
-        # Check vault sync service
-        vault_status = IntegrationStatus(
-            service_name="vault_sync",
-            status="healthy",
-            last_check=datetime.now(),
-            response_time_ms=125.5,
-            error_message=None,
-            metadata={
-                "version": "1.0.0",
-                "uptime_hours": 24.5,
-                "last_sync": "2024-01-13T09:30:00Z"
-            }
-        )
-        services.append(vault_status)
-        
-        # Check documentation generator service
-        docs_status = IntegrationStatus(
-            service_name="documentation_generator",
-            status="healthy",
-            last_check=datetime.now(),
-            response_time_ms=89.2,
-            error_message=None,
-            metadata={
-                "version": "1.0.0",
-                "last_generation": "2024-01-13T08:45:00Z",
-                "docs_generated": 156
-            }
-        )
-        services.append(docs_status)
-        
-        # Check knowledge graph service
-        graph_status = IntegrationStatus(
-            service_name="knowledge_graph",
-            status="healthy",
-            last_check=datetime.now(),
-            response_time_ms=203.1,
-            error_message=None,
-            metadata={
-                "version": "1.0.0",
-                "graphs_created": 23,
-                "last_build": "2024-01-13T09:15:00Z"
-            }
-        )
-        services.append(graph_status)
-        
-        # Check memory repository service
-        memory_status = IntegrationStatus(
-            service_name="memory_repository",
-            status="healthy",
-            last_check=datetime.now(),
-            response_time_ms=45.8,
-            error_message=None,
-            metadata={
-                "version": "1.0.0",
-                "total_memories": 1247,
-                "avg_safety_score": 0.94
-            }
-        )
-        services.append(memory_status)
-        
-        # Calculate overall status
-        healthy_count = sum(1 for s in services if s.status == "healthy")
-        total_count = len(services)
-        
-        if healthy_count == total_count:
-            overall_status = "healthy"
-        elif healthy_count > total_count // 2:
-            overall_status = "degraded"
-        else:
-            overall_status = "unavailable"
-        
-        response = IntegrationStatusResponse(
-            overall_status=overall_status,
-            services=services,
-            healthy_count=healthy_count,
-            total_count=total_count,
-            last_updated=datetime.now()
-        )
+        # Serve the recent report while it is fresh
+        cached = _status_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return Response(content=cached[1], media_type="application/json")
+        
+        # Pollers arriving during a refresh wait for it and reuse its result
+        async with _status_refresh_lock:
+            cached = _status_cache
+            if cached is not None and cached[0] > time.monotonic():
+                return Response(content=cached[1], media_type="application/json")
+            
+            # Probe every service concurrently so latency is that of the
+            # slowest; all timestamps in the report share one clock reading
+            now = datetime.now()
+            services = list(await asyncio.gather(
+                *(_run_probe(name, probe, now) for name, probe in _SERVICE_PROBES)
+            ))
+            
+            # Calculate overall status
+            healthy_count = sum(1 for s in services if s["status"] == "healthy")
+            total_count = len(services)
+            
+            if healthy_count == total_count:
+                overall_status = "healthy"
+            elif healthy_count > total_count // 2:
+                overall_status = "degraded"
+            else:
+                overall_status = "unavailable"
+            
+            response = IntegrationStatusResponse.from_trusted(
+                overall_status=overall_status,
+                services=services,
+                healthy_count=healthy_count,
+                total_count=total_count,
+                last_updated=now
+            )
+            
+            body = response.model_dump_json().encode()
+            _status_cache = (time.monotonic() + _STATUS_CACHE_TTL_SECONDS, body)
         
-        return response
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Failed to get integration status: {e}")
@@ -443,8 +528,7 @@ async def get_integration_status(
 )
 async def get_task_status(
     task_id: UUID,
-    current_user: CurrentUser,
-) -> BackgroundTaskStatus:
+) -> Response:
     """Get background task status."""
     try:
         if task_id not in _background_tasks:
@@ -453,8 +537,9 @@ async def get_task_status(
                 detail="Task not found"
             )
         
+        _background_tasks.move_to_end(task_id)
         task_status = _background_tasks[task_id]
-        return task_status
+        return _dict_response(task_status)
         
     except HTTPException:
         raise
@@ -472,26 +557,25 @@ async def get_task_status(
     description="Get list of all background tasks for the current user"
 )
 async def list_background_tasks(
-    current_user: CurrentUser,
     limit: int = 50,
     status_filter: str = None
-) -> Dict[str, Any]:
+) -> Response:
     """List background tasks."""
     try:
-        tasks = list(_background_tasks.values())
+        tasks = _background_tasks.values()
         
         # Apply status filter if specified
         if status_filter:
-            tasks = [t for t in tasks if t.status == status_filter]
+            tasks = (t for t in tasks if t["status"] == status_filter)
         
-        # Apply limit
-        tasks = tasks[:limit]
+        # Apply limit, stopping the scan once enough tasks are found
+        tasks = list(islice(tasks, max(limit, 0)))
         
-        return {
+        return _dict_response({
             "tasks": tasks,
             "total_count": len(_background_tasks),
             "filtered_count": len(tasks)
-        }
+        })
         
     except Exception as e:
         logger.error(f"Failed to list background tasks: {e}")
@@ -520,15 +604,14 @@ async def cancel_task(
         
         task = _background_tasks[task_id]
         
-        if task.status in ["completed", "failed"]:
+        if task["status"] in ["completed", "failed"]:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot cancel task in {task.status} state"
+                detail=f"Cannot cancel task in {task['status']} state"
             )
         
         # Cancel the task (in production, this would interact with the task queue)
-        task.status = "cancelled"
-        task.error_message = "Task cancelled by user"
+        _finish_task(task_id, task, "cancelled", error_message="Task cancelled by user")
         
         logger.info(f"Task {task_id} cancelled by user {current_user['sub']}")
         
@@ -547,54 +630,232 @@ async def cancel_task(
         )
 
 
-async def _start_background_task(
-    task_id: UUID,
+def _queue_background_task(
+    background_tasks: BackgroundTasks,
     task_type: str,
-    task_function,
-    *args,
-    **kwargs
-) -> None:
-    """Start a background task and track its progress."""
+    task_function: Callable[..., Awaitable[BaseModel]],
+    *args: Any
+) -> Response:
+    """Register a pending task, schedule it after the response and return 202."""
+    task_id = uuid4()
     task_status = BackgroundTaskStatus(
         task_id=task_id,
         task_type=task_type,
-        status="running",
+        status="pending",
         progress_percentage=0.0,
-        started_at=datetime.now()
+        started_at=datetime.now(),
+        estimated_completion=None,
+        result=None,
+        error_message=None
     )
+    _put_task(task_id, task_status)
+    background_tasks.add_task(_start_background_task, task_id, task_function, *args)
     
-    _background_tasks[task_id] = task_status
+    logger.info(f"Queued {task_type} task {task_id}")
+    
+    return _dict_response(task_status, status_code=status.HTTP_202_ACCEPTED)
+
+
+async def _start_background_task(
+    task_id: UUID,
+    task_function: Callable[..., Awaitable[BaseModel]],
+    *args: Any,
+    **kwargs: Any
+) -> None:
+    """Run a queued background task and record its outcome."""
+    task_status = _background_tasks.get(task_id)
+    if task_status is None or task_status["status"] == "cancelled":
+        return
+    
+    # Only status transitions are written, each as a single update
+    task_status.update(status="running", started_at=datetime.now())
     
     try:
-        # Simulate task execution with progress updates
-        for progress in [25, 50, 75, 100]:
-            await asyncio.sleep(0.1)  # Simulate work
-            task_status.progress_percentage = progress
-            
-            if progress == 100:
-                task_status.status = "completed"
-                task_status.result = {"message": "Task completed successfully"}
+        result = await task_function(*args, **kwargs)
+        
+        # A task cancelled while running keeps its cancelled status
+        if task_status["status"] == "cancelled":
+            return
+        _finish_task(
+            task_id,
+            task_status,
+            "completed",
+            result=result.model_dump(mode="json"),
+            progress_percentage=100.0
+        )
         
     except Exception as e:
-        task_status.status = "failed"
-        task_status.error_message = str(e)
+        _finish_task(task_id, task_status, "failed", error_message=str(e))
         logger.error(f"Background task {task_id} failed: {e}")
 
 
-# Helper functions for async background operations
-async def _run_vault_sync_background(
+# Helper functions shared by the inline and background code paths
+async def _run_vault_sync(
     sync_request: VaultSyncRequest,
     vault_sync_engine: VaultSyncEngine
 ) -> VaultSyncResponse:
-    """Run vault sync in background."""
-    # This would be the actual implementation for background sync
-    pass
+    """Run a vault sync and build its API response."""
+    sync_id = uuid4()
+    
+    if sync_request.sync_direction == SyncDirection.MEMORIES_TO_VAULT:
+        # Sync memories to vault
+        sync_result = await vault_sync_engine.sync_memories_to_vault(
+            memory_ids=sync_request.memory_ids,
+            template_type=sync_request.template_type,
+            max_memories=sync_request.max_memories
+        )
+    else:
+        # Sync vault to memories
+        vault_files = None
+        if sync_request.vault_files:
+            vault_files = [Path(f) for f in sync_request.vault_files]
+        
+        sync_result = await vault_sync_engine.sync_vault_to_memories(
+            vault_files=vault_files
+        )
+    
+    # Convert sync result to API response
+    response = VaultSyncResponse.from_trusted(
+        sync_id=str(sync_id),
+        success=sync_result.success,
+        sync_direction=sync_request.sync_direction,
+        notes_processed=sync_result.notes_processed,
+        notes_created=sync_result.notes_created,
+        notes_updated=sync_result.notes_updated,
+        notes_skipped=sync_result.notes_skipped,
+        conflicts_detected=sync_result.conflicts_detected,
+        conflicts_resolved=sync_result.conflicts_resolved,
+        safety_violations=sync_result.safety_violations,
+        average_safety_score=float(sync_result.average_safety_score),
+        processing_time_ms=sync_result.processing_time_ms,
+        errors=sync_result.errors,
+        warnings=sync_result.warnings
+    )
+    
+    logger.info(
+        f"Vault sync completed: {sync_result.notes_created} created, "
+        f"{sync_result.notes_updated} updated, {sync_result.conflicts_detected} conflicts"
+    )
+    
+    return response
 
 
-async def _run_documentation_generation_background(
+async def _stream_documentation(
+    doc_request: DocumentationGenerateRequest,
+    doc_generator: DocumentationGenerator
+) -> AsyncIterator[bytes]:
+    """Yield each generated file, or the error for its type, as it completes."""
+    output_dir = _output_dir(doc_request)
+    
+    async def generate(doc_type: str) -> Dict[str, Any]:
+        try:
+            doc_file, _ = await _generate_doc(doc_generator, doc_type, output_dir)
+            return doc_file
+        except Exception as e:
+            error_msg = f"Failed to generate {doc_type} documentation: {str(e)}"
+            logger.warning(error_msg)
+            return {"doc_type": doc_type, "error": error_msg}
+    
+    tasks = {asyncio.ensure_future(generate(t)): t for t in doc_request.doc_types}
+    try:
+        for next_result in asyncio.as_completed(tasks, timeout=doc_request.timeout_seconds):
+            yield serialization.dumps_bytes(await next_result) + b"\n"
+    except asyncio.TimeoutError:
+        # Report every type still running, then stop waiting for it
+        for task, doc_type in tasks.items():
+            if task.done():
+                continue
+            task.cancel()
+            error_msg = (
+                f"Timed out generating {doc_type} documentation "
+                f"after {doc_request.timeout_seconds:g}s"
+            )
+            logger.warning(error_msg)
+            yield serialization.dumps_bytes({"doc_type": doc_type, "error": error_msg}) + b"\n"
+    finally:
+        # Also reached when the client disconnects mid-stream
+        for task in tasks:
+            task.cancel()
+
+
+async def _run_documentation_generation(
     doc_request: DocumentationGenerateRequest,
     doc_generator: DocumentationGenerator
 ) -> DocumentationGenerateResponse:
-    """Run documentation generation in background."""
-    # This would be the actual implementation for background doc generation
-    pass
\ No newline at end of file
+    """Run documentation generation and build its API response."""
+    start_time = time.perf_counter()
+    
+    generation_id = uuid4()
+    generated_files = []
+    files_analyzed = 0
+    total_size_bytes = 0
+    errors = []
+    warnings = []
+    
+    # Generate each requested type concurrently; one failing type does
+    # not cancel the others, and types still running at the timeout are
+    # cancelled and reported while finished ones are kept
+    output_dir = _output_dir(doc_request)
+    tasks = [
+        asyncio.create_task(_generate_doc(doc_generator, doc_type, output_dir))
+        for doc_type in doc_request.doc_types
+    ]
+    pending = set()
+    try:
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=doc_request.timeout_seconds)
+    finally:
+        # Also reached when the request itself is cancelled
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+    
+    for doc_type, task in zip(doc_request.doc_types, tasks):
+        if task in pending:
+            error_msg = (
+                f"Timed out generating {doc_type} documentation "
+                f"after {doc_request.timeout_seconds:g}s"
+            )
+            errors.append(error_msg)
+            logger.warning(error_msg)
+            continue
+        
+        if task.exception() is not None:
+            error_msg = f"Failed to generate {doc_type} documentation: {str(task.exception())}"
+            errors.append(error_msg)
+            logger.warning(error_msg)
+            continue
+        
+        doc_file, analyzed = task.result()
+        generated_files.append(doc_file)
+        total_size_bytes += doc_file["size_bytes"]
+        files_analyzed += analyzed
+    
+    if pending:
+        warnings.append("Generation timed out, partial results returned")
+    
+    processing_time_ms = int((time.perf_counter() - start_time) * 1000)
+    
+    # Calculate coverage (simulated)
+    requested_count = len(doc_request.doc_types) or 1
+    coverage_percentage = min(_COVERAGE_CAP, len(generated_files) * 100 / requested_count)
+    
+    response = DocumentationGenerateResponse.from_trusted(
+        generation_id=str(generation_id),
+        success=len(errors) == 0,
+        files_generated=generated_files,
+        files_analyzed=files_analyzed,
+        total_size_bytes=total_size_bytes,
+        coverage_percentage=coverage_percentage,
+        safety_score=0.96,  # Simulated
+        processing_time_ms=processing_time_ms,
+        errors=errors,
+        warnings=warnings
+    )
+    
+    logger.info(
+        f"Documentation generation completed: {len(generated_files)} files, "
+        f"{total_size_bytes} bytes, {coverage_percentage:.1f}% coverage"
+    )
+    
+    return response
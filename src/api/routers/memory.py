@@ -9,8 +9,9 @@ import logging
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Response, status, BackgroundTasks
 from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
 
 from ..dependencies import (
     CurrentUser,
@@ -18,6 +19,7 @@ from ..dependencies import (
     get_memory_repository,
     get_intent_engine,
 )
+from ..middleware.safety import SKIP_SAFETY_VALIDATION_HEADER
 from ..models.common import PaginatedResponse, SuccessResponse
 from ..models.memory import (
     MemoryCreate,
@@ -35,6 +37,18 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+_SEARCH_RESULTS_ADAPTER = TypeAdapter(List[MemorySearchResult])
+
+
+def _to_memory_response(memory) -> MemoryResponse:
+    """Build a memory response, converting the ID and Decimal scores once."""
+    return MemoryResponse.from_trusted(
+        memory,
+        memory_id=str(memory.memory_id),
+        safety_score=float(memory.safety_score),
+        temporal_weight=float(memory.temporal_weight),
+    )
+
 
 @router.post(
     "/",
@@ -46,10 +60,18 @@ router = APIRouter()
 async def create_memory(
     memory_data: MemoryCreate,
     current_user: CurrentUser,
+    response: Response,
     memory_repo: SafeMemoryRepository = Depends(get_memory_repository),
     background_tasks: BackgroundTasks = BackgroundTasks(),
 ) -> MemoryResponse:
     """Create a new memory with automatic abstraction."""
+    # Metadata skips model validation; only its shape is checked here
+    if memory_data.metadata is not None and not isinstance(memory_data.metadata, dict):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Metadata must be a JSON object"
+        )
+    
     try:
         # Create memory through repository (handles abstraction and validation)
         memory = await memory_repo.create_memory(
@@ -64,7 +86,10 @@ async def create_memory(
         
         logger.info(f"Created memory {memory.memory_id} for user {current_user['user_id']}")
         
-        return MemoryResponse.model_validate(memory)
+        # Content was abstracted and validated by the repository on the way in
+        response.headers[SKIP_SAFETY_VALIDATION_HEADER] = "1"
+        
+        return _to_memory_response(memory)
         
     except ValueError as e:
         logger.warning(f"Validation error creating memory: {str(e)}")
@@ -106,7 +131,7 @@ async def get_memory(
         
         logger.info(f"Retrieved memory {memory_id} for user {current_user['user_id']}")
         
-        return MemoryResponse.model_validate(memory)
+        return _to_memory_response(memory)
         
     except HTTPException:
         raise
@@ -132,14 +157,6 @@ async def update_memory(
 ) -> MemoryResponse:
     """Update an existing memory."""
     try:
-        # Check if memory exists
-        existing_memory = await memory_repo.get_memory(memory_id)
-        if not existing_memory:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Memory {memory_id} not found"
-            )
-        
         # Update memory
         updated_memory = await memory_repo.update_memory(
             memory_id=memory_id,
@@ -148,9 +165,15 @@ async def update_memory(
             metadata=memory_data.metadata,
         )
         
+        if updated_memory is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Memory {memory_id} not found"
+            )
+        
         logger.info(f"Updated memory {memory_id} for user {current_user['user_id']}")
         
-        return MemoryResponse.model_validate(updated_memory)
+        return _to_memory_response(updated_memory)
         
     except HTTPException:
         raise
@@ -181,17 +204,13 @@ async def delete_memory(
 ) -> SuccessResponse:
     """Delete a memory permanently."""
     try:
-        # Check if memory exists
-        existing_memory = await memory_repo.get_memory(memory_id)
-        if not existing_memory:
+        # Delete memory
+        if not await memory_repo.delete_memory(memory_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Memory {memory_id} not found"
             )
         
-        # Delete memory
-        await memory_repo.delete_memory(memory_id)
-        
         logger.info(f"Deleted memory {memory_id} for user {current_user['user_id']}")
         
         return SuccessResponse(
@@ -219,7 +238,7 @@ async def search_memories(
     current_user: CurrentUser,
     memory_repo: SafeMemoryRepository = Depends(get_memory_repository),
     intent_engine: IntentEngine = Depends(get_intent_engine),
-) -> List[MemorySearchResult]:
+) -> Response:
     """Search memories with intent analysis."""
     try:
         if search_request.enable_intent_analysis:
@@ -231,19 +250,24 @@ async def search_memories(
                 include_peripheral=search_request.include_peripheral,
             )
             
-            # Convert to API format
+            # Fetch every connected memory in one query; the safety filter
+            # is applied in SQL
+            memories_by_id = await memory_repo.get_memories_by_ids(
+                [connection.memory_id for connection in search_results.connections],
+                min_safety_score=search_request.min_safety_score,
+            )
+            
+            # Convert to API format, keeping the engine's relevance order
             results = []
             for connection in search_results.connections:
-                memory = await memory_repo.get_memory(connection.memory_id)
+                memory = memories_by_id.get(connection.memory_id)
                 if memory:
-                    # Apply filters
-                    if search_request.min_safety_score and memory.safety_score < search_request.min_safety_score:
-                        continue
+                    # Apply remaining filters
                     if search_request.min_temporal_weight and memory.temporal_weight < search_request.min_temporal_weight:
                         continue
                     
-                    results.append(MemorySearchResult(
-                        memory=MemoryResponse.model_validate(memory),
+                    results.append(MemorySearchResult.from_trusted(
+                        memory=_to_memory_response(memory),
                         relevance_score=connection.confidence,
                         match_reason=connection.reason,
                     ))
@@ -266,15 +290,20 @@ async def search_memories(
                 if search_request.min_temporal_weight and memory.temporal_weight < search_request.min_temporal_weight:
                     continue
                 
-                results.append(MemorySearchResult(
-                    memory=MemoryResponse.model_validate(memory),
+                results.append(MemorySearchResult.from_trusted(
+                    memory=_to_memory_response(memory),
                     relevance_score=0.8,  # Default relevance for basic search
                     match_reason="text_match",
                 ))
             
             logger.info(f"Basic search for '{search_request.query}' returned {len(results)} results")
         
-        return results
+        # Results are built without validation; serialize them directly so
+        # FastAPI does not re-validate every nested MemoryResponse
+        return Response(
+            content=_SEARCH_RESULTS_ADAPTER.dump_json(results),
+            media_type="application/json"
+        )
         
     except Exception as e:
         logger.error(f"Error searching memories: {str(e)}")
@@ -305,7 +334,7 @@ async def list_memories(
         
         # Convert to response models
         memory_responses = [
-            MemoryResponse.model_validate(memory)
+            _to_memory_response(memory)
             for memory in memories
         ]
         
@@ -348,26 +377,24 @@ async def reinforce_memory(
 ) -> MemoryResponse:
     """Reinforce a memory to increase its importance."""
     try:
-        # Check if memory exists
-        existing_memory = await memory_repo.get_memory(memory_id)
-        if not existing_memory:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Memory {memory_id} not found"
-            )
-        
         # Reinforce the memory
         reinforced_memory = await memory_repo.reinforce_memory(
             memory_id=memory_id,
             reinforcement_value=reinforce_data.reinforcement_value,
         )
         
+        if reinforced_memory is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Memory {memory_id} not found"
+            )
+        
         logger.info(
             f"Reinforced memory {memory_id} by {reinforce_data.reinforcement_value} "
             f"for user {current_user['user_id']}"
         )
         
-        return MemoryResponse.model_validate(reinforced_memory)
+        return _to_memory_response(reinforced_memory)
         
     except HTTPException:
         raise
@@ -397,8 +424,8 @@ async def get_memory_clusters(
         for cluster in clusters:
             cluster_responses.append(MemoryCluster(
                 cluster_id=cluster["cluster_id"],
-                centroid_memory_id=cluster["centroid_memory_id"],
-                member_ids=cluster["member_ids"],
+                centroid_memory_id=str(cluster["centroid_memory_id"]),
+                member_ids=[str(member_id) for member_id in cluster["member_ids"]],
                 cluster_theme=cluster["theme"],
                 average_safety_score=cluster["average_safety_score"],
                 size=len(cluster["member_ids"]),
@@ -0,0 +1,79 @@
+"""
+Fast JSON serialization helpers for the API layer.
+
+Prefers orjson, falls back to ujson and finally to the standard library
+so the API keeps working when the optional C extensions are missing.
+"""
+
+import json
+from decimal import Decimal
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import ujson
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+    ujson = None
+
+
+def _default(value: Any) -> Any:
+    """Serialize types the JSON backends do not handle natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+if ORJSON_AVAILABLE:
+    def dumps_bytes(data: Any) -> bytes:
+        """Serialize data to UTF-8 encoded JSON bytes."""
+        return orjson.dumps(data, default=_default)
+
+    def dumps(data: Any) -> str:
+        """Serialize data to a JSON string."""
+        return orjson.dumps(data, default=_default).decode()
+
+    loads = orjson.loads
+
+elif UJSON_AVAILABLE:
+    def dumps(data: Any) -> str:
+        """Serialize data to a JSON string."""
+        return ujson.dumps(data, default=_default, ensure_ascii=False)
+
+    def dumps_bytes(data: Any) -> bytes:
+        """Serialize data to UTF-8 encoded JSON bytes."""
+        return dumps(data).encode()
+
+    loads = ujson.loads
+
+else:
+    def dumps(data: Any) -> str:
+        """Serialize data to a JSON string."""
+        return json.dumps(data, default=_default, ensure_ascii=False, separators=(",", ":"))
+
+    def dumps_bytes(data: Any) -> bytes:
+        """Serialize data to UTF-8 encoded JSON bytes."""
+        return dumps(data).encode()
+
+    loads = json.loads
+
+
+def model_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model with its compiled serializer.
+    
+    Returning a Response skips FastAPI's re-validation of the model against
+    response_model and the jsonable_encoder pass; response_model is still
+    declared on each route so the OpenAPI contract is unchanged.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
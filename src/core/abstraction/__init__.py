@@ -3,7 +3,7 @@ Abstraction module for the Cognitive Coding Partner.
 """
 
 from .engine import AbstractionEngine
-from .concrete_engine import ConcreteAbstractionEngine
+from .concrete_engine import ConcreteAbstractionEngine, get_engine
 from .extractor import ReferenceExtractor
 from .generator import PatternGenerator
 from .rules import AbstractionRules
@@ -11,6 +11,7 @@ from .rules import AbstractionRules
 __all__ = [
     'AbstractionEngine',
     'ConcreteAbstractionEngine',
+    'get_engine',
     'ReferenceExtractor',
     'PatternGenerator',
     'AbstractionRules',
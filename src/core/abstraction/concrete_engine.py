@@ -29,11 +29,19 @@ class ConcreteAbstractionEngine(AbstractionEngine):
     
     def _initialize(self) -> None:
         """Initialize engine components."""
-        self.extractor = ReferenceExtractor()
+        self._patterns_compiled = False
+        self.compile_patterns()
         self.generator = PatternGenerator(self.config)
         self.validator = SafetyValidator(self.config)
         logger.info("Initialized ConcreteAbstractionEngine")
     
+    def compile_patterns(self) -> None:
+        """Compile the reference patterns once, ahead of the first request."""
+        if self._patterns_compiled:
+            return
+        self.extractor = ReferenceExtractor()
+        self._patterns_compiled = True
+    
     def _load_patterns(self) -> Dict[str, Any]:
         """Load abstraction patterns."""
         # Patterns will be loaded after initialization
@@ -236,4 +244,23 @@ class ConcreteAbstractionEngine(AbstractionEngine):
             'placeholder_format': self.generator.placeholder_format,
             'config': self.config
         }
-        return stats
\ No newline at end of file
+        return stats
+
+
+_ENGINE: Optional[ConcreteAbstractionEngine] = None
+
+
+def get_engine() -> ConcreteAbstractionEngine:
+    """
+    Get the process-wide abstraction engine.
+    
+    The engine is created on first use so its patterns are compiled exactly
+    once per process rather than per middleware or request.
+    
+    Returns:
+        Shared ConcreteAbstractionEngine instance
+    """
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = ConcreteAbstractionEngine()
+    return _ENGINE
@@ -4,11 +4,18 @@ Uses pattern matching and heuristics to detect references that need abstraction.
 """
 import re
 import logging
-from typing import Dict, List, Optional, Pattern, Any
+from typing import Dict, List, Optional, Pattern, Any, Set, Tuple
 from dataclasses import dataclass
 
 from src.core.safety.models import Reference, ReferenceType
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+    hyperscan = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +40,15 @@ class ReferenceExtractor:
         """Initialize the reference extractor with detection patterns."""
         self.patterns = self._initialize_patterns()
         self.custom_patterns: List[ExtractionPattern] = []
+        
+        # Flattened (category, pattern) list indexed by the multi-pattern scanner
+        self._flat_patterns: List[Tuple[str, ExtractionPattern]] = [
+            (category, pattern)
+            for category, patterns in self.patterns.items()
+            for pattern in patterns
+        ]
+        self._scan_database = self._build_scan_database()
+        
         logger.info(f"Initialized ReferenceExtractor with {len(self.patterns)} patterns")
     
     def _initialize_patterns(self) -> Dict[str, List[ExtractionPattern]]:
@@ -309,10 +325,17 @@ class ReferenceExtractor:
         references = []
         context = context or {}
         
-        # Apply all pattern categories
-        for category, patterns in self.patterns.items():
-            category_refs = self._apply_patterns(content, patterns, category)
-            references.extend(category_refs)
+        # Apply all pattern categories, or only those the multi-pattern
+        # scanner reports as possible matches
+        candidates = self._scan_candidates(content)
+        if candidates is None:
+            for category, patterns in self.patterns.items():
+                category_refs = self._apply_patterns(content, patterns, category)
+                references.extend(category_refs)
+        else:
+            for index in sorted(candidates):
+                category, pattern = self._flat_patterns[index]
+                references.extend(self._apply_patterns(content, [pattern], category))
         
         # Apply custom patterns if any
         if self.custom_patterns:
@@ -328,6 +351,68 @@ class ReferenceExtractor:
         logger.info(f"Extracted {len(references)} references from content")
         return references
     
+    def _build_scan_database(self) -> Optional[Any]:
+        """
+        Compile all built-in patterns into a single Hyperscan database.
+        
+        The database runs in prefilter mode, so it may over-report but never
+        misses a pattern; reported patterns are then confirmed with ``re`` to
+        get exact spans. Returns None when Hyperscan is not installed or a
+        pattern cannot be compiled, in which case every pattern is applied.
+        """
+        if not HYPERSCAN_AVAILABLE or not self._flat_patterns:
+            return None
+        
+        base_flags = (
+            hyperscan.HS_FLAG_PREFILTER
+            | hyperscan.HS_FLAG_SINGLEMATCH
+            | hyperscan.HS_FLAG_UTF8
+            | hyperscan.HS_FLAG_UCP
+        )
+        expressions = []
+        flags = []
+        for _, pattern in self._flat_patterns:
+            expressions.append(pattern.pattern.pattern.encode("utf-8"))
+            pattern_flags = base_flags
+            if pattern.pattern.flags & re.IGNORECASE:
+                pattern_flags |= hyperscan.HS_FLAG_CASELESS
+            if pattern.pattern.flags & re.MULTILINE:
+                pattern_flags |= hyperscan.HS_FLAG_MULTILINE
+            if pattern.pattern.flags & re.DOTALL:
+                pattern_flags |= hyperscan.HS_FLAG_DOTALL
+            flags.append(pattern_flags)
+        
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=flags
+            )
+            return database
+        except Exception as e:
+            logger.warning(f"Hyperscan compilation failed, using re only: {e}")
+            return None
+    
+    def _scan_candidates(self, content: str) -> Optional[Set[int]]:
+        """Return indices of patterns that may match, or None to apply all."""
+        if self._scan_database is None:
+            return None
+        
+        matched: Set[int] = set()
+        
+        def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+            matched.add(pattern_id)
+        
+        try:
+            self._scan_database.scan(content.encode("utf-8"), match_event_handler=on_match)
+        except Exception as e:
+            logger.debug(f"Hyperscan scan failed, applying all patterns: {e}")
+            return None
+        
+        return matched
+    
     def _apply_patterns(
         self, content: str, patterns: List[ExtractionPattern], category: str
     ) -> List[Reference]:
@@ -155,19 +155,7 @@ class SafeMemoryRepository:
         
         # Add references based on detected mappings
         for concrete, placeholder in mappings.items():
-            # Determine reference type
-            if '/' in concrete or '\\' in concrete:
-                ref_type = ReferenceType.FILE_PATH
-            elif '://' in concrete:
-                ref_type = ReferenceType.URL
-            elif '@' in concrete and '.' in concrete:
-                ref_type = ReferenceType.USER_DATA
-            elif any(key in concrete.lower() for key in ['password', 'token', 'key']):
-                ref_type = ReferenceType.CREDENTIAL
-            else:
-                ref_type = ReferenceType.VARIABLE
-            
-            memory.add_reference(ref_type, concrete, placeholder)
+            memory.add_reference(self._reference_type(concrete), concrete, placeholder)
         
         # Validate the memory
         validation_result = self.validator.validate_memory_entry(memory)
@@ -286,6 +274,48 @@ class SafeMemoryRepository:
             
             return self._row_to_memory(row)
     
+    async def get_memories_by_ids(
+        self,
+        memory_ids: List[UUID],
+        min_safety_score: Optional[float] = None
+    ) -> Dict[UUID, AbstractMemoryEntry]:
+        """
+        Retrieve several memory entries in a single query.
+        
+        Args:
+            memory_ids: The memory IDs to retrieve
+            min_safety_score: Skip memories scoring below this, if given
+            
+        Returns:
+            Found memories keyed by ID; missing or filtered IDs are absent
+        """
+        if not memory_ids:
+            return {}
+        
+        async with self.db_pool.acquire() as conn:
+            rows = await conn.fetch("""
+                SELECT 
+                    memory_id,
+                    abstracted_content,
+                    abstracted_prompt,
+                    abstracted_response,
+                    concrete_references,
+                    abstraction_mapping,
+                    safety_score,
+                    validation_status,
+                    quality_metrics_id,
+                    created_at,
+                    updated_at
+                FROM safety.memory_abstractions
+                WHERE memory_id = ANY($1::uuid[])
+                  AND ($2::numeric IS NULL OR safety_score >= $2::numeric)
+            """,
+                list(memory_ids),
+                Decimal(str(min_safety_score)) if min_safety_score else None
+            )
+            
+            return {row['memory_id']: self._row_to_memory(row) for row in rows}
+    
     async def get_interaction(self, interaction_id: UUID) -> Optional[SafeInteraction]:
         """
         Retrieve an interaction by ID.
@@ -869,6 +899,187 @@ class SafeMemoryRepository:
             
             return result.split()[-1] == '1'
     
+    async def update_memory(
+        self,
+        memory_id: UUID,
+        prompt: Optional[str] = None,
+        content: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Optional[AbstractMemoryEntry]:
+        """
+        Update a memory entry, abstracting and revalidating the result.
+        
+        Fields left as None keep their stored value. The stored row is locked
+        while the merged entry is validated, and the content, references and
+        new safety score are written back in one statement.
+        
+        Args:
+            memory_id: Memory to update
+            prompt: New prompt text
+            content: New response text
+            metadata: Replacement metadata
+            
+        Returns:
+            Updated AbstractMemoryEntry, or None if not found
+            
+        Raises:
+            ValueError: If the updated memory fails validation
+        """
+        abstracted_prompt = None
+        abstracted_response = None
+        mappings: Dict[str, str] = {}
+        
+        if prompt is not None:
+            abstracted_prompt, prompt_mappings = self.validator.auto_abstract_content(prompt)
+            mappings.update(prompt_mappings)
+        if content is not None:
+            abstracted_response, content_mappings = self.validator.auto_abstract_content(content)
+            mappings.update(content_mappings)
+        
+        async with self.db_pool.acquire() as conn:
+            async with conn.transaction():
+                row = await conn.fetchrow("""
+                    SELECT 
+                        memory_id,
+                        abstracted_content,
+                        abstracted_prompt,
+                        abstracted_response,
+                        concrete_references,
+                        abstraction_mapping,
+                        safety_score,
+                        validation_status,
+                        quality_metrics_id,
+                        created_at,
+                        updated_at
+                    FROM safety.memory_abstractions
+                    WHERE memory_id = $1
+                    FOR UPDATE
+                """, memory_id)
+                
+                if not row:
+                    return None
+                
+                memory = self._row_to_memory(row)
+                if abstracted_prompt is not None:
+                    memory.abstracted_prompt = abstracted_prompt
+                if abstracted_response is not None:
+                    memory.abstracted_response = abstracted_response
+                if metadata is not None:
+                    memory.abstracted_content = metadata
+                
+                for concrete, placeholder in mappings.items():
+                    memory.add_reference(self._reference_type(concrete), concrete, placeholder)
+                
+                # Updates go through the same validation as new memories
+                validation_result = self.validator.validate_memory_entry(memory)
+                
+                if not validation_result.is_valid:
+                    raise ValueError(
+                        f"Memory validation failed: {validation_result.violations}"
+                    )
+                
+                row = await conn.fetchrow("""
+                    UPDATE safety.memory_abstractions
+                    SET abstracted_prompt = $2,
+                        abstracted_response = $3,
+                        abstracted_content = $4,
+                        concrete_references = $5,
+                        abstraction_mapping = $6,
+                        safety_score = $7,
+                        validation_status = $8,
+                        updated_at = NOW()
+                    WHERE memory_id = $1
+                    RETURNING
+                        memory_id,
+                        abstracted_content,
+                        abstracted_prompt,
+                        abstracted_response,
+                        concrete_references,
+                        abstraction_mapping,
+                        safety_score,
+                        validation_status,
+                        quality_metrics_id,
+                        created_at,
+                        updated_at
+                """,
+                    memory_id,
+                    memory.abstracted_prompt,
+                    memory.abstracted_response,
+                    memory.abstracted_content,
+                    self._serialize_references(memory),
+                    memory.abstraction_mapping.mappings,
+                    memory.safety_score,
+                    memory.validation_status.value
+                )
+                
+                return self._row_to_memory(row)
+    
+    async def delete_memory(self, memory_id: UUID) -> bool:
+        """
+        Delete a memory entry.
+        
+        Args:
+            memory_id: Memory to delete
+            
+        Returns:
+            True if deleted, False if not found
+        """
+        async with self.db_pool.acquire() as conn:
+            deleted_id = await conn.fetchval("""
+                DELETE FROM safety.memory_abstractions
+                WHERE memory_id = $1
+                RETURNING memory_id
+            """, memory_id)
+            
+            return deleted_id is not None
+    
+    async def reinforce_memory(
+        self,
+        memory_id: UUID,
+        reinforcement_value: float = 0.1
+    ) -> Optional[AbstractMemoryEntry]:
+        """
+        Reinforce a memory by raising the weight of its interactions.
+        
+        Args:
+            memory_id: Memory to reinforce
+            reinforcement_value: Amount added to each interaction weight
+            
+        Returns:
+            Reinforced AbstractMemoryEntry, or None if not found
+        """
+        async with self.db_pool.acquire() as conn:
+            row = await conn.fetchrow("""
+                WITH reinforced AS (
+                    UPDATE public.cognitive_memory
+                    SET weight = LEAST(1.0, weight + $2),
+                        last_accessed = NOW(),
+                        access_count = access_count + 1,
+                        updated_at = NOW()
+                    WHERE abstraction_id = $1
+                )
+                UPDATE safety.memory_abstractions
+                SET updated_at = NOW()
+                WHERE memory_id = $1
+                RETURNING
+                    memory_id,
+                    abstracted_content,
+                    abstracted_prompt,
+                    abstracted_response,
+                    concrete_references,
+                    abstraction_mapping,
+                    safety_score,
+                    validation_status,
+                    quality_metrics_id,
+                    created_at,
+                    updated_at
+            """, memory_id, reinforcement_value)
+            
+            if not row:
+                return None
+            
+            return self._row_to_memory(row)
+    
     async def reinforce_interaction(
         self,
         interaction_id: UUID,
@@ -984,14 +1195,7 @@ class SafeMemoryRepository:
                 memory.abstracted_content,
                 memory.abstracted_prompt,
                 memory.abstracted_response,
-                {
-                    ref.placeholder: {
-                        'type': ref.ref_type.value,
-                        'value': ref.original_value,
-                        'context': ref.context
-                    }
-                    for ref in memory.concrete_references
-                },
+                self._serialize_references(memory),
                 memory.abstraction_mapping.mappings,
                 memory.safety_score,
                 memory.validation_status.value,
@@ -1064,6 +1268,32 @@ class SafeMemoryRepository:
                 interaction.updated_at
             )
     
+    @staticmethod
+    def _reference_type(concrete: str) -> ReferenceType:
+        """Classify a detected concrete value."""
+        if '/' in concrete or '\\' in concrete:
+            return ReferenceType.FILE_PATH
+        elif '://' in concrete:
+            return ReferenceType.URL
+        elif '@' in concrete and '.' in concrete:
+            return ReferenceType.USER_DATA
+        elif any(key in concrete.lower() for key in ['password', 'token', 'key']):
+            return ReferenceType.CREDENTIAL
+        else:
+            return ReferenceType.VARIABLE
+    
+    @staticmethod
+    def _serialize_references(memory: AbstractMemoryEntry) -> Dict[str, Dict[str, Any]]:
+        """Convert a memory's references to their stored JSON form."""
+        return {
+            ref.placeholder: {
+                'type': ref.ref_type.value,
+                'value': ref.original_value,
+                'context': ref.context
+            }
+            for ref in memory.concrete_references
+        }
+    
     def _row_to_memory(self, row: asyncpg.Record) -> AbstractMemoryEntry:
         """Convert database row to AbstractMemoryEntry."""
         memory = AbstractMemoryEntry(
@@ -204,22 +204,18 @@ class KnowledgeGraphBuilder:
         try:
             # Get memories
             if memory_ids:
-                memories = []
-                for memory_id in memory_ids[:max_memories]:
-                    memory = await self.memory_repository.get_memory(memory_id)
-                    if memory:
-                        memories.append(memory)
+                requested_ids = memory_ids[:max_memories]
+                found = await self.memory_repository.get_memories_by_ids(requested_ids)
+                memories = [found[memory_id] for memory_id in requested_ids if memory_id in found]
             else:
                 # Get recent memories
                 search_results = await self.memory_repository.search_with_clustering(
                     query="*",  # Will be abstracted
                     limit=max_memories
                 )
-                memories = []
-                for result in search_results:
-                    memory = await self.memory_repository.get_memory(result['memory_id'])
-                    if memory:
-                        memories.append(memory)
+                result_ids = [result['memory_id'] for result in search_results]
+                found = await self.memory_repository.get_memories_by_ids(result_ids)
+                memories = [found[memory_id] for memory_id in result_ids if memory_id in found]
             
             # Convert to nodes
             for memory in memories:
@@ -580,7 +576,10 @@ class KnowledgeGraphBuilder:
         result = GraphQueryResult(query=query)
         
         try:
-            # Filter nodes
+            # Filter nodes; the content pattern is lowercased once per query
+            content_pattern = (
+                query.node_content_pattern.lower() if query.node_content_pattern else None
+            )
             filtered_nodes = []
             for node in graph.nodes.values():
                 # Check node type filter
@@ -596,10 +595,9 @@ class KnowledgeGraphBuilder:
                     continue
                 
                 # Check content pattern
-                if query.node_content_pattern:
-                    pattern = query.node_content_pattern.lower()
-                    if (pattern not in node.title_pattern.lower() and 
-                        pattern not in node.description_pattern.lower()):
+                if content_pattern:
+                    if (content_pattern not in node.title_pattern.lower() and 
+                        content_pattern not in node.description_pattern.lower()):
                         continue
                 
                 filtered_nodes.append(node)
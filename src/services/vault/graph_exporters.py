@@ -11,6 +11,13 @@ from typing import Dict, List, Optional, Any, Set
 from pathlib import Path
 from decimal import Decimal
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 from .graph_models import (
     KnowledgeGraph, GraphNode, GraphEdge,
     NodeType, EdgeType
@@ -364,7 +371,12 @@ class JSONExporter(GraphExporter):
             self._stats['edges_exported'] += len(graph.edges)
             self._stats['total_export_time_ms'] += (time.time() - start_time) * 1000
             
-            # Convert to JSON
+            # Convert to JSON, using orjson when available
+            if ORJSON_AVAILABLE:
+                option = orjson.OPT_NON_STR_KEYS
+                if pretty_print:
+                    option |= orjson.OPT_INDENT_2
+                return orjson.dumps(data, default=str, option=option).decode()
             if pretty_print:
                 return json.dumps(data, indent=2, default=str)
             else:
@@ -6,7 +6,7 @@ from memories, code analysis, and intent connections.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Any, Set, Tuple
 from enum import Enum
 from uuid import UUID, uuid4
 from datetime import datetime
@@ -236,6 +236,16 @@ class KnowledgeGraph:
     min_safety_score: Decimal = Decimal("1.0")
     validation_coverage: float = 1.0  # Percentage of validated nodes/edges
     
+    # Undirected incidence index for traversals, rebuilt lazily after changes
+    _incident_edges: Optional[Dict[UUID, List[Tuple[UUID, GraphEdge]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # Metrics from the last calculate_metrics call, cleared on changes
+    _cached_metrics: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def add_node(self, node: GraphNode) -> None:
         """Add a node to the graph."""
         if not node.is_safe_for_export():
@@ -254,6 +264,8 @@ class KnowledgeGraph:
         
         self.node_count += 1
         self.updated_at = datetime.now()
+        self._incident_edges = None
+        self._cached_metrics = None
     
     def add_edge(self, edge: GraphEdge) -> None:
         """Add an edge to the graph."""
@@ -289,6 +301,8 @@ class KnowledgeGraph:
         
         self.edge_count += 1
         self.updated_at = datetime.now()
+        self._incident_edges = None
+        self._cached_metrics = None
     
     def get_neighbors(self, node_id: UUID) -> List[Tuple[UUID, GraphEdge]]:
         """Get all neighboring nodes and connecting edges."""
@@ -309,6 +323,59 @@ class KnowledgeGraph:
         
         return neighbors
     
+    def get_incident_edges(self, node_id: UUID) -> List[Tuple[UUID, GraphEdge]]:
+        """
+        Get every edge touching a node, paired with the node at its other end.
+        
+        Edges are listed for both endpoints regardless of direction. The
+        index is built in one pass over the edges on first use and reused
+        until the graph changes, so traversals visit only a node's own edges.
+        """
+        if self._incident_edges is None:
+            index: Dict[UUID, List[Tuple[UUID, GraphEdge]]] = {}
+            for edge in self.edges.values():
+                index.setdefault(edge.source_node_id, []).append((edge.target_node_id, edge))
+                if edge.target_node_id != edge.source_node_id:
+                    index.setdefault(edge.target_node_id, []).append((edge.source_node_id, edge))
+            self._incident_edges = index
+        return self._incident_edges.get(node_id, [])
+    
+    def subgraph(
+        self,
+        nodes: Iterable[GraphNode],
+        edges: Iterable[GraphEdge],
+        name: Optional[str] = None,
+        description: Optional[str] = None
+    ) -> "KnowledgeGraph":
+        """
+        Create a graph over a subset of this graph's nodes and edges.
+        
+        The elements were validated when they were added to this graph, so
+        they are indexed in bulk rather than through add_node/add_edge, and
+        the shared nodes' degree counters are left unchanged. Every edge
+        must connect two of the given nodes.
+        """
+        subgraph = KnowledgeGraph(
+            name=name or f"{self.name}_subgraph",
+            description=description or f"Subgraph of {self.name}"
+        )
+        
+        for node in nodes:
+            subgraph.nodes[node.node_id] = node
+            subgraph.node_type_index.setdefault(node.node_type, set()).add(node.node_id)
+            subgraph.adjacency_list.setdefault(node.node_id, {})
+        
+        for edge in edges:
+            subgraph.edges[edge.edge_id] = edge
+            subgraph.edge_type_index.setdefault(edge.edge_type, set()).add(edge.edge_id)
+            subgraph.adjacency_list[edge.source_node_id][edge.target_node_id] = edge.edge_id
+            if edge.is_bidirectional:
+                subgraph.adjacency_list[edge.target_node_id][edge.source_node_id] = edge.edge_id
+        
+        subgraph.node_count = len(subgraph.nodes)
+        subgraph.edge_count = len(subgraph.edges)
+        return subgraph
+    
     def get_nodes_by_type(self, node_type: NodeType) -> List[GraphNode]:
         """Get all nodes of a specific type."""
         node_ids = self.node_type_index.get(node_type, set())
@@ -321,13 +388,21 @@ class KnowledgeGraph:
     
     def calculate_metrics(self) -> Dict[str, Any]:
         """Calculate graph metrics and statistics."""
+        if self._cached_metrics is not None:
+            return dict(self._cached_metrics)
+        
         if not self.nodes:
             return {
                 'node_count': 0,
                 'edge_count': 0,
                 'average_degree': 0,
                 'density': 0,
-                'connected_components': 0
+                'connected_components': 0,
+                'average_safety_score': 1.0,
+                'min_safety_score': 1.0,
+                'validation_coverage': 1.0,
+                'node_types': {},
+                'edge_types': {}
             }
         
         total_degree = sum(node.in_degree + node.out_degree for node in self.nodes.values())
@@ -354,7 +429,7 @@ class KnowledgeGraph:
         total_items = len(self.nodes) + len(self.edges)
         self.validation_coverage = validated_items / total_items if total_items > 0 else 1.0
         
-        return {
+        self._cached_metrics = {
             'node_count': self.node_count,
             'edge_count': self.edge_count,
             'average_degree': average_degree,
@@ -365,6 +440,7 @@ class KnowledgeGraph:
             'node_types': {nt.value: len(nodes) for nt, nodes in self.node_type_index.items()},
             'edge_types': {et.value: len(edges) for et, edges in self.edge_type_index.items()}
         }
+        return dict(self._cached_metrics)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert graph to dictionary for serialization."""
@@ -310,13 +310,9 @@ class VaultSyncEngine:
         """Get memories to sync based on criteria."""
         try:
             if memory_ids:
-                # Get specific memories
-                memories = []
-                for memory_id in memory_ids:
-                    memory = await self.memory_repository.get_memory(memory_id)
-                    if memory:
-                        memories.append(memory)
-                return memories
+                # Get specific memories in one query, keeping request order
+                found = await self.memory_repository.get_memories_by_ids(memory_ids)
+                return [found[memory_id] for memory_id in memory_ids if memory_id in found]
             else:
                 # Get recent memories
                 limit = min(max_memories or 100, self.config.batch_size)
@@ -401,9 +397,11 @@ class VaultSyncEngine:
             if not note.file_path:
                 note.file_path = self.config.vault_path / note.get_filename()
             
-            # Write markdown content
+            # Write markdown content off the event loop
             markdown_content = note.get_full_markdown()
-            note.file_path.write_text(markdown_content, encoding='utf-8')
+            await asyncio.to_thread(
+                note.file_path.write_text, markdown_content, encoding='utf-8'
+            )
             
             logger.debug(f"Written note to {note.file_path}")
             return True
@@ -435,15 +433,18 @@ class VaultSyncEngine:
     async def _parse_markdown_file(self, file_path: Path) -> Optional[MarkdownNote]:
         """Parse markdown file into note structure."""
         try:
-            content = file_path.read_text(encoding='utf-8')
+            # Read content and timestamps off the event loop
+            content, file_stat = await asyncio.to_thread(
+                lambda: (file_path.read_text(encoding='utf-8'), file_path.stat())
+            )
             
             # Basic parsing - in full implementation would use proper markdown parser
             note = MarkdownNote(
                 title_pattern=f"<imported_note_{file_path.stem}>",
                 content=content,
                 file_path=file_path,
-                created_at=datetime.fromtimestamp(file_path.stat().st_ctime),
-                updated_at=datetime.fromtimestamp(file_path.stat().st_mtime)
+                created_at=datetime.fromtimestamp(file_stat.st_ctime),
+                updated_at=datetime.fromtimestamp(file_stat.st_mtime)
             )
             
             return note
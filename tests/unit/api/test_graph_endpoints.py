@@ -4,6 +4,8 @@ Tests for knowledge graph API endpoints.
 This module tests the graph building, querying, and export functionality.
 """
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from uuid import uuid4
@@ -19,7 +21,13 @@ from src.api.models.graph import (
     GraphExportResult,
     SubgraphRequest
 )
-from src.services.vault.graph_models import KnowledgeGraph, NodeType, EdgeType
+from src.services.vault.graph_models import (
+    KnowledgeGraph,
+    GraphNode as InternalGraphNode,
+    GraphEdge as InternalGraphEdge,
+    NodeType,
+    EdgeType
+)
 
 
 class TestGraphEndpoints:
@@ -431,4 +439,93 @@ class TestGraphModels:
         assert metrics.node_count == 25
         assert metrics.edge_count == 45
         assert metrics.density == 0.15
-        assert metrics.average_safety_score == Decimal("0.92")
\ No newline at end of file
+        assert metrics.average_safety_score == Decimal("0.92")
+
+
+class TestInMemoryGraphEndpoints:
+    """Test graph endpoints against in-memory graphs."""
+    
+    @pytest.fixture
+    def hub_graph(self):
+        """Hub node linked to a chain of leaves, each leaf linked to the next."""
+        graph = KnowledgeGraph(name="Hub Graph", description="Hub and chain")
+        nodes = [
+            InternalGraphNode(
+                node_type=NodeType.MEMORY,
+                title_pattern=f"<node_{i}>",
+                description_pattern="<description>",
+                safety_score=Decimal("0.9"),
+                is_validated=True
+            )
+            for i in range(40)
+        ]
+        for node in nodes:
+            graph.add_node(node)
+        
+        hub, leaves = nodes[0], nodes[1:]
+        pairs = [(hub, leaf) for leaf in leaves] + list(zip(leaves, leaves[1:]))
+        for source, target in pairs:
+            graph.add_edge(InternalGraphEdge(
+                source_node_id=source.node_id,
+                target_node_id=target.node_id,
+                edge_type=EdgeType.RELATED_TO,
+                weight=0.8,
+                safety_score=Decimal("0.9"),
+                is_validated=True
+            ))
+        return graph, hub
+    
+    async def _extract(self, graph, hub, max_nodes):
+        from src.api.routers import graph as graph_router
+        
+        subgraph_request = SubgraphRequest(
+            center_node_id=str(hub.node_id),
+            max_depth=2,
+            max_nodes=max_nodes
+        )
+        with patch.dict(graph_router._graph_storage, {str(graph.graph_id): graph}):
+            response = await graph_router.get_subgraph(
+                str(graph.graph_id), subgraph_request, {"sub": "user123"}
+            )
+        return json.loads(response.body)
+    
+    @pytest.mark.asyncio
+    async def test_truncated_subgraph_edges_stay_within_nodes(self, hub_graph):
+        """Test edges to queued nodes cut by max_nodes are not returned."""
+        graph, hub = hub_graph
+        
+        result = await self._extract(graph, hub, max_nodes=10)
+        
+        node_ids = {node["node_id"] for node in result["nodes"]}
+        assert len(node_ids) == 10
+        assert result["edges"]
+        for edge in result["edges"]:
+            assert edge["source_node_id"] in node_ids
+            assert edge["target_node_id"] in node_ids
+    
+    @pytest.mark.asyncio
+    async def test_full_subgraph_includes_every_edge_once(self, hub_graph):
+        """Test an untruncated subgraph returns each internal edge once."""
+        graph, hub = hub_graph
+        
+        result = await self._extract(graph, hub, max_nodes=100)
+        
+        edge_ids = [edge["edge_id"] for edge in result["edges"]]
+        assert len(result["nodes"]) == len(graph.nodes)
+        assert sorted(edge_ids) == sorted(str(edge_id) for edge_id in graph.edges)
+    
+    @pytest.mark.asyncio
+    async def test_list_graphs_includes_empty_graph(self):
+        """Test a graph built with no nodes does not break the listing."""
+        from src.api.routers import graph as graph_router
+        
+        graph = KnowledgeGraph(name="Empty Graph", description="No memories matched")
+        
+        with patch.dict(graph_router._graph_storage, {str(graph.graph_id): graph}, clear=True), \
+                patch.object(graph_router, "_graph_list_cache", None):
+            response = await graph_router.list_graphs({"sub": "user123"})
+        
+        result = json.loads(response.body)
+        assert result["total_count"] == 1
+        assert result["graphs"][0]["node_count"] == 0
+        assert result["graphs"][0]["average_safety_score"] == 1.0
@@ -360,8 +360,9 @@ class TestIntegrationModels:
     
     def test_vault_sync_response_model(self):
         """Test VaultSyncResponse model validation."""
+        sync_id = str(uuid4())
         response = VaultSyncResponse(
-            sync_id=uuid4(),
+            sync_id=sync_id,
             success=True,
             sync_direction=SyncDirection.MEMORIES_TO_VAULT,
             notes_processed=25,
@@ -371,17 +372,18 @@ class TestIntegrationModels:
             conflicts_detected=2,
             conflicts_resolved=2,
             safety_violations=0,
-            average_safety_score=Decimal("0.94"),
+            average_safety_score=0.94,
             processing_time_ms=2500
         )
         
+        assert response.sync_id == sync_id
         assert response.success is True
         assert response.sync_direction == SyncDirection.MEMORIES_TO_VAULT
         assert response.notes_processed == 25
-        assert response.average_safety_score == Decimal("0.94")
+        assert response.average_safety_score == 0.94
     
     def test_documentation_file_model(self):
-        """Test DocumentationFile model validation."""
+        """Test DocumentationFile typed dict construction."""
         from src.api.models.integration import DocumentationFile
         
         doc_file = DocumentationFile(
@@ -392,13 +394,13 @@ class TestIntegrationModels:
             safety_validated=True
         )
         
-        assert doc_file.file_path == "./docs/README.md"
-        assert doc_file.doc_type == "readme"
-        assert doc_file.size_bytes == 5432
-        assert doc_file.safety_validated is True
+        assert doc_file["file_path"] == "./docs/README.md"
+        assert doc_file["doc_type"] == "readme"
+        assert doc_file["size_bytes"] == 5432
+        assert doc_file["safety_validated"] is True
     
     def test_integration_status_model(self):
-        """Test IntegrationStatus model validation."""
+        """Test IntegrationStatus typed dict construction."""
         from src.api.models.integration import IntegrationStatus
         
         status = IntegrationStatus(
@@ -409,13 +411,13 @@ class TestIntegrationModels:
             metadata={"version": "1.0.0"}
         )
         
-        assert status.service_name == "vault_sync"
-        assert status.status == "healthy"
-        assert status.response_time_ms == 125.5
-        assert status.metadata["version"] == "1.0.0"
+        assert status["service_name"] == "vault_sync"
+        assert status["status"] == "healthy"
+        assert status["response_time_ms"] == 125.5
+        assert status["metadata"]["version"] == "1.0.0"
     
     def test_background_task_status_model(self):
-        """Test BackgroundTaskStatus model validation."""
+        """Test BackgroundTaskStatus typed dict construction."""
         task_status = BackgroundTaskStatus(
             task_id=uuid4(),
             task_type="vault_sync",
@@ -424,11 +426,11 @@ class TestIntegrationModels:
             started_at=datetime.now()
         )
         
-        assert task_status.task_type == "vault_sync"
-        assert task_status.status == "running"
-        assert task_status.progress_percentage == 65.0
-        assert task_status.result is None
-        assert task_status.error_message is None
+        assert task_status["task_type"] == "vault_sync"
+        assert task_status["status"] == "running"
+        assert task_status["progress_percentage"] == 65.0
+        assert "result" not in task_status
+        assert "error_message" not in task_status
 
 
 class TestIntegrationValidation:
@@ -112,12 +112,12 @@ class TestMemoryEndpoints:
         search = MemorySearch(
             query="test search",
             memory_types=["learning", "decision"],
-            min_safety_score=Decimal("0.8"),
+            min_safety_score=0.8,
             limit=10,
         )
         
         assert search.query == "test search"
         assert MemoryType.LEARNING in search.memory_types
         assert MemoryType.DECISION in search.memory_types
-        assert search.min_safety_score == Decimal("0.8")
+        assert search.min_safety_score == 0.8
         assert search.limit == 10
\ No newline at end of file
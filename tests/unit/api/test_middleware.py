@@ -0,0 +1,203 @@
+"""
+Tests for API middleware helpers.
+
+This module tests the request logging helpers used by the middleware stack.
+"""
+
+import gzip
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.api.middleware.logging import LoggingMiddleware, _abstract_ip_address
+from src.api.middleware.safety import SafetyMiddleware
+
+
+class TestLoggingMiddleware:
+    """Test logging middleware helpers."""
+
+    @pytest.fixture
+    def middleware(self):
+        """Create logging middleware with a stub abstraction engine."""
+        engine = MagicMock()
+        engine.abstract.side_effect = lambda content: MagicMock(
+            abstracted_content=content.replace("secret", "<redacted>")
+        )
+        return LoggingMiddleware(MagicMock(), abstraction_engine=engine)
+
+    def test_abstract_ipv4_keeps_two_octets(self):
+        """Test IPv4 addresses keep only their first two octets."""
+        assert _abstract_ip_address("192.168.10.20") == "192.168.***.***"
+
+    def test_abstract_ipv6_keeps_routing_prefix(self):
+        """Test IPv6 addresses keep only their /48 prefix."""
+        abstracted = _abstract_ip_address("2001:db8:abcd:12::1")
+
+        assert abstracted.startswith("2001:0db8:abcd:")
+        assert "0012" not in abstracted
+
+    def test_abstract_invalid_ip_is_redacted(self):
+        """Test non-IP client hosts are fully redacted."""
+        assert _abstract_ip_address("testclient") == "***REDACTED***"
+
+    def test_filter_headers_redacts_sensitive_values(self, middleware):
+        """Test sensitive headers are redacted regardless of case."""
+        filtered = middleware._filter_headers({
+            "Authorization": "Bearer token",
+            "Content-Type": "application/json",
+        })
+
+        assert filtered["Authorization"] == "***REDACTED***"
+        assert filtered["Content-Type"] == "application/json"
+
+    def test_abstract_dict_uses_single_engine_call(self, middleware):
+        """Test string values are abstracted in one batched engine call."""
+        abstracted = middleware._abstract_dict({
+            "q": "my secret",
+            "page": 2,
+            "sort": "name",
+        })
+
+        assert abstracted == {"q": "my <redacted>", "page": 2, "sort": "name"}
+        assert middleware.abstraction_engine.abstract.call_count == 1
+
+
+def _abstract(content):
+    """Stub abstraction: home paths become placeholders, UNSAFE fails."""
+    is_safe = "UNSAFE" not in content
+    return MagicMock(
+        abstracted_content=content.replace("/home/user", "<path>"),
+        is_safe=is_safe,
+        validation=MagicMock(safety_score=1.0 if is_safe else 0.1),
+    )
+
+
+def _streaming_app(chunks, media_type=b"application/x-ndjson", extra_headers=()):
+    """ASGI app that streams the given body chunks."""
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", media_type), *extra_headers],
+        })
+        for index, chunk in enumerate(chunks):
+            await send({
+                "type": "http.response.body",
+                "body": chunk,
+                "more_body": index < len(chunks) - 1,
+            })
+    return app
+
+
+async def _call(middleware):
+    """Send a GET through the middleware and collect the messages it emits."""
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    await middleware({"type": "http", "method": "GET", "path": "/stream", "headers": []}, receive, send)
+    start = sent[0]
+    body = b"".join(message.get("body", b"") for message in sent[1:])
+    return start, body, sent
+
+
+class TestSafetyMiddleware:
+    """Test safety middleware routing and streamed response validation."""
+
+    @pytest.fixture
+    def engine(self):
+        """Create a stub abstraction engine."""
+        engine = MagicMock()
+        engine.abstract.side_effect = _abstract
+        return engine
+
+    @pytest.fixture
+    def middleware(self, engine):
+        """Create safety middleware with stub engine and validator."""
+        return SafetyMiddleware(
+            MagicMock(),
+            abstraction_engine=engine,
+            safety_validator=MagicMock(),
+        )
+
+    def _wrap(self, engine, app):
+        return SafetyMiddleware(app, abstraction_engine=engine, safety_validator=MagicMock())
+
+    @pytest.mark.parametrize("path", ["/docs", "/docs/oauth2-redirect", "/health", "/openapi.json"])
+    def test_excluded_paths_skip_validation(self, middleware, path):
+        """Test excluded prefixes match themselves and nested paths."""
+        assert middleware._is_excluded(path)
+
+    @pytest.mark.parametrize("path", ["/docsX", "/documents/1", "/healthz", "/api/v1/docs"])
+    def test_lookalike_paths_are_validated(self, middleware, path):
+        """Test prefix matching stops at path segment boundaries."""
+        assert not middleware._is_excluded(path)
+
+    @pytest.mark.asyncio
+    async def test_ndjson_first_batch_failure_returns_500(self, engine):
+        """Test an unsafe first batch is replaced by an error response."""
+        app = _streaming_app([b'{"p": "UNSAFE"}\n', b'{"p": "later"}\n'])
+
+        start, body, _ = await _call(self._wrap(engine, app))
+
+        assert start["status"] == 500
+        assert b"SAFETY_VALIDATION_FAILED" in body
+        assert b"later" not in body
+
+    @pytest.mark.asyncio
+    async def test_ndjson_lines_split_across_chunks(self, engine):
+        """Test lines split across chunks are validated once complete."""
+        app = _streaming_app([
+            b'{"p": "/home/user/a"}\n{"p": ',
+            b'"/home/user/b"}\n',
+            b"",
+        ])
+
+        start, body, sent = await _call(self._wrap(engine, app))
+
+        assert start["status"] == 200
+        assert b"content-length" not in dict(start["headers"])
+        assert body == b'{"p": "<path>/a"}\n{"p": "<path>/b"}\n'
+        assert sent[-1]["more_body"] is False
+
+    @pytest.mark.asyncio
+    async def test_single_chunk_ndjson_is_buffered(self, engine):
+        """Test a single-chunk NDJSON body gets an exact content length."""
+        app = _streaming_app([b'{"p": "/home/user"}\n'])
+
+        start, body, _ = await _call(self._wrap(engine, app))
+
+        assert body == b'{"p": "<path>"}\n'
+        assert dict(start["headers"])[b"content-length"] == str(len(body)).encode()
+
+    @pytest.mark.asyncio
+    async def test_ndjson_failure_after_headers_ends_with_error_line(self, engine):
+        """Test a later unsafe batch ends the stream with an error line."""
+        app = _streaming_app([b'{"p": "fine"}\n', b'{"p": "UNSAFE"}\n', b'{"p": "never"}\n'])
+
+        start, body, sent = await _call(self._wrap(engine, app))
+
+        assert start["status"] == 200
+        first_line, error_line = body.splitlines()
+        assert first_line == b'{"p": "fine"}'
+        assert b"SAFETY_VALIDATION_FAILED" in error_line
+        assert sent[-1]["more_body"] is False
+
+    @pytest.mark.asyncio
+    async def test_gzipped_ndjson_uses_buffered_path(self, engine):
+        """Test compressed NDJSON is validated whole after decompression."""
+        compressed = gzip.compress(b'{"p": "/home/user"}\n{"p": "ok"}\n')
+        app = _streaming_app(
+            [compressed[:10], compressed[10:]],
+            extra_headers=[(b"content-encoding", b"gzip")],
+        )
+
+        start, body, sent = await _call(self._wrap(engine, app))
+
+        assert len(sent) == 2
+        assert dict(start["headers"])[b"content-encoding"] == b"gzip"
+        assert gzip.decompress(body) == b'{"p": "<path>"}\n{"p": "ok"}\n'
@@ -160,6 +160,68 @@ class TestGraphModels:
         assert metrics['node_count'] == 2
         assert metrics['edge_count'] == 1
         assert metrics['average_degree'] == 1.0
+    
+    def test_incident_edges_index(self):
+        """Test incident edge lookup covers both endpoints and tracks changes."""
+        graph = KnowledgeGraph()
+        nodes = [
+            GraphNode(node_type=NodeType.MEMORY, title_pattern=f"<memory_{i}>", is_validated=True)
+            for i in range(3)
+        ]
+        for node in nodes:
+            graph.add_node(node)
+        
+        edge = GraphEdge(
+            source_node_id=nodes[0].node_id,
+            target_node_id=nodes[1].node_id,
+            edge_type=EdgeType.EXPLAINS,
+            weight=0.8
+        )
+        graph.add_edge(edge)
+        
+        assert graph.get_incident_edges(nodes[0].node_id) == [(nodes[1].node_id, edge)]
+        assert graph.get_incident_edges(nodes[1].node_id) == [(nodes[0].node_id, edge)]
+        assert graph.get_incident_edges(nodes[2].node_id) == []
+        
+        # Adding an edge invalidates the cached index
+        edge2 = GraphEdge(
+            source_node_id=nodes[2].node_id,
+            target_node_id=nodes[1].node_id,
+            edge_type=EdgeType.EXPLAINS,
+            weight=0.5
+        )
+        graph.add_edge(edge2)
+        
+        assert len(graph.get_incident_edges(nodes[1].node_id)) == 2
+        assert graph.get_incident_edges(nodes[2].node_id) == [(nodes[1].node_id, edge2)]
+    
+    def test_subgraph_shares_elements_without_changing_degrees(self):
+        """Test subgraph indexes a subset without touching node degrees."""
+        graph = KnowledgeGraph(name="full")
+        nodes = [
+            GraphNode(node_type=NodeType.MEMORY, title_pattern=f"<memory_{i}>", is_validated=True)
+            for i in range(3)
+        ]
+        for node in nodes:
+            graph.add_node(node)
+        
+        edge = GraphEdge(
+            source_node_id=nodes[0].node_id,
+            target_node_id=nodes[1].node_id,
+            edge_type=EdgeType.EXPLAINS,
+            weight=0.8
+        )
+        graph.add_edge(edge)
+        
+        subgraph = graph.subgraph(nodes[:2], [edge])
+        
+        assert subgraph.name == "full_subgraph"
+        assert subgraph.node_count == 2
+        assert subgraph.edge_count == 1
+        assert subgraph.nodes[nodes[0].node_id] is nodes[0]
+        assert subgraph.adjacency_list[nodes[0].node_id] == {nodes[1].node_id: edge.edge_id}
+        assert nodes[0].out_degree == 1
+        assert nodes[1].in_degree == 1
 
 
 class TestKnowledgeGraphBuilder:
@@ -183,7 +245,10 @@ class TestKnowledgeGraphBuilder:
             memory.created_at = datetime.now() - timedelta(hours=i)
             test_memories.append(memory)
         
-        repo.get_memory = AsyncMock(side_effect=lambda id: test_memories[0])
+        memories_by_id = {m.memory_id: m for m in test_memories}
+        repo.get_memories_by_ids = AsyncMock(side_effect=lambda ids: {
+            memory_id: memories_by_id[memory_id] for memory_id in ids if memory_id in memories_by_id
+        })
         repo.search_with_clustering = AsyncMock(return_value=[
             {'memory_id': m.memory_id} for m in test_memories
         ])
@@ -625,7 +690,9 @@ class TestPerformance:
         repo.search_with_clustering = AsyncMock(return_value=[
             {'memory_id': m.memory_id} for m in memories
         ])
-        repo.get_memory = AsyncMock(side_effect=lambda id: memories[0])
+        repo.get_memories_by_ids = AsyncMock(side_effect=lambda ids: {
+            m.memory_id: m for m in memories if m.memory_id in ids
+        })
         
         # Create builder without embedding service for speed
         builder = KnowledgeGraphBuilder(
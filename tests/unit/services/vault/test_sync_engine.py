@@ -48,7 +48,7 @@ class TestVaultSyncEngine:
     def mock_memory_repository(self):
         """Create mock memory repository."""
         repository = Mock()
-        repository.get_memory = AsyncMock()
+        repository.get_memories_by_ids = AsyncMock(return_value={})
         repository.get_recent_memories = AsyncMock()
         return repository
     